@@ -406,6 +406,21 @@ def catalyst_magic(line, cell=None):
     help='Simulating orders enable the paper trading mode. No orders will be '
          'sent to the exchange unless set to false.',
 )
+@click.option(
+    '--missed-bars',
+    type=click.Choice(['skip', 'catch_up']),
+    default='skip',
+    show_default=True,
+    help='Skip the bars missed while the algorithm was busy or run each of '
+         'them late.',
+)
+@click.option(
+    '--prefetch-seconds',
+    type=float,
+    default=None,
+    help='Fetch the market data of each bar this number of seconds before '
+         'the bar.',
+)
 @click.pass_context
 def live(ctx,
          algofile,
@@ -419,7 +434,9 @@ def live(ctx,
          algo_namespace,
          base_currency,
          live_graph,
-         simulate_orders):
+         simulate_orders,
+         missed_bars,
+         prefetch_seconds):
     """Trade live with the given algorithm.
     """
     if (algotext is not None) == (algofile is not None):
@@ -472,6 +489,8 @@ def live(ctx,
         live_graph=live_graph,
         simulate_orders=simulate_orders,
         stats_output=None,
+        missed_bars=missed_bars,
+        prefetch_seconds=prefetch_seconds,
     )
 
     if output == '-':
@@ -529,6 +548,13 @@ def live(ctx,
          'end, include-symbols and exclude-symbols will be ignored. Instead,'
          'all data in the file will be ingested.',
 )
+@click.option(
+    '--csv-chunksize',
+    type=int,
+    default=None,
+    help='Stream the CSV file by chunks of this number of rows to bound '
+         'the memory usage. The rows of each symbol must be sorted by date.',
+)
 @click.option(
     '--show-progress/--no-show-progress',
     default=True,
@@ -544,10 +570,27 @@ def live(ctx,
     default=False,
     help='Report potential anomalies found in data bundles.'
 )
+@click.option(
+    '--bundle-format',
+    type=click.Choice({'bcolz', 'sparse', 'mmap'}),
+    default='bcolz',
+    show_default=True,
+    help='The storage format of new bundles. Existing bundles keep their '
+         'format, see migrate-exchange.',
+)
+@click.option(
+    '-j',
+    '--jobs',
+    type=int,
+    default=1,
+    show_default=True,
+    help='The number of parallel workers downloading and decoding bundle '
+         'chunks.',
+)
 @click.pass_context
 def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
-                    include_symbols, exclude_symbols, csv, show_progress,
-                    verbose, validate):
+                    include_symbols, exclude_symbols, csv, csv_chunksize,
+                    show_progress, verbose, validate, bundle_format, jobs):
     """
     Ingest data for the given exchange.
     """
@@ -555,7 +598,7 @@ def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
     if exchange_name is None:
         ctx.fail("must specify an exchange name '-x'")
 
-    exchange_bundle = ExchangeBundle(exchange_name)
+    exchange_bundle = ExchangeBundle(exchange_name, bundle_format)
 
     click.echo('Ingesting exchange bundle {}...'.format(exchange_name))
     exchange_bundle.ingest(
@@ -567,10 +610,58 @@ def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
         show_progress=show_progress,
         show_breakdown=verbose,
         show_report=validate,
-        csv=csv
+        csv=csv,
+        csv_chunksize=csv_chunksize,
+        jobs=jobs
     )
 
 
+@main.command(name='migrate-exchange')
+@click.option(
+    '-x',
+    '--exchange-name',
+    help='The name of the exchange bundle to migrate.',
+)
+@click.option(
+    '-f',
+    '--data-frequency',
+    type=click.Choice({'daily', 'minute'}),
+    default='minute',
+    show_default=True,
+    help='The data frequency of the bundle to migrate.',
+)
+@click.option(
+    '--bundle-format',
+    type=click.Choice({'bcolz', 'sparse', 'mmap'}),
+    default='sparse',
+    show_default=True,
+    help='The storage format of the migrated bundle.',
+)
+@click.option(
+    '--show-progress/--no-show-progress',
+    default=True,
+    help='Print progress information to the terminal.'
+)
+@click.pass_context
+def migrate_exchange(ctx, exchange_name, data_frequency, bundle_format,
+                     show_progress):
+    """
+    Convert an exchange bundle to another storage format.
+    """
+    if exchange_name is None:
+        ctx.fail("must specify an exchange name '-x'")
+
+    exchange_bundle = ExchangeBundle(exchange_name)
+
+    click.echo('Migrating exchange bundle {}...'.format(exchange_name))
+    exchange_bundle.migrate(
+        data_frequency=data_frequency,
+        bundle_format=bundle_format,
+        show_progress=show_progress,
+    )
+    click.echo('Done')
+
+
 @main.command(name='clean-algo')
 @click.option(
     '-n',
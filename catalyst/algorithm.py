@@ -196,6 +196,8 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    pipeline_result_cache : PipelineResultCache, optional
+        The disk cache of the pipeline results reused across runs.
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -309,6 +311,7 @@ class TradingAlgorithm(object):
         self.init_engine(
             kwargs.pop('get_pipeline_loader', None),
             self.sim_params.data_frequency,
+            kwargs.pop('pipeline_result_cache', None),
         )
         self._pipelines = {}
         # Create an always-expired cache so that we compute the first time data
@@ -423,7 +426,7 @@ class TradingAlgorithm(object):
 
         self.restrictions = NoRestrictions()
 
-    def init_engine(self, get_loader, data_frequency):
+    def init_engine(self, get_loader, data_frequency, result_cache=None):
         """
         Construct and store a PipelineEngine from loader.
 
@@ -444,6 +447,7 @@ class TradingAlgorithm(object):
                 get_loader,
                 all_dates,
                 self.asset_finder,
+                result_cache=result_cache,
             )
         else:
             self.engine = ExplodingPipelineEngine()
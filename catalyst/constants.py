@@ -16,3 +16,16 @@ DATE_TIME_FORMAT = '%Y-%m-%d %H:%M'
 DATE_FORMAT = '%Y-%m-%d'
 
 AUTO_INGEST = False
+
+''' Live algorithms sharing the same exchange API key can share one
+    request budget by storing the rate limits in the exchange folder:
+    $ export CATALYST_RATE_LIMIT_BACKEND=file
+'''
+RATE_LIMIT_BACKEND = os.environ.get('CATALYST_RATE_LIMIT_BACKEND', 'memory')
+
+''' The maximum size in bytes of the local cache of downloaded bundle chunks,
+    the least recently used chunks are evicted first.
+'''
+CHUNK_CACHE_SIZE = int(
+    os.environ.get('CATALYST_CHUNK_CACHE_SIZE', 5 * 1024 ** 3)
+)
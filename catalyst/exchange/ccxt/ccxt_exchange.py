@@ -1,7 +1,9 @@
 import json
 import os
 import re
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
+from multiprocessing.pool import ThreadPool
 
 import ccxt
 import pandas as pd
@@ -12,7 +14,7 @@ from logbook import Logger
 from six import string_types
 
 from catalyst.algorithm import MarketOrder
-from catalyst.constants import LOG_LEVEL
+from catalyst.constants import LOG_LEVEL, RATE_LIMIT_BACKEND
 from catalyst.exchange.exchange import Exchange
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.exchange_errors import InvalidHistoryFrequencyError, \
@@ -60,6 +62,8 @@ class CCXT(Exchange):
             raise ExchangeNotFoundError(exchange_name=exchange_name)
 
         self._symbol_maps = [None, None]
+        self._lower_symbol_maps = [None, None]
+        self._asset_index = None
 
         self.name = exchange_name
 
@@ -68,11 +72,19 @@ class CCXT(Exchange):
 
         self.num_candles_limit = 2000
         self.max_requests_per_minute = 60
+        self.max_concurrent_requests = 4
+        # Requests per minute of specific endpoint classes
+        self.endpoint_limits = dict()
+        self.rate_limit_backend = RATE_LIMIT_BACKEND
+        self.rate_limiter = None
+        # The cost of bulk requests in units of the rate limit
+        self.request_weights = dict(fetch_tickers=4)
         self.low_balance_threshold = 0.1
-        self.request_cpt = dict()
+        self._request_lock = threading.Lock()
 
         self.bundle = ExchangeBundle(self.name)
         self.markets = None
+        self.snapshot = None
         self._is_init = False
 
     def init(self):
@@ -94,6 +106,7 @@ class CCXT(Exchange):
 
         if self.markets is None:
             try:
+                self.ask_request()
                 markets_symbols = self.api.load_markets()
                 log.debug(
                     'fetching {} markets:\n{}'.format(
@@ -101,6 +114,7 @@ class CCXT(Exchange):
                     )
                 )
 
+                self.ask_request()
                 self.markets = self.api.fetch_markets()
                 with open(filename, 'w+') as f:
                     json.dump(self.markets, f, indent=4)
@@ -162,6 +176,7 @@ class CCXT(Exchange):
     def account(self):
         return None
 
+    @property
     def time_skew(self):
         return None
 
@@ -362,6 +377,45 @@ class CCXT(Exchange):
             timeframe, source='ccxt', raise_error=raise_error
         )
 
+    def map_requests(self, func, items, endpoint='public'):
+        """
+        Apply the request function to each item, running up to
+        `max_concurrent_requests` requests at the same time.
+
+        Each request asks permission first so that concurrent requests
+        stay within `max_requests_per_minute`.
+
+        Parameters
+        ----------
+        func: callable
+            Issues a single request for an item.
+        items: list
+        endpoint: str
+            The endpoint limits applied to the requests.
+
+        Returns
+        -------
+        list
+            The results in the order of the items.
+
+        """
+
+        def request(item):
+            self.ask_request(endpoint)
+            return func(item)
+
+        processes = min(self.max_concurrent_requests, len(items))
+        if processes <= 1:
+            return [request(item) for item in items]
+
+        pool = ThreadPool(processes=processes)
+        try:
+            return pool.map(request, items)
+
+        finally:
+            pool.terminate()
+            pool.join()
+
     def get_candles(self, freq, assets, bar_count=None, start_dt=None,
                     end_dt=None):
         is_single = (isinstance(assets, TradingPair))
@@ -376,16 +430,19 @@ class CCXT(Exchange):
             delta = start_dt - get_epoch()
             ms = int(delta.total_seconds()) * 1000
 
-        candles = dict()
-        for asset in assets:
-            ohlcvs = self.api.fetch_ohlcv(
-                symbol=symbols[0],
+        def fetch_ohlcv(symbol):
+            return self.api.fetch_ohlcv(
+                symbol=symbol,
                 timeframe=timeframe,
                 since=ms,
                 limit=bar_count,
                 params={}
             )
 
+        ohlcvs_list = self.map_requests(fetch_ohlcv, symbols)
+
+        candles = dict()
+        for asset, ohlcvs in zip(assets, ohlcvs_list):
             candles[asset] = []
             for ohlcv in ohlcvs:
                 candles[asset].append(dict(
@@ -411,6 +468,19 @@ class CCXT(Exchange):
         except ExchangeSymbolsNotFound:
             return None
 
+    def _fetch_lower_symbol_map(self, is_local):
+        index = 1 if is_local else 0
+        if self._lower_symbol_maps[index] is None:
+            symbol_map = self._fetch_symbol_map(is_local)
+            if symbol_map is None:
+                return None
+
+            self._lower_symbol_maps[index] = {
+                k.lower(): v for k, v in symbol_map.items()
+            }
+
+        return self._lower_symbol_maps[index]
+
     def get_asset_defs(self, market):
         """
         The local and Catalyst definitions of the specified market.
@@ -454,9 +524,8 @@ class CCXT(Exchange):
         """
         exchange_symbol = market['id']
 
-        symbol_map = self._fetch_symbol_map(is_local)
-        if symbol_map is not None:
-            assets_lower = {k.lower(): v for k, v in symbol_map.items()}
+        assets_lower = self._fetch_lower_symbol_map(is_local)
+        if assets_lower is not None:
             key = exchange_symbol.lower()
 
             asset = assets_lower[key] if key in assets_lower else None
@@ -524,6 +593,8 @@ class CCXT(Exchange):
     def load_assets(self):
         log.debug('loading assets for {}'.format(self.name))
         self.assets = []
+        self._asset_index = None
+        self._lower_symbol_maps = [None, None]
 
         for market in self.markets:
             if 'id' not in market:
@@ -550,9 +621,12 @@ class CCXT(Exchange):
                 asset = self.create_trading_pair(market=market)
                 self.assets.append(asset)
 
+        self.index_assets()
+
     def get_balances(self):
         try:
             log.debug('retrieving wallets balances')
+            self.ask_request('private')
             balances = self.api.fetch_balance()
 
             balances_lower = dict()
@@ -645,7 +719,13 @@ class CCXT(Exchange):
 
         limit_price = price if order_type == 'limit' else None
 
-        executed_price = order_status['cost'] / order_status['amount']
+        # The average price of the amount filled so far
+        cost = order_status['cost']
+        if cost is not None and order_status['filled']:
+            executed_price = cost / order_status['filled']
+
+        else:
+            executed_price = price
         commission = order_status['fee']
         date = from_ms_timestamp(order_status['timestamp'])
 
@@ -696,6 +776,7 @@ class CCXT(Exchange):
             adj_amount = abs(amount)
 
         try:
+            self.ask_request('private')
             result = self.api.create_order(
                 symbol=symbol,
                 type=order_type,
@@ -729,6 +810,7 @@ class CCXT(Exchange):
     def get_open_orders(self, asset):
         try:
             symbol = self.get_symbol(asset)
+            self.ask_request('private')
             result = self.api.fetch_open_orders(
                 symbol=symbol,
                 since=None,
@@ -755,6 +837,7 @@ class CCXT(Exchange):
         try:
             symbol = self.get_symbol(asset_or_symbol) \
                 if asset_or_symbol is not None else None
+            self.ask_request('private')
             order_status = self.api.fetch_order(id=order_id, symbol=symbol)
             order, executed_price = self._create_order(order_status)
 
@@ -763,6 +846,87 @@ class CCXT(Exchange):
 
         return order, executed_price
 
+    def get_orders(self, orders):
+        """
+        Lookup the state of several orders with the open and closed orders
+        of their markets, two requests per market instead of one request
+        per order.
+
+        Only the markets with at least two orders are listed. The orders
+        of the other markets, and the ones which are not listed or whose
+        market could not be listed, are requested one by one.
+
+        Parameters
+        ----------
+        orders: list[tuple[str, TradingPair]]
+
+        Returns
+        -------
+        dict[str, tuple[Order, float]]
+
+        """
+        order_ids = set(order_id for order_id, _ in orders)
+
+        results = dict()
+        if self.api.has.get('fetchOpenOrders') \
+                and self.api.has.get('fetchClosedOrders'):
+            symbol_orders = Counter(
+                self.get_symbol(asset) for _, asset in orders
+            )
+            symbols = sorted(
+                symbol for symbol, count in six.iteritems(symbol_orders)
+                if count > 1
+            )
+            requests = [
+                (method, symbol)
+                for symbol in symbols
+                for method in (self.api.fetch_open_orders,
+                               self.api.fetch_closed_orders)
+            ]
+
+            def fetch_orders(request):
+                method, symbol = request
+                try:
+                    return method(symbol=symbol)
+
+                except Exception as e:
+                    log.warn('unable to list the orders of {} {}: {}'.format(
+                        self.name, symbol, e
+                    ))
+                    return []
+
+            for order_statuses in self.map_requests(
+                    fetch_orders, requests, endpoint='private'):
+                for order_status in order_statuses:
+                    if order_status['id'] in order_ids:
+                        results[order_status['id']] = self._create_order(
+                            order_status
+                        )
+
+        missing_orders = [
+            (order_id, asset) for order_id, asset in orders
+            if order_id not in results
+        ]
+        if missing_orders:
+            def fetch_order(order):
+                order_id, asset = order
+                try:
+                    return self.api.fetch_order(
+                        id=order_id, symbol=self.get_symbol(asset)
+                    )
+
+                except Exception as e:
+                    raise ExchangeRequestError(error=e)
+
+            order_statuses = self.map_requests(
+                fetch_order, missing_orders, endpoint='private'
+            )
+            for (order_id, _), order_status in zip(missing_orders,
+                                                   order_statuses):
+                results[order_id] = self._create_order(order_status)
+
+        return results
+
     def cancel_order(self, order_param, asset_or_symbol=None):
         order_id = order_param.id \
             if isinstance(order_param, Order) else order_param
@@ -775,67 +939,117 @@ class CCXT(Exchange):
         try:
             symbol = self.get_symbol(asset_or_symbol) \
                 if asset_or_symbol is not None else None
+            self.ask_request('private')
             self.api.cancel_order(id=order_id, symbol=symbol)
 
         except Exception as e:
             raise ExchangeRequestError(error=e)
 
-    def tickers(self, assets):
+    def _fetch_tickers(self, symbols):
         """
-        Retrieve current tick data for the given assets
+        Fetch the tickers of the specified CCXT symbols.
+
+        A single bulk request is used when supported by the exchange.
+        Tickers missing from the bulk response, or without a
+        timestamp, are fetched individually in parallel.
 
         Parameters
         ----------
-        assets: list[TradingPair]
+        symbols: list[str]
 
         Returns
         -------
-        list[dict[str, float]
+        dict[str, dict[str, Object]]
 
         """
         tickers = dict()
-        try:
-            for asset in assets:
-                symbol = self.get_symbol(asset)
-                # TODO: use fetch_tickers() for efficiency
-                # I tried using fetch_tickers() but noticed some
-                # inconsistencies, see issue:
-                # https://github.com/ccxt/ccxt/issues/870
-                ticker = self.api.fetch_ticker(symbol=symbol)
-                if not ticker:
-                    log.warn('ticker not found for {} {}'.format(
-                        self.name, symbol
-                    ))
-                    continue
+        if len(symbols) > 1 and self.api.has.get('fetchTickers'):
+            self.ask_request(
+                weight=self.request_weights.get('fetch_tickers', 1)
+            )
+            bulk_tickers = self.api.fetch_tickers(symbols)
 
-                ticker['last_traded'] = from_ms_timestamp(ticker['timestamp'])
+            for symbol in symbols:
+                ticker = bulk_tickers.get(symbol) if bulk_tickers else None
+                if ticker and ticker.get('timestamp') is not None:
+                    tickers[symbol] = ticker
 
-                if 'last_price' not in ticker:
-                    # TODO: any more exceptions?
-                    ticker['last_price'] = ticker['last']
+        missing_symbols = [s for s in symbols if s not in tickers]
+        if missing_symbols:
+            if len(tickers) > 0:
+                log.debug(
+                    'fetching tickers individually for {} {}'.format(
+                        self.name, missing_symbols
+                    )
+                )
 
-                if 'baseVolume' in ticker and ticker['baseVolume'] is not None:
-                    # Using the volume represented in the base currency
-                    ticker['volume'] = ticker['baseVolume']
+            for symbol, ticker in zip(
+                    missing_symbols,
+                    self.map_requests(
+                        lambda s: self.api.fetch_ticker(symbol=s),
+                        missing_symbols
+                    )):
+                tickers[symbol] = ticker
 
-                elif 'info' in ticker and 'bidQty' in ticker['info'] \
-                        and 'askQty' in ticker['info']:
-                    ticker['volume'] = float(ticker['info']['bidQty']) + \
-                                       float(ticker['info']['askQty'])
+        return tickers
 
-                else:
-                    ticker['volume'] = 0
+    def tickers(self, assets):
+        """
+        Retrieve current tick data for the given assets
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
 
-                tickers[asset] = ticker
+        Returns
+        -------
+        list[dict[str, float]
+
+        """
+        symbols = [self.get_symbol(asset) for asset in assets]
+        try:
+            # Some exchanges returned inconsistent bulk tickers, see issue:
+            # https://github.com/ccxt/ccxt/issues/870
+            # Incomplete bulk tickers are fetched again individually.
+            symbol_tickers = self._fetch_tickers(symbols)
 
         except ExchangeNotAvailable as e:
             log.warn(
-                'unable to fetch ticker: {} {}'.format(
-                    self.name, asset.symbol
+                'unable to fetch tickers: {} {}'.format(
+                    self.name, symbols
                 )
             )
             raise ExchangeRequestError(error=e)
 
+        tickers = dict()
+        for asset, symbol in zip(assets, symbols):
+            ticker = symbol_tickers[symbol]
+            if not ticker:
+                log.warn('ticker not found for {} {}'.format(
+                    self.name, symbol
+                ))
+                continue
+
+            ticker['last_traded'] = from_ms_timestamp(ticker['timestamp'])
+
+            if 'last_price' not in ticker:
+                # TODO: any more exceptions?
+                ticker['last_price'] = ticker['last']
+
+            if 'baseVolume' in ticker and ticker['baseVolume'] is not None:
+                # Using the volume represented in the base currency
+                ticker['volume'] = ticker['baseVolume']
+
+            elif 'info' in ticker and 'bidQty' in ticker['info'] \
+                    and 'askQty' in ticker['info']:
+                ticker['volume'] = float(ticker['info']['bidQty']) + \
+                                   float(ticker['info']['askQty'])
+
+            else:
+                ticker['volume'] = 0
+
+            tickers[asset] = ticker
+
         return tickers
 
     def get_account(self):
@@ -848,6 +1062,7 @@ class CCXT(Exchange):
         if limit is not None:
             params['depth'] = limit
 
+        self.ask_request()
         order_book = self.api.fetch_order_book(ccxt_symbol, params)
 
         order_types = ['bids', 'asks'] if order_type == 'all' else [order_type]
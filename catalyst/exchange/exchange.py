@@ -1,15 +1,15 @@
 import abc
+import threading
 from abc import ABCMeta, abstractmethod, abstractproperty
-from datetime import timedelta
-from time import sleep
 
 import numpy as np
 import pandas as pd
 from logbook import Logger
 
-from catalyst.constants import LOG_LEVEL
+from catalyst.constants import LOG_LEVEL, RATE_LIMIT_BACKEND
 from catalyst.data.data_portal import BASE_FIELDS
 from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.exchange_rate_limiter import ExchangeRateLimiter
 from catalyst.exchange.exchange_errors import MismatchingBaseCurrencies, \
     SymbolNotFoundOnExchange, \
     PricingDataNotLoadedError, \
@@ -29,6 +29,7 @@ class Exchange:
     def __init__(self):
         self.name = None
         self.assets = []
+        self._asset_index = None
         self._symbol_maps = [None, None]
         self.minute_writer = None
         self.minute_reader = None
@@ -36,11 +37,26 @@ class Exchange:
 
         self.num_candles_limit = None
         self.max_requests_per_minute = None
-        self.request_cpt = None
+        self.endpoint_limits = dict()
+        self.rate_limit_backend = RATE_LIMIT_BACKEND
+        self.rate_limiter = None
+        self._request_lock = threading.Lock()
         self.bundle = ExchangeBundle(self.name)
 
         self.low_balance_threshold = None
 
+        # The market data of the current live bar, see MarketSnapshot
+        self.snapshot = None
+
+    @property
+    def market(self):
+        """
+        The source of the tickers, candles, balances and order states:
+        the snapshot of the current bar in live mode, the exchange itself
+        otherwise.
+        """
+        return self.snapshot if self.snapshot is not None else self
+
     @abstractproperty
     def account(self):
         pass
@@ -68,45 +84,105 @@ class Exchange:
         # TODO: implement for each exchange.
         return True
 
-    def ask_request(self):
+    def ask_request(self, endpoint='public', weight=1):
         """
         Asks permission to issue a request to the exchange.
         The primary purpose is to avoid hitting rate limits.
 
-        The application will pause if the maximum requests per minute
-        permitted by the exchange is exceeded.
+        The application will pause as long as needed for the request
+        to fit in the budget of the exchange and of its endpoint class.
+
+        Parameters
+        ----------
+        endpoint: str
+            The endpoint class, 'public' or 'private'.
+        weight: float
+            The cost of the request.
 
         Returns
         -------
         bool
 
         """
-        now = pd.Timestamp.utcnow()
-        if not self.request_cpt:
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
+        with self._request_lock:
+            if self.rate_limiter is None:
+                self.rate_limiter = ExchangeRateLimiter(
+                    exchange_name=self.name,
+                    requests_per_minute=self.max_requests_per_minute,
+                    endpoint_limits=self.endpoint_limits,
+                    backend=self.rate_limit_backend,
+                )
 
-        cpt_date = list(self.request_cpt.keys())[0]
-        cpt = self.request_cpt[cpt_date]
+        self.rate_limiter.acquire(endpoint, weight)
+        return True
 
-        if now > cpt_date + timedelta(minutes=1):
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
+    def index_assets(self):
+        """
+        Build the lookup indexes of the assets attribute.
 
-        if cpt >= self.max_requests_per_minute:
-            delta = now - cpt_date
+        Keys are lowercase catalyst and exchange symbols, sids and
+        (data_source, symbol) pairs. Assets sharing a key are kept in the
+        order of the assets attribute.
 
-            sleep_period = 60 - delta.total_seconds()
-            sleep(sleep_period)
+        Returns
+        -------
+        dict[str, dict]
 
-            now = pd.Timestamp.utcnow()
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-        else:
-            self.request_cpt[cpt_date] += 1
+        """
+        index = dict(
+            assets=self.assets,
+            size=len(self.assets),
+            symbol=dict(),
+            exchange_symbol=dict(),
+            sid=dict(),
+            data_source=dict(),
+        )
+        for asset in self.assets:
+            symbol = asset.symbol.lower()
+            index['symbol'].setdefault(symbol, []).append(asset)
+            index['sid'].setdefault(asset.sid, []).append(asset)
+            index['data_source'].setdefault((asset.data_source, symbol), asset)
+
+            if asset.exchange_symbol is not None:
+                index['exchange_symbol'].setdefault(
+                    asset.exchange_symbol.lower(), []
+                ).append(asset)
+
+        self._asset_index = index
+        return index
+
+    @property
+    def asset_index(self):
+        """
+        The lookup indexes of the assets, rebuilt when the asset list
+        was replaced or modified since the last lookup.
+
+        Returns
+        -------
+        dict[str, dict]
+
+        """
+        index = self._asset_index
+        if index is None or index['assets'] is not self.assets \
+                or index['size'] != len(self.assets):
+            index = self.index_assets()
+
+        return index
+
+    def get_assets_by_sid(self, sid):
+        """
+        The markets with the specified sid.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        list[TradingPair]
+
+        """
+        return self.asset_index['sid'].get(sid, [])
 
     def get_symbol(self, asset):
         """
@@ -123,13 +199,15 @@ class Exchange:
         """
         symbol = None
 
-        for a in self.assets:
-            if not symbol and a.symbol == asset.symbol:
+        candidates = self.asset_index['symbol'].get(asset.symbol.lower(), [])
+        for a in candidates:
+            if a.symbol == asset.symbol:
                 symbol = a.symbol
+                break
 
         if not symbol:
             raise ValueError('Currency %s not supported by exchange %s' %
-                             (asset['symbol'], self.name.title()))
+                             (asset.symbol, self.name.title()))
 
         return symbol
 
@@ -239,38 +317,45 @@ class Exchange:
                 self.name, symbol
             )
         )
-        for a in self.assets:
-            if asset is not None:
-                break
+        index = self.asset_index
+        key = symbol.lower()
 
-            if is_local is not None:
-                data_source = 'local' if is_local else 'catalyst'
-                applies = (a.data_source == data_source)
-
-            elif data_frequency is not None:
-                applies = (
-                    (
-                        data_frequency == 'minute' and a.end_minute is not None)
-                    or (
-                        data_frequency == 'daily' and a.end_daily is not None)
-                )
-
-            else:
-                applies = True
+        if is_local is not None and not is_exchange_symbol:
+            data_source = 'local' if is_local else 'catalyst'
+            asset = index['data_source'].get((data_source, key))
 
+        if asset is None:
             # The symbol provided may use the Catalyst or the exchange
             # convention
-            key = a.exchange_symbol if is_exchange_symbol else a.symbol
-            if not asset and key.lower() == symbol.lower():
+            candidates = index['exchange_symbol' if is_exchange_symbol
+                               else 'symbol'].get(key, [])
+            for a in candidates:
+                if is_local is not None:
+                    data_source = 'local' if is_local else 'catalyst'
+                    applies = (a.data_source == data_source)
+
+                elif data_frequency is not None:
+                    applies = (
+                        (data_frequency == 'minute'
+                         and a.end_minute is not None)
+                        or (data_frequency == 'daily'
+                            and a.end_daily is not None)
+                    )
+
+                else:
+                    applies = True
+
                 if applies:
                     asset = a
+                    break
 
-                else:
-                    raise NoDataAvailableOnExchange(
-                        symbol=key,
-                        exchange=self.name,
-                        data_frequency=data_frequency,
-                    )
+            if asset is None and candidates:
+                raise NoDataAvailableOnExchange(
+                    symbol=candidates[0].exchange_symbol
+                    if is_exchange_symbol else candidates[0].symbol,
+                    exchange=self.name,
+                    data_frequency=data_frequency,
+                )
 
         if asset is None:
             supported_symbols = sorted([a.symbol for a in self.assets])
@@ -359,7 +444,7 @@ class Exchange:
         if field not in BASE_FIELDS:
             raise KeyError('Invalid column: {}'.format(field))
 
-        tickers = self.tickers(assets)
+        tickers = self.market.tickers(assets)
         if field == 'close' or field == 'price':
             return [tickers[asset]['last'] for asset in tickers]
 
@@ -400,7 +485,7 @@ class Exchange:
         )
 
         freq = '1T' if data_frequency == 'minute' else '1D'
-        ohlc = self.get_candles(freq, asset)
+        ohlc = self.market.get_candles(freq, asset)
         if field not in ohlc:
             raise KeyError('Invalid column: %s' % field)
 
@@ -503,7 +588,7 @@ class Exchange:
         start_dt = get_start_dt(end_dt, adj_bar_count, data_frequency)
 
         # The get_history method supports multiple asset
-        candles = self.get_candles(
+        candles = self.market.get_candles(
             freq=freq,
             assets=assets,
             bar_count=bar_count,
@@ -618,7 +703,7 @@ class Exchange:
                 trailing_bar_count = get_periods(
                     trailing_dt, end_dt, freq
                 )
-                candles = self.get_candles(
+                candles = self.market.get_candles(
                     freq=freq,
                     assets=asset,
                     bar_count=trailing_bar_count,
@@ -678,7 +763,7 @@ class Exchange:
         free_cash = 0.0
         if check_balances:
             log.debug('fetching {} balances'.format(self.name))
-            balances = self.get_balances()
+            balances = self.market.get_balances()
             log.debug(
                 'got free balances for {} currencies'.format(
                     len(balances)
@@ -701,7 +786,7 @@ class Exchange:
         positions_value = 0.0
         if positions is not None:
             assets = set([position.asset for position in positions])
-            tickers = self.tickers(assets)
+            tickers = self.market.tickers(assets)
 
             for position in positions:
                 asset = position.asset
@@ -900,6 +985,28 @@ class Exchange:
         """
         pass
 
+    def get_orders(self, orders):
+        """Lookup the state of several orders.
+
+        The orders are requested one by one by default, the exchanges
+        which can list the orders of a market override this method to
+        reduce the number of requests.
+
+        Parameters
+        ----------
+        orders : list[tuple[str, TradingPair]]
+            The id and asset of each order.
+
+        Returns
+        -------
+        dict[str, tuple[Order, float]]
+            The order object and execution price of each order id.
+        """
+        return dict(
+            (order_id, self.get_order(order_id, asset))
+            for order_id, asset in orders
+        )
+
     @abstractmethod
     def cancel_order(self, order_param, symbol_or_asset=None):
         """Cancel an open order.
@@ -21,28 +21,30 @@ from os.path import isfile, join
 import logbook
 import pandas as pd
 from redo import retry
+from six import iteritems, itervalues
 
 import catalyst.protocol as zp
 from catalyst.algorithm import TradingAlgorithm
 from catalyst.constants import LOG_LEVEL
 from catalyst.exchange.exchange_blotter import ExchangeBlotter
+from catalyst.exchange.exchange_checkpoint import AlgoCheckpoint, \
+    JournaledPerformanceTracker
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
     OrderTypeNotSupported)
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
+from catalyst.exchange.exchange_frame_stats import FrameStatsAccumulator
+from catalyst.exchange.exchange_snapshot import MarketSnapshot
+from catalyst.exchange.exchange_stats_store import AlgoStatsStore
 from catalyst.exchange.live_graph_clock import LiveGraphClock
 from catalyst.exchange.simple_clock import SimpleClock
 from catalyst.exchange.utils.exchange_utils import (
     save_algo_object,
-    get_algo_object,
     get_algo_folder,
-    get_algo_df,
-    save_algo_df,
     group_assets_by_exchange, )
 from catalyst.exchange.utils.stats_utils import get_pretty_stats, stats_to_s3, \
-    stats_to_algo_folder
+    stats_to_algo_folder, StatsFormatter
 from catalyst.finance.execution import MarketOrder
-from catalyst.finance.performance import PerformanceTracker
 from catalyst.finance.performance.period import calc_period_stats
 from catalyst.gens.tradesimulation import AlgorithmSimulator
 from catalyst.utils.api_support import api_method
@@ -276,19 +278,12 @@ class ExchangeTradingAlgorithmBase(TradingAlgorithm):
         period = tracker.todays_performance
         # we want the key to be absent, not just empty
         # Only include transactions for given dt
-        stats['transactions'] = []
-        for date in period.processed_transactions:
-            if start_dt <= date < end_dt:
-                transactions = period.processed_transactions[date]
-                for t in transactions:
-                    stats['transactions'].append(t.to_dict())
-
-        stats['orders'] = []
-        for date in period.orders_by_modified:
-            if start_dt <= date < end_dt:
-                orders = period.orders_by_modified[date]
-                for order in orders:
-                    stats['orders'].append(orders[order].to_dict())
+        stats['transactions'] = [
+            t.to_dict() for t in period.transactions_between(start_dt, end_dt)
+        ]
+        stats['orders'] = [
+            o.to_dict() for o in period.orders_between(start_dt, end_dt)
+        ]
 
         return stats
 
@@ -301,9 +296,24 @@ class ExchangeTradingAlgorithmBase(TradingAlgorithm):
 
 class ExchangeTradingAlgorithmBacktest(ExchangeTradingAlgorithmBase):
     def __init__(self, *args, **kwargs):
+        stats_frequency = kwargs.pop('stats_frequency', None)
+
         super(ExchangeTradingAlgorithmBacktest, self).__init__(*args, **kwargs)
 
-        self.frame_stats = list()
+        if stats_frequency is None:
+            stats_frequency = 1
+
+        # Preallocating the stats of the whole backtest
+        capacity = len(self.sim_params.sessions)
+        if self.data_frequency == 'minute' and stats_frequency != 'daily' \
+                and isinstance(stats_frequency, int) and stats_frequency > 0:
+            capacity = capacity * 1440 // stats_frequency + 1
+
+        self.frame_stats = FrameStatsAccumulator(
+            capacity=capacity,
+            frequency=stats_frequency,
+        )
+        self._frame_stats_start = None
         log.info('initialized trading algorithm in backtest mode')
 
     def is_last_frame_of_day(self, data):
@@ -317,16 +327,22 @@ class ExchangeTradingAlgorithmBacktest(ExchangeTradingAlgorithmBase):
     def handle_data(self, data):
         super(ExchangeTradingAlgorithmBacktest, self).handle_data(data)
 
-        if self.data_frequency == 'minute':
-            frame_stats = self.prepare_period_stats(
-                data.current_dt, data.current_dt + timedelta(minutes=1)
-            )
+        if self.data_frequency == 'minute' \
+                and self.frame_stats.should_record(data.current_dt):
+            # The recorded bars include the orders and transactions of
+            # the bars skipped since the previous one.
+            start_dt = self._frame_stats_start \
+                if self._frame_stats_start is not None else data.current_dt
+            end_dt = data.current_dt + timedelta(minutes=1)
+
+            frame_stats = self.prepare_period_stats(start_dt, end_dt)
             self.frame_stats.append(frame_stats)
+            self._frame_stats_start = end_dt
 
         self.current_day = data.current_dt.floor('1D')
 
     def _create_stats_df(self):
-        stats = pd.DataFrame(self.frame_stats)
+        stats = self.frame_stats.to_frame()
         stats.set_index('period_close', inplace=True, drop=False)
         return stats
 
@@ -351,27 +367,33 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         self.live_graph = kwargs.pop('live_graph', None)
         self.stats_output = kwargs.pop('stats_output', None)
         self._analyze_live = kwargs.pop('analyze_live', None)
+        self.missed_bars = kwargs.pop('missed_bars', 'skip')
+        self.prefetch_seconds = kwargs.pop('prefetch_seconds', None)
 
         self._clock = None
         self.frame_stats = list()
 
-        self.pnl_stats = get_algo_df(self.algo_namespace, 'pnl_stats')
+        self.checkpoint = AlgoCheckpoint(self.algo_namespace)
+        self._daily_stats = None
 
-        self.custom_signals_stats = \
-            get_algo_df(self.algo_namespace, 'custom_signals_stats')
-
-        self.exposure_stats = \
-            get_algo_df(self.algo_namespace, 'exposure_stats')
+        self.stats_stores = dict(
+            (key, AlgoStatsStore(self.algo_namespace, key))
+            for key in ('pnl_stats', 'custom_signals_stats', 'exposure_stats')
+        )
 
         self.is_running = True
 
         self.stats_minutes = 1
+        self.stats_formatter = StatsFormatter(num_rows=self.stats_minutes)
 
         self._last_orders = []
         self.trading_client = None
 
         super(ExchangeTradingAlgorithmLive, self).__init__(*args, **kwargs)
 
+        for exchange in itervalues(self.exchanges):
+            exchange.snapshot = MarketSnapshot(exchange)
+
         try:
             signal.signal(signal.SIGINT, self.signal_handler)
         except ValueError:
@@ -382,6 +404,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
     def interrupt_algorithm(self):
         self.is_running = False
+        self._save_daily_stats()
 
         if self._analyze is None:
             log.info('Exiting the algorithm.')
@@ -444,7 +467,13 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         # This method is taken from TradingAlgorithm.
         # The clock has been replaced to use RealtimeClock
-        # TODO: should we apply time skew? not sure to understand the utility.
+        clock_kwargs = dict(
+            time_skew=self._get_time_skew(),
+            missed_bars=self.missed_bars,
+            prefetch=self._prefetch_market_data
+            if self.prefetch_seconds else None,
+            prefetch_seconds=self.prefetch_seconds,
+        )
 
         log.debug('creating clock')
         if self.live_graph or self._analyze_live is not None:
@@ -452,50 +481,90 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                 self.sim_params.sessions,
                 context=self,
                 callback=self._analyze_live,
+                **clock_kwargs
             )
         else:
             self._clock = SimpleClock(
                 self.sim_params.sessions,
+                **clock_kwargs
             )
 
         return self._clock
 
+    def _get_time_skew(self):
+        # Waiting for the exchange with the slowest clock so that the
+        # bar is over on every exchange when it is emitted.
+        skews = [
+            exchange.time_skew for exchange in itervalues(self.exchanges)
+            if exchange.time_skew is not None
+        ]
+        return min(skews) if skews else pd.Timedelta('0s')
+
+    def _prefetch_market_data(self, dt):
+        """
+        Start the market snapshot of the bar on each exchange and fetch
+        the tickers of the positions and open orders, the balances and the
+        state of the open orders concurrently.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+            The bar about to be processed.
+
+        """
+        assets = list(self.portfolio.positions)
+        orders = []
+        for asset, asset_orders in iteritems(self.blotter.open_orders):
+            if asset_orders and asset not in assets:
+                assets.append(asset)
+
+            if not self.simulate_orders:
+                orders += [(order.id, asset) for order in asset_orders]
+
+        exchange_assets = group_assets_by_exchange(assets)
+        for exchange_name, exchange in iteritems(self.exchanges):
+            exchange.snapshot.prefetch(
+                dt,
+                assets=exchange_assets.get(exchange_name),
+                orders=[
+                    (order_id, asset) for order_id, asset in orders
+                    if asset.exchange == exchange_name
+                ],
+                balances=not self.simulate_orders,
+            )
+
+    def on_dt_changed(self, dt):
+        super(ExchangeTradingAlgorithmLive, self).on_dt_changed(dt)
+
+        # Nothing is fetched again if the snapshot was prefetched ahead
+        # of the bar with prefetch_seconds
+        if self.initialized and self.is_running:
+            self._prefetch_market_data(dt)
+
     def get_generator(self):
         if self.trading_client is not None:
             return self.trading_client.transform()
 
-        perf = None
+        restore = False
         if self.perf_tracker is None:
-            tracker = self.perf_tracker = PerformanceTracker(
+            self.perf_tracker = JournaledPerformanceTracker(
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
+                checkpoint=self.checkpoint,
             )
 
             # Set the dt initially to the period start by forcing it to change.
             self.on_dt_changed(self.sim_params.start_session)
-
-            # Unpacking the perf_tracker and positions if available
-            perf = get_algo_object(
-                algo_name=self.algo_namespace,
-                key='cumulative_performance',
-            )
+            restore = True
 
         if not self.initialized:
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
             self.initialized = True
 
-        # Call the simulation trading algorithm for side-effects:
-        # it creates the perf tracker
-        # TradingAlgorithm._create_generator(self, self.sim_params)
-        if perf is not None:
-            tracker.cumulative_performance = perf
-
-            period = self.perf_tracker.todays_performance
-            period.starting_cash = perf.ending_cash
-            period.starting_exposure = perf.ending_exposure
-            period.starting_value = perf.ending_value
-            period.position_tracker = perf.position_tracker
+        # Unpacking the perf_tracker and positions if available
+        if restore:
+            self.checkpoint.restore(self.perf_tracker)
 
         self.trading_client = ExchangeAlgorithmExecutor(
             algo=self,
@@ -581,6 +650,18 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         return total_cash, total_positions_value
 
+    @property
+    def pnl_stats(self):
+        return self.stats_stores['pnl_stats'].frame
+
+    @property
+    def custom_signals_stats(self):
+        return self.stats_stores['custom_signals_stats'].frame
+
+    @property
+    def exposure_stats(self):
+        return self.stats_stores['exposure_stats'].frame
+
     def add_pnl_stats(self, period_stats):
         """
         Save p&l stats.
@@ -600,13 +681,9 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         log.debug('adding pnl stats: {:6f}%'.format(perc))
 
-        df = pd.DataFrame(
-            data=[dict(performance=perc)],
-            index=[period_stats['period_close']]
+        self.stats_stores['pnl_stats'].append(
+            period_stats['period_close'], dict(performance=perc)
         )
-        self.pnl_stats = pd.concat([self.pnl_stats, df])
-
-        save_algo_df(self.algo_namespace, 'pnl_stats', self.pnl_stats)
 
     def add_custom_signals_stats(self, period_stats):
         """
@@ -621,14 +698,9 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         """
         log.debug('adding custom signals stats: {}'.format(self.recorded_vars))
-        df = pd.DataFrame(
-            data=[self.recorded_vars],
-            index=[period_stats['period_close']],
+        self.stats_stores['custom_signals_stats'].append(
+            period_stats['period_close'], self.recorded_vars
         )
-        self.custom_signals_stats = pd.concat([self.custom_signals_stats, df])
-
-        save_algo_df(self.algo_namespace, 'custom_signals_stats',
-                     self.custom_signals_stats)
 
     def add_exposure_stats(self, period_stats):
         """
@@ -648,14 +720,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         )
         log.debug('adding exposure stats: {}'.format(data))
 
-        df = pd.DataFrame(
-            data=[data],
-            index=[period_stats['period_close']],
-        )
-        self.exposure_stats = pd.concat([self.exposure_stats, df])
-
-        save_algo_df(
-            self.algo_namespace, 'exposure_stats', self.exposure_stats
+        self.stats_stores['exposure_stats'].append(
+            period_stats['period_close'], data
         )
 
     def handle_data(self, data):
@@ -674,6 +740,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         today = data.current_dt.floor('1D')
         if self.current_day is not None and today > self.current_day:
             self.frame_stats = list()
+            self.stats_formatter.reset()
 
         self.performance_needs_update = False
         new_orders = self.perf_tracker.todays_performance.orders_by_id.keys()
@@ -714,11 +781,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         except Exception as e:
             log.warn('unable to calculate performance: {}'.format(e))
 
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key='cumulative_performance',
-            obj=self.perf_tracker.cumulative_performance,
-        )
+        if self.checkpoint.commit(self.perf_tracker):
+            self._save_daily_stats()
 
         self.current_day = data.current_dt.floor('1D')
 
@@ -754,32 +818,45 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                     stats=self.frame_stats,
                     recorded_cols=recorded_cols,
                     num_rows=self.stats_minutes,
+                    formatter=self.stats_formatter,
                 )
             ))
 
         # Saving the daily stats in a format usable for performance
-        # analysis.
-        daily_stats = self.prepare_period_stats(
+        # analysis. They are only written when the day is over or when
+        # the algorithm state is saved to disk.
+        if self._daily_stats is not None \
+                and self._daily_stats['period_open'] < today:
+            self._save_daily_stats()
+
+        self._daily_stats = self.prepare_period_stats(
             start_dt=today,
             end_dt=data.current_dt
         )
+
+        return recorded_cols
+
+    def _save_daily_stats(self):
+        if self._daily_stats is None:
+            return
+
         save_algo_object(
             algo_name=self.algo_namespace,
-            key=today.strftime('%Y-%m-%d'),
-            obj=daily_stats,
+            key=self._daily_stats['period_open'].strftime('%Y-%m-%d'),
+            obj=self._daily_stats,
             rel_path='daily_perf'
         )
 
-        return recorded_cols
-
     def _save_stats_csv(self, recorded_cols):
-        # Writing the stats output
+        # Writing the stats output, only the new rows are appended
         csv_bytes = None
+        filename = None
         try:
-            csv_bytes = stats_to_algo_folder(
+            filename = stats_to_algo_folder(
                 stats=self.frame_stats,
                 algo_namespace=self.algo_namespace,
                 recorded_cols=recorded_cols,
+                formatter=self.stats_formatter,
             )
         except Exception as e:
             log.warn('unable save stats locally: {}'.format(e))
@@ -787,6 +864,11 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         try:
             if self.stats_output is not None:
                 if 's3://' in self.stats_output:
+                    # The S3 object is replaced with the whole file
+                    if filename is not None:
+                        with open(filename, 'rb') as handle:
+                            csv_bytes = handle.read()
+
                     stats_to_s3(
                         uri=self.stats_output,
                         stats=self.frame_stats,
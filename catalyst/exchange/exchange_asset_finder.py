@@ -36,13 +36,11 @@ class ExchangeAssetFinder(object):
         """
         asset = None
         for exchange_name in self.exchanges:
-            if asset is not None:
-                break
-
             exchange = self.exchanges[exchange_name]
-            assets = [asset for asset in exchange.assets if asset.sid == sid]
+            assets = exchange.get_assets_by_sid(sid)
             if assets:
                 asset = assets[0]
+                break
 
         return asset
 
@@ -72,8 +70,8 @@ class ExchangeAssetFinder(object):
         assets = []
         for exchange_name in self.exchanges:
             exchange = self.exchanges[exchange_name]
-            xas = [asset for asset in exchange.assets if asset.sid in sids]
-            assets += xas
+            for sid in sids:
+                assets += exchange.get_assets_by_sid(sid)
 
         return assets
 
@@ -1,8 +1,339 @@
+import json
+import os
+from bisect import bisect_right
+from glob import glob
+
+import bcolz
 import numpy as np
+import pandas as pd
+from bcolz import ctable
+from lru import LRU
 
 from catalyst import get_calendar
+from catalyst.data.bar_reader import NoDataOnDate
 from catalyst.data.minute_bars import BcolzMinuteBarReader, \
-    BcolzMinuteBarWriter
+    BcolzMinuteBarWriter, BcolzMinuteOverlappingData, convert_cols
+from catalyst.gens.sim_engine import NANOS_IN_MINUTE
+from catalyst.utils.cli import maybe_show_progress
+
+BUNDLE_FORMAT_FILENAME = 'format.json'
+COVERAGE_FILENAME = 'coverage.json'
+DEFAULT_BUNDLE_FORMAT = 'bcolz'
+
+
+def get_bundle_format(rootdir):
+    """
+    The storage format of the bundle in the specified folder.
+
+    Parameters
+    ----------
+    rootdir: str
+
+    Returns
+    -------
+    str
+        The format name, bundles without a format file use the dense
+        bcolz format.
+
+    """
+    path = os.path.join(rootdir, BUNDLE_FORMAT_FILENAME)
+    if not os.path.isfile(path):
+        return DEFAULT_BUNDLE_FORMAT
+
+    with open(path) as f:
+        return json.load(f)['format']
+
+
+def write_bundle_format(rootdir, bundle_format):
+    """
+    Save the storage format of the bundle in the specified folder.
+
+    Parameters
+    ----------
+    rootdir: str
+    bundle_format: str
+
+    """
+    path = os.path.join(rootdir, BUNDLE_FORMAT_FILENAME)
+    with open(path, 'w') as f:
+        json.dump(dict(format=bundle_format), f)
+
+
+def get_bundle_sids(rootdir):
+    """
+    The sids contained in a bundle folder.
+
+    Parameters
+    ----------
+    rootdir: str
+
+    Returns
+    -------
+    list[int]
+
+    """
+    paths = glob(os.path.join(rootdir, '*', '*', '*.bcolz')) \
+        + glob(os.path.join(rootdir, '*', '*', '*.mmap'))
+    return sorted(
+        [int(os.path.basename(path).split('.')[0]) for path in paths]
+    )
+
+
+class BundleCoverage(object):
+    """
+    The ranges of periods ingested for each sid of a bundle.
+
+    Ranges are stored in minutes since the epoch in the coverage file of
+    the bundle folder. Overlapping and adjacent ranges are merged.
+
+    Parameters
+    ----------
+    rootdir: str
+    data_frequency: str
+
+    """
+
+    def __init__(self, rootdir, data_frequency):
+        self._rootdir = rootdir
+        self._step = 1 if data_frequency == 'minute' else 1440
+
+        self._ranges = dict()
+        self._mtime = None
+
+        self.load()
+
+    @property
+    def path(self):
+        return os.path.join(self._rootdir, COVERAGE_FILENAME)
+
+    @property
+    def exists(self):
+        return self._mtime is not None
+
+    @property
+    def sids(self):
+        return list(self._ranges.keys())
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+
+            self._ranges = dict(
+                (int(sid), [tuple(r) for r in ranges])
+                for sid, ranges in data['ranges'].items()
+            )
+            self._mtime = os.path.getmtime(self.path)
+
+        except (IOError, OSError, ValueError, KeyError):
+            self._ranges = dict()
+            self._mtime = None
+
+    def refresh(self):
+        """
+        Reload the coverage if the file was modified by another writer.
+        """
+        if os.path.isfile(self.path) \
+                and os.path.getmtime(self.path) != self._mtime:
+            self.load()
+
+    def save(self):
+        temp_path = '{}.tmp'.format(self.path)
+        with open(temp_path, 'w') as f:
+            json.dump(dict(
+                ranges=dict(
+                    (str(sid), ranges) for sid, ranges in self._ranges.items()
+                )
+            ), f)
+
+        try:
+            os.rename(temp_path, self.path)
+
+        except OSError:
+            # Windows does not replace existing files
+            os.remove(self.path)
+            os.rename(temp_path, self.path)
+
+        self._mtime = os.path.getmtime(self.path)
+
+    def _to_minute(self, dt):
+        minute = pd.Timestamp(dt).value // NANOS_IN_MINUTE
+        return minute - minute % self._step
+
+    def add_minutes(self, sid, start, end):
+        """
+        Add a range of minutes since the epoch to the coverage of a sid.
+
+        Parameters
+        ----------
+        sid: int
+        start: int
+        end: int
+
+        """
+        sid = int(sid)
+        ranges = sorted(self._ranges.get(sid, []) + [(int(start), int(end))])
+
+        merged = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            last_start, last_end = merged[-1]
+            if range_start <= last_end + self._step:
+                merged[-1] = (last_start, max(last_end, range_end))
+
+            else:
+                merged.append((range_start, range_end))
+
+        self._ranges[sid] = merged
+
+    def get_ranges(self, sid):
+        """
+        The ranges of minutes since the epoch ingested for a sid.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        list[tuple[int, int]]
+
+        """
+        return list(self._ranges.get(int(sid), []))
+
+    def add(self, sid, start_dt, end_dt):
+        self.add_minutes(
+            sid, self._to_minute(start_dt), self._to_minute(end_dt)
+        )
+
+    def build(self, reader, sids):
+        """
+        Index the data of a bundle written without coverage file.
+
+        Since bundles are ingested by whole chunks, each chunk period
+        containing traded bars is covered entirely so that periods without
+        trades at the edges are not reported missing. Periods without any
+        bar are left missing. The last chunk is not extended past the end
+        of the bundle.
+
+        Parameters
+        ----------
+        reader: BcolzExchangeBarReader
+        sids: list[int]
+
+        """
+        last_minute = self._to_minute(reader.last_available_dt)
+        for sid in sids:
+            dts, _ = reader.get_raw_bars(sid)
+            if len(dts) == 0:
+                continue
+
+            starts, ends = self._get_period_minutes(dts)
+            last_bars = dts[np.searchsorted(dts, ends, side='right') - 1]
+            ends = np.maximum(np.minimum(ends, last_minute), last_bars)
+            for start, end in zip(starts, ends):
+                self.add_minutes(sid, start, end)
+
+    def _get_period_minutes(self, minutes):
+        """
+        The first and last minutes of the chunk periods containing the
+        minutes.
+
+        Minute bundles are ingested by month and daily bundles by year.
+
+        Parameters
+        ----------
+        minutes: np.ndarray[int64]
+
+        Returns
+        -------
+        np.ndarray[int64], np.ndarray[int64]
+
+        """
+        unit = 'M' if self._step == 1 else 'Y'
+        periods = np.unique(
+            np.asarray(minutes, dtype='datetime64[m]').astype(
+                'datetime64[{}]'.format(unit)
+            )
+        )
+
+        starts = periods.astype('datetime64[m]').astype(np.int64)
+        ends = (periods + 1).astype('datetime64[m]').astype(np.int64) \
+            - self._step
+        return starts, ends
+
+    def covers(self, sid, start_dt, end_dt):
+        """
+        Whether the whole date range was ingested for the sid.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        bool
+
+        """
+        ranges = self._ranges.get(int(sid))
+        if not ranges:
+            return False
+
+        start = self._to_minute(start_dt)
+        index = bisect_right(ranges, (start, np.iinfo(np.int64).max)) - 1
+        if index < 0:
+            return False
+
+        return ranges[index][1] >= self._to_minute(end_dt)
+
+    def get_missing_ranges(self, sids, start_dt, end_dt):
+        """
+        The ranges of periods missing for each sid.
+
+        Parameters
+        ----------
+        sids: list[int]
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        dict[int, list[tuple[pd.Timestamp, pd.Timestamp]]]
+            The missing ranges of the sids not fully covered.
+
+        """
+        start = self._to_minute(start_dt)
+        end = self._to_minute(end_dt)
+
+        def to_dt(minute):
+            return pd.Timestamp(minute, unit='m', tz='UTC')
+
+        missing = dict()
+        for sid in sids:
+            sid_missing = []
+            cursor = start
+            for range_start, range_end in self._ranges.get(int(sid), []):
+                if range_end < cursor:
+                    continue
+
+                if range_start > end:
+                    break
+
+                if range_start > cursor:
+                    sid_missing.append(
+                        (to_dt(cursor), to_dt(range_start - self._step))
+                    )
+
+                cursor = range_end + self._step
+
+            if cursor <= end:
+                sid_missing.append((to_dt(cursor), to_dt(end)))
+
+            if sid_missing:
+                missing[sid] = sid_missing
+
+        return missing
 
 
 class BcolzExchangeBarWriter(BcolzMinuteBarWriter):
@@ -27,6 +358,49 @@ class BcolzExchangeBarWriter(BcolzMinuteBarWriter):
                                     end_session=end_session
                                     ))
 
+        self.coverage = BundleCoverage(self._rootdir, self._data_frequency)
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        try:
+            super(BcolzExchangeBarWriter, self).write(
+                data, show_progress, invalid_data_behavior
+            )
+
+        finally:
+            self.coverage.save()
+
+    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+        super(BcolzExchangeBarWriter, self).write_sid(
+            sid, df, invalid_data_behavior
+        )
+
+        if not df.empty:
+            self.coverage.add(sid, df.index[0], df.index[-1])
+
+    def write_raw(self, sid, dts, cols):
+        """
+        Append values scaled by the ohlc ratio of the sid.
+
+        Parameters
+        ----------
+        sid: int
+        dts: np.ndarray[int64]
+            The periods in minutes since the epoch, strictly increasing.
+        cols: dict[str, np.ndarray[uint64]]
+
+        """
+        if len(dts) == 0:
+            self._ensure_ctable(sid)
+            return
+
+        ratio = float(self.ohlc_ratio_for_sid(sid))
+        df = pd.DataFrame(
+            dict((name, cols[name] / ratio) for name in self.COL_NAMES),
+            index=pd.to_datetime(np.asarray(dts) * NANOS_IN_MINUTE, utc=True),
+            columns=list(self.COL_NAMES),
+        )
+        self.write_sid(sid, df, invalid_data_behavior='raise')
+
 
 class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def __init__(self, *args, **kwargs):
@@ -38,6 +412,43 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def data_frequency(self):
         return self._data_frequency
 
+    def _get_periods(self, start_dt, end_dt):
+        return self.calendar.minutes_in_range(start_dt, end_dt) \
+            if self.data_frequency == 'minute' \
+            else self.calendar.sessions_in_range(start_dt, end_dt)
+
+    def get_raw_bars(self, sid):
+        """
+        The periods which traded for the sid with their raw values.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        np.ndarray, dict[str, np.ndarray]
+            The periods in minutes since the epoch and the unscaled
+            uint64 values of each field.
+
+        """
+        cols = dict(
+            (field, self._open_minute_file(field, sid)[:])
+            for field in self.FIELDS
+        )
+
+        traded = np.zeros(len(cols['close']), dtype=bool)
+        for field in self.FIELDS:
+            traded |= cols[field] != 0
+
+        positions = np.flatnonzero(traded)
+        dts = self._market_open_values[positions // self._minutes_per_day] \
+            + positions % self._minutes_per_day
+
+        return dts, dict(
+            (field, cols[field][positions]) for field in self.FIELDS
+        )
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -61,38 +472,559 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        periods = self.calendar.minutes_in_range(start_dt, end_dt) \
-            if self.data_frequency == 'minute' \
-            else self.calendar.sessions_in_range(start_dt, end_dt)
+        periods = self._get_periods(start_dt, end_dt)
 
-        num_days = len(periods)
-        shape = num_days, len(sids)
+        num_periods = len(periods)
+        shape = num_periods, len(sids)
 
         all_fields = fields[:]
         if len(all_fields) == 1 and all_fields[0] == 'volume':
             all_fields.insert(0, 'close')
 
+        inverse_ratios = np.array(
+            [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+            dtype=np.float64,
+        )
+
+        # The raw values of each field are decompressed once per sid into
+        # a common buffer, then scaled and masked for all sids at once.
+        # Rows beyond the data written for a sid stay at zero.
+        raw = np.zeros(shape, dtype=np.float64)
+
         mask = None
         data = []
         for field in all_fields:
-            if field != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.float64)
-
+            raw.fill(0)
             for i, sid in enumerate(sids):
                 carray = self._open_minute_file(field, sid)
-                a = carray[start_idx:end_idx + 1]
+                values = carray[start_idx:end_idx + 1][:num_periods]
+                raw[:len(values), i] = values
+
+            # The mask of the first field determines which periods traded
+            # for each sid, it applies to all subsequent fields.
+            if mask is None:
+                mask = raw != 0
+
+            if field in fields:
+                fill_value = 0.0 if field == 'volume' else np.nan
+                out = np.where(mask, raw * inverse_ratios, fill_value)
+                data.append(out)
+
+        return data
+
+
+class BcolzExchangeSparseBarWriter(BcolzExchangeBarWriter):
+    """
+    Writer storing only the periods which traded.
+
+    Each sid ctable holds a `dt` column of minutes since the epoch next to
+    the OHLCV columns. Periods without any value are dropped instead of
+    being zero-filled, which makes a large difference for illiquid pairs
+    on a 24/7 calendar.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(BcolzExchangeSparseBarWriter, self).__init__(*args, **kwargs)
+
+        write_bundle_format(self._rootdir, 'sparse')
+
+    def _init_ctable(self, path):
+        sid_containing_dirname = os.path.dirname(path)
+        if not os.path.exists(sid_containing_dirname):
+            os.makedirs(sid_containing_dirname)
+
+        initial_array = np.empty(0, np.uint64)
+        table = ctable(
+            rootdir=path,
+            columns=[
+                np.empty(0, np.int64),
+                initial_array,
+                initial_array,
+                initial_array,
+                initial_array,
+                initial_array,
+            ],
+            names=['dt'] + list(self.COL_NAMES),
+            mode='w',
+        )
+        table.flush()
+        return table
+
+    def _last_dt_for_sid(self, table):
+        try:
+            return table.attrs['last_dt']
+        except KeyError:
+            return None
+
+    def last_date_in_output_for_sid(self, sid):
+        if not os.path.exists(self.sidpath(sid)):
+            return pd.NaT
+
+        last_dt = self._last_dt_for_sid(self._ensure_ctable(sid))
+        if last_dt is None:
+            return pd.NaT
+
+        return pd.Timestamp(last_dt, unit='m', tz='UTC').floor('1D')
+
+    def pad(self, sid, date):
+        # Missing periods are never materialized.
+        self._ensure_ctable(sid)
+
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+        dt_values = dts.astype('datetime64[m]').astype(np.int64)
+
+        raw_cols = convert_cols(
+            cols, self.ohlc_ratio_for_sid(sid), sid, invalid_data_behavior
+        )
+        self.write_raw(sid, dt_values, dict(zip(self.COL_NAMES, raw_cols)))
+
+    def write_raw(self, sid, dts, cols):
+        """
+        Append scaled values to the ctable of the sid.
+
+        Parameters
+        ----------
+        sid: int
+        dts: np.ndarray[int64]
+            The periods in minutes since the epoch, strictly increasing.
+        cols: dict[str, np.ndarray[uint64]]
+            The scaled values of each field.
+
+        """
+        table = self._ensure_ctable(sid)
+        if len(dts) == 0:
+            return
+
+        last_dt = self._last_dt_for_sid(table)
+        if last_dt is not None and dts[-1] <= last_dt:
+            raise BcolzMinuteOverlappingData(
+                'Data with last_dt={0} already includes input end={1} for '
+                'sid={2}'.format(
+                    pd.Timestamp(last_dt, unit='m', tz='UTC'),
+                    pd.Timestamp(dts[-1], unit='m', tz='UTC'),
+                    sid,
+                )
+            )
+
+        rows = np.zeros(len(dts), dtype=bool)
+        for name in self.COL_NAMES:
+            rows |= cols[name] != 0
+
+        if last_dt is not None:
+            rows &= dts > last_dt
+
+        table.append(
+            [dts[rows]] + [cols[name][rows] for name in self.COL_NAMES]
+        )
+        table.flush()
+        table.attrs['last_dt'] = int(dts[-1])
+
 
-                if mask is None:
-                    mask = a != 0
+class BcolzExchangeSparseBarReader(BcolzExchangeBarReader):
+    """
+    Reader for data written by BcolzExchangeSparseBarWriter.
 
-                inverse_ratio = self._ohlc_ratio_inverse_for_sid(sid)
-                out[:len(mask), i][mask] = (
-                    a[mask] * inverse_ratio
+    Exposes the same interface as the dense reader, periods which are
+    not stored read as missing values.
+    """
+
+    def __init__(self, *args, **kwargs):
+        sid_cache_size = kwargs.get('sid_cache_size', 1000)
+        super(BcolzExchangeSparseBarReader, self).__init__(*args, **kwargs)
+
+        self._dts = LRU(sid_cache_size)
+
+    def _get_dts(self, sid):
+        sid = int(sid)
+        try:
+            return self._dts[sid]
+
+        except KeyError:
+            dts = bcolz.carray(
+                rootdir=self._get_carray_path(sid, 'dt'), mode='r'
+            )[:]
+            self._dts[sid] = dts
+            return dts
+
+    def table_len(self, sid):
+        return len(self._get_dts(sid))
+
+    def get_raw_bars(self, sid):
+        return self._get_dts(sid), dict(
+            (field, self._open_minute_file(field, sid)[:])
+            for field in self.FIELDS
+        )
+
+    def get_value(self, sid, dt, field):
+        if dt < self.first_trading_day or dt > self.last_available_dt:
+            raise NoDataOnDate()
+
+        dts = self._get_dts(sid)
+        minute = dt.value // NANOS_IN_MINUTE
+
+        pos = np.searchsorted(dts, minute)
+        if pos < len(dts) and dts[pos] == minute:
+            value = self._open_minute_file(field, sid)[pos]
+        else:
+            value = 0
+
+        if value == 0:
+            if field == 'volume':
+                return 0
+            else:
+                return np.nan
+
+        return value * self._ohlc_ratio_inverse_for_sid(sid)
+
+    def get_last_traded_dt(self, asset, dt):
+        dts = self._get_dts(asset.sid)
+        volumes = self._open_minute_file('volume', asset.sid)
+
+        # Walking back one block at a time to avoid decompressing the
+        # whole volume column.
+        end_pos = np.searchsorted(dts, dt.value // NANOS_IN_MINUTE, 'right')
+        while end_pos > 0:
+            start_pos = max(0, end_pos - self._minutes_per_day)
+            traded = np.flatnonzero(volumes[start_pos:end_pos])
+            if len(traded) > 0:
+                return pd.Timestamp(
+                    dts[start_pos + traded[-1]], unit='m', tz='UTC'
                 )
 
+            end_pos = start_pos
+
+        return pd.NaT
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        periods = self._get_periods(start_dt, end_dt)
+        period_values = periods.values.astype('datetime64[m]').astype(
+            np.int64
+        )
+
+        num_periods = len(periods)
+        shape = num_periods, len(sids)
+
+        all_fields = fields[:]
+        if len(all_fields) == 1 and all_fields[0] == 'volume':
+            all_fields.insert(0, 'close')
+
+        inverse_ratios = np.array(
+            [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+            dtype=np.float64,
+        )
+
+        # The stored periods of each sid falling in the window, and their
+        # rows in the output.
+        locations = []
+        for sid in sids:
+            if num_periods == 0:
+                locations.append((0, 0, None))
+                continue
+
+            dts = self._get_dts(sid)
+            start_pos = np.searchsorted(dts, period_values[0])
+            end_pos = np.searchsorted(dts, period_values[-1], 'right')
+            rows = np.searchsorted(period_values, dts[start_pos:end_pos])
+            locations.append((start_pos, end_pos, rows))
+
+        raw = np.zeros(shape, dtype=np.float64)
+
+        mask = None
+        data = []
+        for field in all_fields:
+            raw.fill(0)
+            for i, sid in enumerate(sids):
+                start_pos, end_pos, rows = locations[i]
+                if end_pos > start_pos:
+                    carray = self._open_minute_file(field, sid)
+                    raw[rows, i] = carray[start_pos:end_pos]
+
+            if mask is None:
+                mask = raw != 0
+
             if field in fields:
+                fill_value = 0.0 if field == 'volume' else np.nan
+                out = np.where(mask, raw * inverse_ratios, fill_value)
                 data.append(out)
 
         return data
+
+
+def _mmap_path(rootdir, sid, field):
+    padded_sid = format(sid, '06')
+    return os.path.join(
+        rootdir,
+        padded_sid[0:2],
+        padded_sid[2:4],
+        '{0}.mmap'.format(padded_sid),
+        '{0}.f8'.format(field),
+    )
+
+
+class MmapExchangeBarWriter(BcolzExchangeBarWriter):
+    """
+    Writer storing each sid and field as an uncompressed file of float64
+    values, one per period of the bundle calendar.
+
+    Prices are stored scaled with NaN for the periods which did not trade,
+    volumes are stored with zeros. The position of each period follows
+    from the market opens of the bundle metadata, which acts as the index
+    of all files.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(MmapExchangeBarWriter, self).__init__(*args, **kwargs)
+
+        write_bundle_format(self._rootdir, 'mmap')
+
+        self._first_minute = self._minute_index[0].value // NANOS_IN_MINUTE
+        self._step = 1440 // self._minutes_per_day
+
+    def _file_len(self, sid, field):
+        path = _mmap_path(self._rootdir, sid, field)
+        if not os.path.exists(path):
+            return 0
+
+        return os.path.getsize(path) // 8
+
+    def last_date_in_output_for_sid(self, sid):
+        length = self._file_len(sid, 'close')
+        if length == 0:
+            return pd.NaT
+
+        last_minute = self._first_minute + (length - 1) * self._step
+        return pd.Timestamp(last_minute, unit='m', tz='UTC').floor('1D')
+
+    def pad(self, sid, date):
+        # Missing periods are filled when appending the next values.
+        pass
+
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+        dt_values = dts.astype('datetime64[m]').astype(np.int64)
+        self._write_values(sid, dt_values, cols)
+
+    def write_raw(self, sid, dts, cols):
+        """
+        Append values scaled by the ohlc ratio of the sid.
+
+        Parameters
+        ----------
+        sid: int
+        dts: np.ndarray[int64]
+            The periods in minutes since the epoch, strictly increasing.
+        cols: dict[str, np.ndarray[uint64]]
+
+        """
+        inverse_ratio = 1.0 / self.ohlc_ratio_for_sid(sid)
+        self._write_values(sid, dts, dict(
+            (name, cols[name] * inverse_ratio) for name in self.COL_NAMES
+        ))
+
+    def _write_values(self, sid, dts, cols):
+        if len(dts) == 0:
+            return
+
+        positions = (dts - self._first_minute) // self._step
+        if positions[0] < 0:
+            raise ValueError(
+                'sid={0} has values before the first session of the '
+                'bundle: {1}'.format(
+                    sid, pd.Timestamp(dts[0], unit='m', tz='UTC')
+                )
+            )
+
+        length = self._file_len(sid, 'close')
+        if positions[-1] < length:
+            raise BcolzMinuteOverlappingData(
+                'Data for sid={0} already includes input end={1}'.format(
+                    sid, pd.Timestamp(dts[-1], unit='m', tz='UTC')
+                )
+            )
+
+        new_rows = positions >= length
+        rows = positions[new_rows] - length
+
+        folder = os.path.dirname(_mmap_path(self._rootdir, sid, 'close'))
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        for name in self.COL_NAMES:
+            values = np.asarray(cols[name], dtype=np.float64)[new_rows]
+            if name == 'volume':
+                block = np.zeros(positions[-1] + 1 - length, dtype='<f8')
+                block[rows] = np.nan_to_num(values)
+            else:
+                block = np.full(
+                    positions[-1] + 1 - length, np.nan, dtype='<f8'
+                )
+                values[values == 0] = np.nan
+                block[rows] = values
+
+            with open(_mmap_path(self._rootdir, sid, name), 'ab') as f:
+                block.tofile(f)
+
+
+class MmapExchangeBarReader(BcolzExchangeBarReader):
+    """
+    Reader for data written by MmapExchangeBarWriter.
+
+    Files are memory-mapped read-only: concurrent processes reading the
+    same bundle share the page cache instead of decompressing their own
+    copy. Single sid windows fully covered by the data are returned as
+    read-only views into the mapped files.
+    """
+
+    def __init__(self, *args, **kwargs):
+        sid_cache_size = kwargs.get('sid_cache_size', 1000)
+        super(MmapExchangeBarReader, self).__init__(*args, **kwargs)
+
+        self._first_minute = self._market_open_values[0]
+        self._step = 1440 // self._minutes_per_day
+        self._mmaps = dict(
+            (field, LRU(sid_cache_size)) for field in self.FIELDS
+        )
+
+    def _open_mmap(self, field, sid):
+        sid = int(sid)
+        try:
+            return self._mmaps[field][sid]
+
+        except KeyError:
+            path = _mmap_path(self._rootdir, sid, field)
+            if os.path.getsize(path) == 0:
+                values = np.empty(0, dtype='<f8')
+            else:
+                values = np.memmap(path, dtype='<f8', mode='r')
+
+            self._mmaps[field][sid] = values
+            return values
+
+    def _position_of(self, dt):
+        return (dt.value // NANOS_IN_MINUTE - self._first_minute) \
+            // self._step
+
+    def table_len(self, sid):
+        return len(self._open_mmap('close', sid))
+
+    def get_raw_bars(self, sid):
+        ratio = 1.0 / self._ohlc_ratio_inverse_for_sid(sid)
+
+        cols = dict()
+        traded = None
+        for field in self.FIELDS:
+            values = np.nan_to_num(self._open_mmap(field, sid))
+            if traded is None:
+                traded = np.zeros(len(values), dtype=bool)
+
+            traded |= values != 0
+            cols[field] = values
+
+        positions = np.flatnonzero(traded)
+        dts = self._first_minute + positions * self._step
+
+        return dts, dict(
+            (field, np.round(cols[field][positions] * ratio).astype(
+                np.uint64))
+            for field in self.FIELDS
+        )
+
+    def get_value(self, sid, dt, field):
+        if dt < self.first_trading_day or dt > self.last_available_dt:
+            raise NoDataOnDate()
+
+        values = self._open_mmap(field, sid)
+        pos = self._position_of(dt)
+        if pos >= len(values):
+            return 0 if field == 'volume' else np.nan
+
+        return float(values[pos])
+
+    def get_last_traded_dt(self, asset, dt):
+        volumes = self._open_mmap('volume', asset.sid)
+
+        end_pos = min(self._position_of(dt) + 1, len(volumes))
+        while end_pos > 0:
+            start_pos = max(0, end_pos - self._minutes_per_day)
+            traded = np.flatnonzero(volumes[start_pos:end_pos])
+            if len(traded) > 0:
+                minute = self._first_minute \
+                    + (start_pos + traded[-1]) * self._step
+                return pd.Timestamp(minute, unit='m', tz='UTC')
+
+            end_pos = start_pos
+
+        return pd.NaT
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        periods = self._get_periods(start_dt, end_dt)
+        num_periods = len(periods)
+        shape = num_periods, len(sids)
+
+        start_pos = self._position_of(periods[0]) if num_periods > 0 else 0
+        end_pos = start_pos + num_periods
+
+        data = []
+        for field in fields:
+            if len(sids) == 1 and num_periods > 0:
+                values = self._open_mmap(field, sids[0])
+                if start_pos >= 0 and end_pos <= len(values):
+                    data.append(
+                        values[start_pos:end_pos].reshape(num_periods, 1)
+                    )
+                    continue
+
+            fill_value = 0.0 if field == 'volume' else np.nan
+            out = np.full(shape, fill_value)
+            for i, sid in enumerate(sids):
+                values = self._open_mmap(field, sid)
+
+                first = max(start_pos, 0)
+                last = min(end_pos, len(values))
+                if last > first:
+                    out[first - start_pos:last - start_pos, i] = \
+                        values[first:last]
+
+            data.append(out)
+
+        return data
+
+
+BUNDLE_READERS = dict(
+    bcolz=BcolzExchangeBarReader,
+    sparse=BcolzExchangeSparseBarReader,
+    mmap=MmapExchangeBarReader,
+)
+
+BUNDLE_WRITERS = dict(
+    bcolz=BcolzExchangeBarWriter,
+    sparse=BcolzExchangeSparseBarWriter,
+    mmap=MmapExchangeBarWriter,
+)
+
+
+def convert_bundle(reader, writer, sids, show_progress=False):
+    """
+    Copy the raw values of each sid from a bundle reader to a writer of
+    another storage format.
+
+    Parameters
+    ----------
+    reader: BcolzExchangeBarReader
+    writer: BcolzExchangeBarWriter
+    sids: list[int]
+    show_progress: bool
+
+    """
+    with maybe_show_progress(
+            sids,
+            show_progress,
+            label='Converting bundle to {}'.format(
+                writer.__class__.__name__)) as it:
+        for sid in it:
+            dts, cols = reader.get_raw_bars(sid)
+            writer.write_raw(sid, dts, cols)
+
+            if len(dts) > 0:
+                writer.coverage.add_minutes(sid, dts[0], dts[-1])
+
+    writer.coverage.save()
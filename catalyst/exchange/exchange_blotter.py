@@ -1,7 +1,10 @@
+from collections import defaultdict
+
 import pandas as pd
 from catalyst.assets._assets import TradingPair
 from logbook import Logger
 from redo import retry
+from six import iteritems, itervalues
 
 from catalyst.constants import LOG_LEVEL
 from catalyst.exchange.exchange_errors import ExchangeRequestError
@@ -151,6 +154,10 @@ class ExchangeBlotter(Blotter):
             TradingPair: TradingPairFeeSchedule()
         }
 
+        # The cost of the amount filled so far of the partially filled
+        # orders, used to price each new fill
+        self._filled_costs = dict()
+
     def exchange_order(self, asset, amount, style=None):
         exchange = self.exchanges[asset.exchange]
         return exchange.order(
@@ -188,51 +195,52 @@ class ExchangeBlotter(Blotter):
     def check_open_orders(self):
         """
         Loop through the list of open orders in the Portfolio object.
-        For each executed order found, create a transaction and apply to the
-        Portfolio.
+        For each order filled since the previous check, create a
+        transaction of the amount filled and apply to the Portfolio.
+
+        The state of the open orders of each exchange is requested at
+        once before any order is updated.
 
         Returns
         -------
-        list[Transaction]
+        list[tuple[Order, Transaction]]
+            The updated orders, the transaction being None when nothing
+            was filled.
 
         """
+        exchange_orders = defaultdict(list)
         for asset in self.open_orders:
-            exchange = self.exchanges[asset.exchange]
-
             for order in self.open_orders[asset]:
                 log.debug('found open order: {}'.format(order.id))
-
-                new_order, executed_price = exchange.get_order(order.id, asset)
+                exchange_orders[asset.exchange].append(order)
+
+        updates = dict()
+        for exchange_name, orders in iteritems(exchange_orders):
+            exchange = self.exchanges[exchange_name]
+            updates.update(exchange.market.get_orders(
+                [(order.id, order.asset) for order in orders]
+            ))
+
+        results = []
+        for orders in itervalues(exchange_orders):
+            for order in orders:
+                if order.id not in updates:
+                    log.warn('unable to get the state of order {}'.format(
+                        order.id
+                    ))
+                    continue
+
+                new_order, executed_price = updates[order.id]
                 log.debug(
                     'got updated order {} {}'.format(
                         new_order, executed_price
                     )
                 )
-                order.status = new_order.status
-
-                if order.status == ORDER_STATUS.FILLED:
-                    order.commission = new_order.commission
-                    if order.amount != new_order.amount:
-                        log.warn(
-                            'executed order amount {} differs '
-                            'from original'.format(
-                                new_order.amount, order.amount
-                            )
-                        )
-                        order.amount = new_order.amount
-
-                    transaction = Transaction(
-                        asset=order.asset,
-                        amount=order.amount,
-                        dt=pd.Timestamp.utcnow(),
-                        price=executed_price,
-                        order_id=order.id,
-                        commission=order.commission
-                    )
-                    yield order, transaction
-
-                elif order.status == ORDER_STATUS.CANCELLED:
-                    yield order, None
+                transaction = self._update_order(
+                    order, new_order, executed_price
+                )
+                if transaction is not None or not order.open:
+                    results.append((order, transaction))
 
                 else:
                     delta = pd.Timestamp.utcnow() - order.dt
@@ -243,15 +251,126 @@ class ExchangeBlotter(Blotter):
                         )
                     )
 
+        return results
+
+    def _update_order(self, order, new_order, executed_price):
+        """
+        Apply the state of the order on the exchange.
+
+        Parameters
+        ----------
+        order: Order
+        new_order: Order
+        executed_price: float
+            The average price of the amount filled so far.
+
+        Returns
+        -------
+        Transaction
+            The transaction of the amount filled since the previous
+            update, None if nothing was filled.
+
+        """
+        filled = new_order.filled
+        if new_order.status == ORDER_STATUS.FILLED and not filled:
+            # Some exchanges do not report the amount filled
+            filled = new_order.amount
+
+        amount = filled - order.filled
+        last_price = None
+        if amount != 0 and executed_price is None:
+            # Some exchanges report neither the cost nor the price
+            last_price = self._get_last_price(order.asset)
+            if last_price is None:
+                log.warn(
+                    'unable to price the fill of order {}, checking it '
+                    'again on the next bar'.format(order.id)
+                )
+                return None
+
+        order.status = new_order.status
+
+        if order.status == ORDER_STATUS.FILLED:
+            order.commission = new_order.commission
+            if order.amount != new_order.amount:
+                log.warn(
+                    'executed order amount {} differs '
+                    'from original {}'.format(
+                        new_order.amount, order.amount
+                    )
+                )
+                order.amount = new_order.amount
+
+        if amount == 0:
+            return None
+
+        if last_price is not None:
+            price = last_price
+            filled_cost = self._filled_costs.get(
+                order.id, price * order.filled
+            ) + price * amount
+
+        else:
+            # The price of the new fill from the change of the filled
+            # cost, the average price applying to the fills of a restored
+            # order
+            filled_cost = executed_price * filled
+            previous_cost = self._filled_costs.get(
+                order.id, executed_price * order.filled
+            )
+            price = (filled_cost - previous_cost) / amount
+
+        order.filled = filled
+        if order.open:
+            self._filled_costs[order.id] = filled_cost
+
+        else:
+            self._filled_costs.pop(order.id, None)
+
+        return Transaction(
+            asset=order.asset,
+            amount=amount,
+            dt=pd.Timestamp.utcnow(),
+            price=price,
+            order_id=order.id,
+            commission=order.commission if not order.open else None
+        )
+
+    def _get_last_price(self, asset):
+        """
+        The last traded price of the asset, None if unavailable.
+
+        Parameters
+        ----------
+        asset: TradingPair
+
+        Returns
+        -------
+        float
+
+        """
+        exchange = self.exchanges[asset.exchange]
+        try:
+            tickers = exchange.market.tickers([asset])
+
+        except ExchangeRequestError as e:
+            log.warn('unable to fetch the ticker of {}: {}'.format(
+                asset.symbol, e
+            ))
+            return None
+
+        ticker = tickers.get(asset)
+        return ticker['last_price'] if ticker else None
+
     def get_exchange_transactions(self):
         closed_orders = []
         transactions = []
         commissions = []
 
         for order, txn in self.check_open_orders():
-            order.dt = txn.dt
-
-            transactions.append(txn)
+            if txn is not None:
+                order.dt = txn.dt
+                transactions.append(txn)
 
             if not order.open:
                 closed_orders.append(order)
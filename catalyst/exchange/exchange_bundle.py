@@ -1,8 +1,11 @@
 import os
 import shutil
+import time
+from collections import deque
 from datetime import timedelta
 from functools import partial
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 from operator import is_not
 
 import numpy as np
@@ -18,16 +21,17 @@ from catalyst.constants import DATE_TIME_FORMAT, AUTO_INGEST
 from catalyst.constants import LOG_LEVEL
 from catalyst.data.minute_bars import BcolzMinuteOverlappingData, \
     BcolzMinuteBarMetadata
-from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
-    BcolzExchangeBarWriter
+from catalyst.exchange.exchange_bcolz import BUNDLE_READERS, \
+    BUNDLE_WRITERS, COVERAGE_FILENAME, DEFAULT_BUNDLE_FORMAT, \
+    BundleCoverage, get_bundle_format, get_bundle_sids, convert_bundle
 from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
     TempBundleNotFoundError, \
     NoDataAvailableOnExchange, \
     PricingDataNotLoadedError, DataCorruptionError, PricingDataValueError
-from catalyst.exchange.utils.bundle_utils import range_in_bundle, \
-    get_bcolz_chunk, get_month_start_end, \
+from catalyst.exchange.utils.bundle_utils import get_bcolz_chunk, \
+    get_month_start_end, \
     get_year_start_end, get_df_from_arrays, get_start_dt, get_period_label, \
-    get_delta, get_assets
+    get_delta, get_assets, get_folder_size
 from catalyst.exchange.utils.exchange_utils import get_exchange_folder, \
     save_exchange_symbols, mixin_market_params, get_catalyst_symbol
 from catalyst.utils.cli import maybe_show_progress
@@ -43,15 +47,38 @@ def _cachpath(symbol, type_):
 
 
 class ExchangeBundle:
-    def __init__(self, exchange_name):
+    def __init__(self, exchange_name, bundle_format=DEFAULT_BUNDLE_FORMAT):
         self.exchange_name = exchange_name
+        # The storage format of new bundles, existing bundles keep
+        # the format in which they were created.
+        self.bundle_format = bundle_format
         self.minutes_per_day = 1440
         self.default_ohlc_ratio = 1000000
         self._writers = dict()
         self._readers = dict()
+        self._coverages = dict()
         self.calendar = get_calendar('OPEN')
         self.exchange = None
 
+    def get_bundle_path(self, data_frequency):
+        """
+        The path of the main bundle folder for the specified frequency.
+
+        Parameters
+        ----------
+        data_frequency: str
+
+        Returns
+        -------
+        str
+
+        """
+        root = get_exchange_folder(self.exchange_name)
+        return BUNDLE_NAME_TEMPLATE.format(
+            root=root,
+            frequency=data_frequency
+        )
+
     def get_reader(self, data_frequency, path=None):
         """
         Get a data writer object, either a new object or from cache
@@ -62,17 +89,14 @@ class ExchangeBundle:
 
         """
         if path is None:
-            root = get_exchange_folder(self.exchange_name)
-            path = BUNDLE_NAME_TEMPLATE.format(
-                root=root,
-                frequency=data_frequency
-            )
+            path = self.get_bundle_path(data_frequency)
 
         if path in self._readers and self._readers[path] is not None:
             return self._readers[path]
 
         try:
-            self._readers[path] = BcolzExchangeBarReader(
+            reader_class = BUNDLE_READERS[get_bundle_format(path)]
+            self._readers[path] = reader_class(
                 rootdir=path,
                 data_frequency=data_frequency
             )
@@ -81,6 +105,42 @@ class ExchangeBundle:
 
         return self._readers[path]
 
+    def get_coverage(self, data_frequency):
+        """
+        The ranges of periods ingested in the main bundle.
+
+        Bundles written before the coverage was tracked are indexed
+        from their data the first time.
+
+        Parameters
+        ----------
+        data_frequency: str
+
+        Returns
+        -------
+        BundleCoverage
+
+        """
+        path = self.get_bundle_path(data_frequency)
+        if path in self._writers:
+            return self._writers[path].coverage
+
+        coverage = self._coverages.get(path)
+        if coverage is not None:
+            coverage.refresh()
+            return coverage
+
+        coverage = BundleCoverage(path, data_frequency)
+        if not coverage.exists:
+            reader = self.get_reader(data_frequency)
+            if reader is not None:
+                log.info('indexing the coverage of bundle: {}'.format(path))
+                coverage.build(reader, get_bundle_sids(path))
+                coverage.save()
+
+        self._coverages[path] = coverage
+        return coverage
+
     def update_metadata(self, writer, start_dt, end_dt):
         pass
 
@@ -93,11 +153,7 @@ class ExchangeBundle:
         BcolzMinuteBarWriter | BcolzDailyBarWriter
 
         """
-        root = get_exchange_folder(self.exchange_name)
-        path = BUNDLE_NAME_TEMPLATE.format(
-            root=root,
-            frequency=data_frequency
-        )
+        path = self.get_bundle_path(data_frequency)
 
         if path in self._writers:
             return self._writers[path]
@@ -105,6 +161,11 @@ class ExchangeBundle:
         ensure_directory(path)
 
         if len(os.listdir(path)) > 0:
+            writer_class = BUNDLE_WRITERS[get_bundle_format(path)]
+
+            # Index the existing data before the writer tracks new data
+            self.get_coverage(data_frequency)
+            self._coverages.pop(path, None)
 
             metadata = BcolzMinuteBarMetadata.read(path)
 
@@ -123,7 +184,7 @@ class ExchangeBundle:
                 end_session = metadata.end_session
 
             self._writers[path] = \
-                BcolzExchangeBarWriter(
+                writer_class(
                     rootdir=path,
                     start_session=start_session,
                     end_session=end_session,
@@ -131,7 +192,8 @@ class ExchangeBundle:
                     data_frequency=data_frequency
                 )
         else:
-            self._writers[path] = BcolzExchangeBarWriter(
+            writer_class = BUNDLE_WRITERS[self.bundle_format]
+            self._writers[path] = writer_class(
                 rootdir=path,
                 start_session=start_dt,
                 end_session=end_dt,
@@ -143,8 +205,8 @@ class ExchangeBundle:
 
     def filter_existing_assets(self, assets, start_dt, end_dt, data_frequency):
         """
-        For each asset, get the close on the start and end dates of the chunk.
-            If the data exists, the chunk ingestion is complete.
+        For each asset, check the coverage of the chunk in the bundle.
+            If the whole chunk was ingested, the ingestion is complete.
             If any data is missing we ingest the data.
 
         Parameters
@@ -162,15 +224,12 @@ class ExchangeBundle:
         list[TradingPair]
             The assets missing from the bundle
         """
-        reader = self.get_reader(data_frequency)
-        missing_assets = []
-        for asset in assets:
-            has_data = range_in_bundle(asset, start_dt, end_dt, reader)
-
-            if not has_data:
-                missing_assets.append(asset)
+        coverage = self.get_coverage(data_frequency)
+        missing_ranges = coverage.get_missing_ranges(
+            [asset.sid for asset in assets], start_dt, end_dt
+        )
 
-        return missing_assets
+        return [asset for asset in assets if asset.sid in missing_ranges]
 
     def _write(self, data, writer, data_frequency):
         try:
@@ -332,32 +391,26 @@ class ExchangeBundle:
 
         return problems
 
-    def ingest_ctable(self, asset, data_frequency, period,
-                      writer, empty_rows_behavior='strip',
-                      duplicates_threshold=100, cleanup=False):
+    def read_ctable(self, asset, data_frequency, period):
         """
-        Merge a ctable bundle chunk into the main bundle for the exchange.
+        Download, extract and decode a ctable bundle chunk.
+
+        This is the part of the ingestion which does not touch the main
+        bundle, it can safely run concurrently with other chunks.
 
         Parameters
         ----------
         asset: TradingPair
         data_frequency: str
         period: str
-        writer:
-        empty_rows_behavior: str
-            Ensure that the bundle does not have any missing data.
-
-        cleanup: bool
-            Remove the temp bundle directory after ingestion.
 
         Returns
         -------
-        list[str]
-            A list of problems which occurred during ingestion.
+        dict[str, Object]
+            The chunk content: asset, period, path, df and nbytes. The df
+            is None if no price data could be read from the chunk.
 
         """
-        problems = []
-
         # Download and extract the bundle
         path = get_bcolz_chunk(
             exchange_name=self.exchange_name,
@@ -397,30 +450,160 @@ class ExchangeBundle:
                 asset.symbol, start_dt, end_dt, e
             ))
 
-        if not arrays:
-            return reader._rootdir
+        df = None
+        if arrays:
+            periods = self.get_calendar_periods_range(
+                start_dt, end_dt, data_frequency
+            )
+            df = get_df_from_arrays(arrays, periods)
 
-        periods = self.get_calendar_periods_range(
-            start_dt, end_dt, data_frequency
+        # The reader is only needed to decode this chunk
+        self._readers.pop(path, None)
+
+        return dict(
+            asset=asset,
+            period=period,
+            path=reader._rootdir,
+            df=df,
+            nbytes=get_folder_size(reader._rootdir),
         )
-        df = get_df_from_arrays(arrays, periods)
-        problems += self.ingest_df(
-            ohlcv_df=df,
+
+    def write_ctable(self, ctable, data_frequency, writer,
+                     empty_rows_behavior='strip', duplicates_threshold=100,
+                     cleanup=False):
+        """
+        Write a chunk decoded by `read_ctable` into the main bundle.
+
+        Parameters
+        ----------
+        ctable: dict[str, Object]
+        data_frequency: str
+        writer:
+        empty_rows_behavior: str
+        duplicates_threshold: int
+        cleanup: bool
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        if ctable['df'] is None:
+            return []
+
+        problems = self.ingest_df(
+            ohlcv_df=ctable['df'],
             data_frequency=data_frequency,
-            asset=asset,
+            asset=ctable['asset'],
             writer=writer,
             empty_rows_behavior=empty_rows_behavior,
             duplicates_threshold=duplicates_threshold
         )
 
+        # The empty rows stripped from the chunk were ingested as well,
+        # the coverage spans the whole period of the chunk
+        try:
+            start_dt, end_dt = self.get_chunk_range(
+                ctable['asset'], ctable['period'], data_frequency
+            )
+        except NoDataAvailableOnExchange as e:
+            log.debug('chunk outside of the asset bounds: {}'.format(e))
+
+        else:
+            # The writer is replaced in the cache when a write is retried
+            coverage = self._writers.get(writer._rootdir, writer).coverage
+            coverage.add(ctable['asset'].sid, start_dt, end_dt)
+            coverage.save()
+
         if cleanup:
             log.debug(
                 'removing bundle folder following ingestion: {}'.format(
-                    reader._rootdir)
+                    ctable['path'])
             )
-            shutil.rmtree(reader._rootdir)
+            shutil.rmtree(ctable['path'])
 
-        return filter(partial(is_not, None), problems)
+        return [problem for problem in problems if problem is not None]
+
+    def ingest_ctable(self, asset, data_frequency, period,
+                      writer, empty_rows_behavior='strip',
+                      duplicates_threshold=100, cleanup=False):
+        """
+        Merge a ctable bundle chunk into the main bundle for the exchange.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        period: str
+        writer:
+        empty_rows_behavior: str
+            Ensure that the bundle does not have any missing data.
+
+        cleanup: bool
+            Remove the temp bundle directory after ingestion.
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        ctable = self.read_ctable(asset, data_frequency, period)
+
+        return self.write_ctable(
+            ctable=ctable,
+            data_frequency=data_frequency,
+            writer=writer,
+            empty_rows_behavior=empty_rows_behavior,
+            duplicates_threshold=duplicates_threshold,
+            cleanup=cleanup
+        )
+
+    def iter_ctables(self, chunks, data_frequency, jobs=1):
+        """
+        Read the chunks with a pool of workers, yielding them in order.
+
+        The number of chunks decoded ahead of the consumer is bounded to
+        keep the memory footprint under control while the writer catches up.
+
+        Parameters
+        ----------
+        chunks: list[dict[str, Object]]
+        data_frequency: str
+        jobs: int
+            The number of download / extract / decode workers.
+
+        Returns
+        -------
+        iterator[dict[str, Object]]
+
+        """
+        if jobs <= 1:
+            for chunk in chunks:
+                yield self.read_ctable(
+                    chunk['asset'], data_frequency, chunk['period']
+                )
+            return
+
+        max_pending = jobs * 2
+        pool = ThreadPool(jobs)
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.apply_async(
+                    self.read_ctable,
+                    (chunk['asset'], data_frequency, chunk['period']),
+                ))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().get()
+
+            while pending:
+                yield pending.popleft().get()
+
+        finally:
+            pool.terminate()
+            pool.join()
 
     def get_adj_dates(self, start, end, assets, data_frequency):
         """
@@ -475,6 +658,32 @@ class ExchangeBundle:
 
         return start, end
 
+    def get_chunk_range(self, asset, period, data_frequency):
+        """
+        The date range of a chunk contained to the trading availability
+        of its asset.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        period: str
+        data_frequency: str
+
+        Returns
+        -------
+        pd.Timestamp, pd.Timestamp
+
+        """
+        get_start_end = get_month_start_end \
+            if data_frequency == 'minute' else get_year_start_end
+
+        period_start, period_end = get_start_end(
+            pd.to_datetime(period, utc=True)
+        )
+        return self.get_adj_dates(
+            period_start, period_end, [asset], data_frequency
+        )
+
     def prepare_chunks(self, assets, data_frequency, start_dt, end_dt):
         """
         Split a price data request into chunks corresponding to individual
@@ -495,8 +704,8 @@ class ExchangeBundle:
         get_start_end = get_month_start_end \
             if data_frequency == 'minute' else get_year_start_end
 
-        # Get a reader for the main bundle to verify if data exists
-        reader = self.get_reader(data_frequency)
+        # The coverage of the main bundle to verify if data exists
+        coverage = self.get_coverage(data_frequency)
 
         chunks = dict()
         for asset in assets:
@@ -540,8 +749,8 @@ class ExchangeBundle:
                 # Checking if the data already exists in the bundle
                 # for the date range of the chunk. If not, we create
                 # a chunk for ingestion.
-                has_data = range_in_bundle(
-                    asset, range_start, period_end, reader
+                has_data = coverage.covers(
+                    asset.sid, range_start, period_end
                 )
                 if not has_data:
                     period = get_period_label(dt, data_frequency)
@@ -560,7 +769,7 @@ class ExchangeBundle:
 
     def ingest_assets(self, assets, data_frequency, start_dt=None, end_dt=None,
                       show_progress=False, show_breakdown=False,
-                      show_report=False):
+                      show_report=False, jobs=1):
         """
         Determine if data is missing from the bundle and attempt to ingest it.
 
@@ -572,6 +781,10 @@ class ExchangeBundle:
         end_dt: pd.Timestamp
         show_progress: bool
         show_breakdown: bool
+        show_report: bool
+        jobs: int
+            The number of workers downloading and decoding chunks while
+            the main bundle is being written.
 
         """
         if start_dt is None:
@@ -598,26 +811,18 @@ class ExchangeBundle:
         # This is the common writer for the entire exchange bundle
         # we want to give an end_date far in time
         writer = self.get_writer(start_dt, end_dt, data_frequency)
+
         if show_breakdown:
+            chunk_groups = []
             for asset in chunks:
-                with maybe_show_progress(
-                        chunks[asset],
-                        show_progress,
-                        label='Ingesting {frequency} price data for '
-                              '{symbol} on {exchange}'.format(
+                label = 'Ingesting {frequency} price data for ' \
+                        '{symbol} on {exchange}'.format(
                             exchange=self.exchange_name,
                             frequency=data_frequency,
                             symbol=asset.symbol
-                        )) as it:
-                    for chunk in it:
-                        problems += self.ingest_ctable(
-                            asset=chunk['asset'],
-                            data_frequency=data_frequency,
-                            period=chunk['period'],
-                            writer=writer,
-                            empty_rows_behavior='strip',
-                            cleanup=True
                         )
+                chunk_groups.append((chunks[asset], label))
+
         else:
             all_chunks = list(chain.from_iterable(itervalues(chunks)))
 
@@ -625,54 +830,70 @@ class ExchangeBundle:
             all_chunks.sort(
                 key=lambda chunk: pd.to_datetime(chunk['period'])
             )
+            label = 'Ingesting {frequency} price data on ' \
+                    '{exchange}'.format(
+                        exchange=self.exchange_name,
+                        frequency=data_frequency,
+                    )
+            chunk_groups = [(all_chunks, label)]
+
+        num_chunks = 0
+        num_bytes = 0
+        start_time = time.time()
+        for group_chunks, label in chunk_groups:
+            ctables = self.iter_ctables(group_chunks, data_frequency, jobs)
             with maybe_show_progress(
-                    all_chunks,
+                    ctables,
                     show_progress,
-                    label='Ingesting {frequency} price data on '
-                          '{exchange}'.format(
-                            exchange=self.exchange_name,
-                            frequency=data_frequency,
-                    )) as it:
-                for chunk in it:
-                    problems += self.ingest_ctable(
-                        asset=chunk['asset'],
+                    length=len(group_chunks),
+                    label=label) as it:
+                for ctable in it:
+                    problems += self.write_ctable(
+                        ctable=ctable,
                         data_frequency=data_frequency,
-                        period=chunk['period'],
                         writer=writer,
                         empty_rows_behavior='strip',
                         cleanup=True
                     )
+                    num_chunks += 1
+                    num_bytes += ctable['nbytes']
+
+        if num_chunks > 0:
+            elapsed = max(time.time() - start_time, 1e-6)
+            log.info(
+                'ingested {chunks} chunks ({bytes} bytes) in {elapsed:.1f}s '
+                'with {jobs} job(s): {chunks_rate:.2f} chunks/s, '
+                '{bytes_rate:.0f} bytes/s'.format(
+                    chunks=num_chunks,
+                    bytes=num_bytes,
+                    elapsed=elapsed,
+                    jobs=jobs,
+                    chunks_rate=num_chunks / elapsed,
+                    bytes_rate=num_bytes / elapsed,
+                )
+            )
 
         if show_report and len(problems) > 0:
             log.info('problems during ingestion:{}\n'.format(
                 '\n'.join(problems)
             ))
 
-    def ingest_csv(self, path, data_frequency, empty_rows_behavior='strip',
-                   duplicates_threshold=100):
+    def _read_csv(self, path, chunksize=None):
         """
-        Ingest price data from a CSV file.
+        Read a CSV file of price data.
 
         Parameters
         ----------
         path: str
-        data_frequency: str
+        chunksize: int, optional
+            Return an iterator of DataFrames of at most this number of rows.
 
         Returns
         -------
-        list[str]
-            A list of potential problems detected during ingestion.
+        DataFrame | TextFileReader
 
         """
-        log.info('ingesting csv file: {}'.format(path))
-
-        if self.exchange is None:
-            # Avoid circular dependencies
-            from catalyst.exchange.utils.factory import get_exchange
-            self.exchange = get_exchange(self.exchange_name)
-
-        problems = []
-        df = pd.read_csv(
+        return pd.read_csv(
             path,
             header=0,
             sep=',',
@@ -686,22 +907,32 @@ class ExchangeBundle:
                 volume=np.float64
             ),
             parse_dates=['last_traded'],
-            index_col=None
+            index_col=None,
+            chunksize=chunksize,
         )
-        min_start_dt = None
-        max_end_dt = None
 
-        symbols = df['symbol'].unique()
+    def _create_csv_assets(self, symbol_dates, data_frequency):
+        """
+        Create and save the local assets of the symbols of a CSV file.
 
-        # Apply the timezone before creating an index for simplicity
-        df['last_traded'] = df['last_traded'].dt.tz_localize(pytz.UTC)
-        df.set_index(['symbol', 'last_traded'], drop=True, inplace=True)
+        Parameters
+        ----------
+        symbol_dates: dict[str, tuple[pd.Timestamp, pd.Timestamp]]
+            The first and last date of each symbol in the file.
+        data_frequency: str
+
+        Returns
+        -------
+        dict[str, TradingPair]
+            The assets by CSV symbol.
+
+        """
+        end_dt_key = 'end_{}'.format(data_frequency)
 
         assets = dict()
-        for symbol in symbols:
-            start_dt = df.index.get_level_values(1).min()
-            end_dt = df.index.get_level_values(1).max()
-            end_dt_key = 'end_{}'.format(data_frequency)
+        market_assets = dict()
+        for symbol in symbol_dates:
+            start_dt, end_dt = symbol_dates[symbol]
 
             market = self.exchange.get_market(symbol)
             if market is None:
@@ -738,55 +969,153 @@ class ExchangeBundle:
                 params['end_minute'] = end_dt \
                     if data_frequency == 'minute' else 'N/A'
 
-            if min_start_dt is None or start_dt < min_start_dt:
-                min_start_dt = start_dt
+            asset = TradingPair(**params)
+            assets[symbol] = asset
+            market_assets[market['id']] = asset
 
-            if max_end_dt is None or end_dt > max_end_dt:
-                max_end_dt = end_dt
+        save_exchange_symbols(self.exchange_name, market_assets, True)
+        return assets
 
-            asset = TradingPair(**params)
-            assets[market['id']] = asset
+    def ingest_csv(self, path, data_frequency, empty_rows_behavior='strip',
+                   duplicates_threshold=100, chunksize=None):
+        """
+        Ingest price data from a CSV file.
+
+        Parameters
+        ----------
+        path: str
+        data_frequency: str
+        empty_rows_behavior: str
+        duplicates_threshold: int
+        chunksize: int, optional
+            Stream the file by chunks of this number of rows instead of
+            loading it in memory. The rows of each symbol must then be
+            sorted by date.
+
+        Returns
+        -------
+        list[str]
+            A list of potential problems detected during ingestion.
+
+        """
+        log.info('ingesting csv file: {}'.format(path))
+
+        if self.exchange is None:
+            # Avoid circular dependencies
+            from catalyst.exchange.utils.factory import get_exchange
+            self.exchange = get_exchange(self.exchange_name)
+
+        if chunksize is None:
+            df = self._read_csv(path)
+
+            def get_chunks():
+                return [df]
+
+        else:
+            def get_chunks():
+                return self._read_csv(path, chunksize)
+
+        # First pass: the date bounds of each symbol
+        symbol_dates = dict()
+        for chunk in get_chunks():
+            bounds = chunk.groupby('symbol')['last_traded'].agg(
+                ['min', 'max']
+            )
+            for symbol, row in bounds.iterrows():
+                start_dt = row['min'].tz_localize(pytz.UTC)
+                end_dt = row['max'].tz_localize(pytz.UTC)
+
+                if symbol in symbol_dates:
+                    start_dt = min(start_dt, symbol_dates[symbol][0])
+                    end_dt = max(end_dt, symbol_dates[symbol][1])
+
+                symbol_dates[symbol] = (start_dt, end_dt)
+
+        if not symbol_dates:
+            log.warn('no price data found in csv file: {}'.format(path))
+            return []
 
-        save_exchange_symbols(self.exchange_name, assets, True)
+        assets = self._create_csv_assets(symbol_dates, data_frequency)
 
         writer = self.get_writer(
-            start_dt=min_start_dt.replace(hour=00, minute=00),
-            end_dt=max_end_dt.replace(hour=23, minute=59),
+            start_dt=min(
+                [dates[0] for dates in itervalues(symbol_dates)]
+            ).replace(hour=00, minute=00),
+            end_dt=max(
+                [dates[1] for dates in itervalues(symbol_dates)]
+            ).replace(hour=23, minute=59),
             data_frequency=data_frequency
         )
 
-        for symbol in assets:
-            # here the symbol is the market['id']
-            asset = assets[symbol]
-            ohlcv_df = df.loc[
-                (df.index.get_level_values(0) == asset.symbol)
-            ]  # type: pd.DataFrame
-            ohlcv_df.index = ohlcv_df.index.droplevel(0)
+        # Second pass: write the data of each symbol as it comes. Only
+        # the last row of each symbol is kept between chunks to fill the
+        # periods following it.
+        delta = get_delta(1, data_frequency)
+        last_rows = dict()
+        problems = []
+
+        def ingest_symbol_df(symbol, symbol_df, end_dt):
+            if symbol in last_rows:
+                start_dt = last_rows[symbol].index[-1] + delta
+                symbol_df = pd.concat([last_rows[symbol], symbol_df])
+
+            else:
+                start_dt = symbol_dates[symbol][0].replace(hour=00, minute=00)
 
-            period_start = start_dt.replace(hour=00, minute=00)
-            period_end = end_dt.replace(hour=23, minute=59)
             periods = self.get_calendar_periods_range(
-                period_start, period_end, data_frequency
+                start_dt, end_dt, data_frequency
             )
+            if len(periods) == 0:
+                return
+
+            last_rows[symbol] = symbol_df.iloc[-1:]
 
             # We're not really resampling but ensuring that each frame
             # contains data
-            ohlcv_df = ohlcv_df.reindex(periods, method='ffill')
+            ohlcv_df = symbol_df.reindex(periods, method='ffill')
             ohlcv_df['volume'] = ohlcv_df['volume'].fillna(0)
 
-            problems += self.ingest_df(
+            problems.extend(self.ingest_df(
                 ohlcv_df=ohlcv_df,
                 data_frequency=data_frequency,
-                asset=asset,
+                asset=assets[symbol],
                 writer=writer,
                 empty_rows_behavior=empty_rows_behavior,
                 duplicates_threshold=duplicates_threshold
+            ))
+
+        for chunk in get_chunks():
+            chunk['last_traded'] = \
+                chunk['last_traded'].dt.tz_localize(pytz.UTC)
+
+            for symbol, symbol_df in chunk.groupby('symbol', sort=False):
+                symbol_df = symbol_df.set_index('last_traded', drop=True) \
+                    .drop('symbol', axis=1) \
+                    .sort_index()
+
+                if symbol in last_rows \
+                        and symbol_df.index[0] <= last_rows[symbol].index[-1]:
+                    raise ValueError(
+                        'the rows of {} are not sorted by date, they '
+                        'cannot be ingested by chunks.'.format(symbol)
+                    )
+
+                ingest_symbol_df(symbol, symbol_df, symbol_df.index[-1])
+
+        for symbol in symbol_dates:
+            # Fill the last day of each symbol
+            ingest_symbol_df(
+                symbol,
+                symbol_df=last_rows[symbol].iloc[0:0],
+                end_dt=symbol_dates[symbol][1].replace(hour=23, minute=59)
             )
+
         return filter(partial(is_not, None), problems)
 
     def ingest(self, data_frequency, include_symbols=None,
                exclude_symbols=None, start=None, end=None, csv=None,
-               show_progress=True, show_breakdown=True, show_report=True):
+               show_progress=True, show_breakdown=True, show_report=True,
+               jobs=1, csv_chunksize=None):
         """
         Inject data based on specified parameters.
 
@@ -798,11 +1127,16 @@ class ExchangeBundle:
         start: pd.Timestamp
         end: pd.Timestamp
         show_progress: bool
-        environ:
+        show_breakdown: bool
+        show_report: bool
+        jobs: int
+            The number of parallel chunk download / decode workers.
+        csv_chunksize: int
+            Stream the csv file by chunks of this number of rows.
 
         """
         if csv is not None:
-            self.ingest_csv(csv, data_frequency)
+            self.ingest_csv(csv, data_frequency, chunksize=csv_chunksize)
 
         else:
             if self.exchange is None:
@@ -821,7 +1155,8 @@ class ExchangeBundle:
                     end_dt=end,
                     show_progress=show_progress,
                     show_breakdown=show_breakdown,
-                    show_report=show_report
+                    show_report=show_report,
+                    jobs=jobs
                 )
 
     def get_history_window_series_and_load(self,
@@ -995,14 +1330,9 @@ class ExchangeBundle:
                 end_dt=end_dt
             )
 
-        series = dict()
+        coverage = self.get_coverage(data_frequency)
         for asset in assets:
-            asset_start_dt, _ = self.get_adj_dates(
-                start_dt, end_dt, assets, data_frequency
-            )
-            in_bundle = range_in_bundle(
-                asset, asset_start_dt, end_dt, reader
-            )
+            in_bundle = coverage.covers(asset.sid, start_dt, end_dt)
             if not in_bundle:
                 raise PricingDataNotLoadedError(
                     field=field,
@@ -1011,33 +1341,32 @@ class ExchangeBundle:
                     symbols=asset.symbol,
                     symbol_list=asset.symbol,
                     data_frequency=data_frequency,
-                    start_dt=asset_start_dt,
+                    start_dt=start_dt,
                     end_dt=end_dt
                 )
 
-            periods = self.get_calendar_periods_range(
-                asset_start_dt, end_dt, data_frequency
-            )
-            # This does not behave well when requesting multiple assets
-            # when the start or end date of one asset is outside of the range
-            # looking at the logic in load_raw_arrays(), we are not achieving
-            # any performance gain by requesting multiple sids at once. It's
-            # looping through the sids and making separate requests anyway.
-            arrays = reader.load_raw_arrays(
-                sids=[asset.sid],
-                fields=[field],
+        periods = self.get_calendar_periods_range(
+            start_dt, end_dt, data_frequency
+        )
+        # All assets share the same adjusted date range, their values are
+        # read in a single batch.
+        arrays = reader.load_raw_arrays(
+            sids=[asset.sid for asset in assets],
+            fields=[field],
+            start_dt=start_dt,
+            end_dt=end_dt
+        )
+        if len(arrays) == 0:
+            raise DataCorruptionError(
+                exchange=self.exchange_name,
+                symbols=[asset.symbol for asset in assets],
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            if len(arrays) == 0:
-                raise DataCorruptionError(
-                    exchange=self.exchange_name,
-                    symbols=asset.symbol,
-                    start_dt=asset_start_dt,
-                    end_dt=end_dt
-                )
 
-            field_values = arrays[0][:, 0]
+        series = dict()
+        for index, asset in enumerate(assets):
+            field_values = arrays[0][:, index]
 
             try:
                 value_series = pd.Series(field_values, index=periods)
@@ -1046,13 +1375,86 @@ class ExchangeBundle:
                 raise PricingDataValueError(
                     exchange=asset.exchange,
                     symbol=asset.symbol,
-                    start_dt=asset_start_dt,
+                    start_dt=start_dt,
                     end_dt=end_dt,
                     error=e
                 )
 
         return series
 
+    def migrate(self, data_frequency, bundle_format, show_progress=False):
+        """
+        Convert the bundle to the specified storage format.
+
+        The converted bundle is written to a temporary folder which
+        replaces the original one once complete.
+
+        Parameters
+        ----------
+        data_frequency: str
+        bundle_format: str
+        show_progress: bool
+
+        """
+        path = self.get_bundle_path(data_frequency)
+        reader = self.get_reader(data_frequency)
+        if reader is None:
+            log.warn('no {} bundle to migrate for {}'.format(
+                data_frequency, self.exchange_name
+            ))
+            return
+
+        current_format = get_bundle_format(path)
+        if current_format == bundle_format:
+            log.info('the {} bundle of {} already uses the {} format'.format(
+                data_frequency, self.exchange_name, bundle_format
+            ))
+            return
+
+        temp_path = '{}_{}'.format(path, bundle_format)
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path)
+        ensure_directory(temp_path)
+
+        ohlc_ratios_per_sid = None
+        if reader._ohlc_inverses_per_sid is not None:
+            ohlc_ratios_per_sid = dict(
+                (sid, int(round(1.0 / inverse)))
+                for sid, inverse in reader._ohlc_inverses_per_sid.items()
+            )
+
+        writer = BUNDLE_WRITERS[bundle_format](
+            rootdir=temp_path,
+            start_session=reader.first_trading_day,
+            end_session=reader._end_session,
+            write_metadata=True,
+            data_frequency=data_frequency,
+            default_ohlc_ratio=int(round(1.0 / reader._default_ohlc_inverse)),
+            ohlc_ratios_per_sid=ohlc_ratios_per_sid,
+        )
+        log.info('converting {} {} bundle from {} to {} format'.format(
+            self.exchange_name, data_frequency, current_format, bundle_format
+        ))
+        convert_bundle(
+            reader, writer, get_bundle_sids(path), show_progress
+        )
+
+        # Keep the ingested ranges of the original bundle
+        coverage_path = os.path.join(path, COVERAGE_FILENAME)
+        if os.path.isfile(coverage_path):
+            shutil.copy(
+                coverage_path, os.path.join(temp_path, COVERAGE_FILENAME)
+            )
+
+        self._readers.pop(path, None)
+        self._writers.pop(path, None)
+        self._coverages.pop(path, None)
+
+        old_path = '{}_{}'.format(path, current_format)
+        os.rename(path, old_path)
+        os.rename(temp_path, path)
+        shutil.rmtree(old_path)
+
     def clean(self, data_frequency):
         """
         Removing the bundle data from the catalyst folder.
@@ -1094,4 +1496,5 @@ class ExchangeBundle:
                     'removing folder and content: {}'.format(frequency_bundle)
                 )
                 shutil.rmtree(frequency_bundle)
+                self._coverages.pop(frequency_bundle, None)
                 log.debug('{} removed'.format(frequency_bundle))
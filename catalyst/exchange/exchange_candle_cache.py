@@ -0,0 +1,237 @@
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+from logbook import Logger
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.bundle_utils import get_periods
+
+log = Logger('CandleCache', level=LOG_LEVEL)
+
+CANDLE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleBuffer(object):
+    """
+    Rolling buffer of the most recent candles of an asset.
+
+    The candles are stored in arrays twice as large as the capacity and
+    compacted when the end is reached, so that the windows are contiguous
+    slices and appending is amortized O(1). The oldest candles are evicted
+    beyond the capacity.
+
+    Parameters
+    ----------
+    capacity: int
+
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+
+        # The dt from which no candle is missing
+        self.start_dt = None
+        # The end_dt of the last window updated
+        self.updated_dt = None
+
+        self._offset = 0
+        self._size = 0
+        self._dts = np.empty(capacity * 2, dtype=np.int64)
+        self._values = dict(
+            (field, np.empty(capacity * 2, dtype=np.float64))
+            for field in CANDLE_FIELDS
+        )
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dts(self):
+        return self._dts[self._offset:self._offset + self._size]
+
+    @property
+    def last_dt(self):
+        if not self._size:
+            return None
+
+        return pd.Timestamp(self._dts[self._offset + self._size - 1],
+                            tz='UTC')
+
+    def _compact(self):
+        end = self._offset + self._size
+        self._dts[:self._size] = self._dts[self._offset:end]
+        for values in self._values.values():
+            values[:self._size] = values[self._offset:end]
+
+        self._offset = 0
+
+    def _set(self, index, dt, candle):
+        self._dts[index] = dt
+        for field, values in self._values.items():
+            values[index] = candle[field]
+
+    def _append(self, dt, candle):
+        if self._offset + self._size == len(self._dts):
+            self._compact()
+
+        self._set(self._offset + self._size, dt, candle)
+        self._size += 1
+
+        if self._size > self.capacity:
+            self._offset += 1
+            self._size -= 1
+            self.start_dt = pd.Timestamp(self._dts[self._offset], tz='UTC')
+
+    def update(self, candles):
+        """
+        Add new candles and replace the ones already stored, the most
+        recent candle being updated until it closes.
+
+        Parameters
+        ----------
+        candles: list[dict[str, Object]]
+            The candles sorted by `last_traded`.
+
+        """
+        for candle in candles:
+            dt = pd.Timestamp(candle['last_traded']).value
+
+            dts = self.dts
+            if not self._size or dt > dts[-1]:
+                self._append(dt, candle)
+                continue
+
+            index = np.searchsorted(dts, dt)
+            if dts[index] == dt:
+                self._set(self._offset + index, dt, candle)
+
+    def window(self, start_dt, end_dt):
+        """
+        The candles opened in [start_dt, end_dt).
+
+        Parameters
+        ----------
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        np.ndarray, dict[str, np.ndarray]
+            The candle dts as int64 nanoseconds and the copied values of
+            each field.
+
+        """
+        dts = self.dts
+        start = np.searchsorted(dts, pd.Timestamp(start_dt).value)
+        end = np.searchsorted(dts, pd.Timestamp(end_dt).value)
+
+        start += self._offset
+        end += self._offset
+        return self._dts[start:end].copy(), dict(
+            (field, values[start:end].copy())
+            for field, values in self._values.items()
+        )
+
+
+class CandleCache(object):
+    """
+    The recent candles of each exchange, asset and frequency used for
+    the live history windows.
+
+    The buffer of a candle series is seeded with the first window
+    requested, then only the candles since the last one stored are
+    fetched. Each buffer is sized for the largest window requested.
+
+    """
+
+    def __init__(self):
+        self._buffers = dict()
+
+    def _needs_seed(self, buffer, bar_count, start_dt, end_dt, freq):
+        if buffer is None or buffer.capacity < bar_count + 2:
+            return True
+
+        if buffer.last_dt is None or buffer.start_dt > start_dt:
+            return True
+
+        # Refreshing a long gap costs as much as seeding again
+        return get_periods(buffer.last_dt, end_dt, freq) > buffer.capacity
+
+    def get_windows(self, exchange, assets, freq, bar_count, start_dt,
+                    end_dt):
+        """
+        The candles of each asset opened in [start_dt, end_dt).
+
+        Parameters
+        ----------
+        exchange: Exchange
+        assets: list[TradingPair]
+        freq: str
+        bar_count: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        dict[TradingPair, tuple[np.ndarray, dict[str, np.ndarray]]]
+
+        """
+        seed_assets = []
+        update_assets = defaultdict(list)
+        for asset in assets:
+            buffer = self._buffers.get((exchange.name, asset, freq))
+
+            if self._needs_seed(buffer, bar_count, start_dt, end_dt, freq):
+                seed_assets.append(asset)
+
+            elif buffer.updated_dt is None or end_dt > buffer.updated_dt:
+                update_assets[buffer.last_dt].append(asset)
+
+        if seed_assets:
+            log.debug('seeding {} {} candles of {}'.format(
+                bar_count, freq, seed_assets
+            ))
+            candles = exchange.market.get_candles(
+                freq=freq,
+                assets=seed_assets,
+                bar_count=bar_count,
+                start_dt=start_dt,
+                end_dt=end_dt,
+            )
+            for asset in seed_assets:
+                key = (exchange.name, asset, freq)
+
+                # Keeping the size of the largest window requested
+                capacity = bar_count + 2
+                if key in self._buffers:
+                    capacity = max(capacity, self._buffers[key].capacity)
+
+                buffer = CandleBuffer(capacity)
+                buffer.update(candles.get(asset, []))
+                buffer.start_dt = start_dt
+                buffer.updated_dt = end_dt
+
+                self._buffers[key] = buffer
+
+        for since, assets_since in update_assets.items():
+            # The last candle stored is fetched again since it might not
+            # have been closed
+            candles = exchange.market.get_candles(
+                freq=freq,
+                assets=assets_since,
+                bar_count=get_periods(since, end_dt, freq),
+                start_dt=since,
+                end_dt=end_dt,
+            )
+            for asset in assets_since:
+                buffer = self._buffers[(exchange.name, asset, freq)]
+                buffer.update(candles.get(asset, []))
+                buffer.updated_dt = end_dt
+
+        return dict(
+            (asset, self._buffers[(exchange.name, asset, freq)].window(
+                start_dt, end_dt
+            ))
+            for asset in assets
+        )
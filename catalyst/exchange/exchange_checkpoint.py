@@ -0,0 +1,352 @@
+import copy
+import os
+import pickle
+
+from logbook import Logger
+from six import iteritems
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.exchange_utils import get_algo_folder, \
+    get_algo_object
+from catalyst.finance.performance import PerformanceTracker
+from catalyst.utils.paths import ensure_directory
+
+log = Logger('ExchangeCheckpoint', level=LOG_LEVEL)
+
+# The attributes of the cumulative performance period which are not
+# derived from the positions by `calculate_performance`.
+PERIOD_STATE_FIELDS = (
+    'starting_cash',
+    'starting_value',
+    'starting_exposure',
+    'cash_flow',
+    '_total_intraperiod_capital_change',
+    'subperiod_divider',
+    '_payout_last_sale_prices',
+)
+
+
+def _period_state(period):
+    state = dict()
+    for field in PERIOD_STATE_FIELDS:
+        # Copying the containers since they are modified in place
+        state[field] = copy.copy(getattr(period, field))
+
+    return state
+
+
+def _state_equals(a, b):
+    if type(a) is not type(b):
+        return False
+
+    if hasattr(a, '__dict__') and not isinstance(a, dict):
+        return vars(a) == vars(b)
+
+    return a == b
+
+
+def _position_state(position):
+    return (
+        position.amount,
+        position.cost_basis,
+        position.last_sale_price,
+        position.last_sale_date,
+    )
+
+
+def _read_journal(filename):
+    records = []
+    if not os.path.isfile(filename):
+        return records
+
+    with open(filename, 'rb') as handle:
+        while True:
+            try:
+                records.append(pickle.load(handle))
+
+            except EOFError:
+                break
+
+            except Exception as e:
+                # A partial record left by an interrupted append
+                log.warn(
+                    'ignoring the end of journal {}: {}'.format(filename, e)
+                )
+                break
+
+    return records
+
+
+class AlgoCheckpoint(object):
+    """
+    Incremental checkpoints of the state of a live algorithm.
+
+    Each bar appends the changes of the performance tracker to a journal:
+    the orders and transactions processed, the positions which changed
+    and the cash of the cumulative period. The full state is pickled to
+    a snapshot every `snapshot_bars` bars, after which the journal starts
+    over. On restart, the journal is replayed on top of the snapshot.
+
+    Parameters
+    ----------
+    algo_name: str
+    environ:
+    snapshot_bars: int
+        The number of bars between two snapshots.
+
+    """
+
+    def __init__(self, algo_name, environ=None, snapshot_bars=1440):
+        self.algo_name = algo_name
+        self.environ = environ
+        self.snapshot_bars = snapshot_bars
+
+        self.folder = os.path.join(
+            get_algo_folder(algo_name, environ), 'checkpoint'
+        )
+        ensure_directory(self.folder)
+
+        self.snapshot_path = os.path.join(self.folder, 'snapshot.p')
+        self.journal_path = os.path.join(self.folder, 'journal.p')
+
+        self.seq = 0
+        self.journal_bars = 0
+        self.has_snapshot = False
+
+        self._transactions = []
+        self._orders = []
+        self._positions = dict()
+        self._period = dict()
+
+    def record_transaction(self, txn):
+        self._transactions.append(txn)
+
+    def record_order(self, order):
+        self._orders.append(order)
+
+    def _collect_changes(self, tracker):
+        period = tracker.cumulative_performance
+
+        positions = dict()
+        changed_positions = dict()
+        for asset, position in iteritems(period.position_tracker.positions):
+            state = _position_state(position)
+            positions[asset] = state
+
+            if self._positions.get(asset) != state:
+                changed_positions[asset] = state
+
+        closed_positions = [
+            asset for asset in self._positions if asset not in positions
+        ]
+        self._positions = positions
+
+        period_state = _period_state(period)
+        changed_period = dict(
+            (field, value) for field, value in iteritems(period_state)
+            if field not in self._period
+            or not _state_equals(self._period[field], value)
+        )
+        self._period = period_state
+
+        if not (self._transactions or self._orders or changed_positions
+                or closed_positions or changed_period):
+            return None
+
+        changes = dict(
+            transactions=self._transactions,
+            orders=self._orders,
+            positions=changed_positions,
+            closed_positions=closed_positions,
+            period=changed_period,
+        )
+        self._transactions = []
+        self._orders = []
+
+        return changes
+
+    def commit(self, tracker):
+        """
+        Journal the changes of the bar.
+
+        Parameters
+        ----------
+        tracker: PerformanceTracker
+
+        Returns
+        -------
+        bool
+            Whether a snapshot was taken instead of a journal record.
+
+        """
+        if not self.has_snapshot or self.journal_bars >= self.snapshot_bars:
+            self.snapshot(tracker)
+            return True
+
+        changes = self._collect_changes(tracker)
+        if changes is not None:
+            self.seq += 1
+            changes['seq'] = self.seq
+
+            with open(self.journal_path, 'ab') as handle:
+                pickle.dump(changes, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.journal_bars += 1
+        return False
+
+    def snapshot(self, tracker):
+        """
+        Save the full state and start a new journal.
+
+        Parameters
+        ----------
+        tracker: PerformanceTracker
+
+        """
+        todays = tracker.todays_performance
+        state = dict(
+            seq=self.seq,
+            cumulative_performance=tracker.cumulative_performance,
+            transactions=todays.processed_transactions,
+            orders=list(todays.orders_by_id.values()),
+        )
+
+        tmp_path = '{}.tmp'.format(self.snapshot_path)
+        with open(tmp_path, 'wb') as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # The journal records are discarded by their sequence number
+        # if the journal outlives the rename.
+        os.rename(tmp_path, self.snapshot_path)
+        if os.path.isfile(self.journal_path):
+            os.remove(self.journal_path)
+
+        self.has_snapshot = True
+        self.journal_bars = 0
+
+        self._transactions = []
+        self._orders = []
+        self._collect_changes(tracker)
+
+        log.debug('saved snapshot {} of {}'.format(self.seq, self.algo_name))
+
+    def _load_snapshot(self):
+        if os.path.isfile(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as handle:
+                return pickle.load(handle)
+
+        # Falling back to the full pickle of previous versions
+        perf = get_algo_object(
+            algo_name=self.algo_name,
+            key='cumulative_performance',
+            environ=self.environ,
+        )
+        if perf is None:
+            return None
+
+        return dict(
+            seq=0,
+            cumulative_performance=perf,
+            transactions=dict(),
+            orders=[],
+        )
+
+    def restore(self, tracker):
+        """
+        Restore the state of the tracker from the last snapshot and the
+        journal, then take a new snapshot.
+
+        Parameters
+        ----------
+        tracker: PerformanceTracker
+
+        Returns
+        -------
+        bool
+            Whether a checkpoint was found.
+
+        """
+        state = self._load_snapshot()
+        if state is None:
+            return False
+
+        perf = state['cumulative_performance']
+        transactions = state['transactions']
+        orders = state['orders']
+
+        self.seq = state['seq']
+        for record in _read_journal(self.journal_path):
+            if record['seq'] <= self.seq:
+                continue
+
+            self.seq = record['seq']
+            for field, value in iteritems(record['period']):
+                setattr(perf, field, copy.copy(value))
+
+            position_tracker = perf.position_tracker
+            for asset, position in iteritems(record['positions']):
+                amount, cost_basis, last_sale_price, last_sale_date = position
+                position_tracker.update_position(
+                    asset=asset,
+                    amount=amount,
+                    cost_basis=cost_basis,
+                    last_sale_price=last_sale_price,
+                    last_sale_date=last_sale_date,
+                )
+
+            for asset in record['closed_positions']:
+                position_tracker.positions.pop(asset, None)
+                position_tracker._positions_store.pop(asset, None)
+
+            for txn in record['transactions']:
+                transactions.setdefault(txn.dt, []).append(txn)
+
+            orders.extend(record['orders'])
+
+        perf.calculate_performance()
+
+        tracker.cumulative_performance = perf
+        tracker.position_tracker = perf.position_tracker
+
+        period = tracker.todays_performance
+        period.starting_cash = perf.ending_cash
+        period.starting_exposure = perf.ending_exposure
+        period.starting_value = perf.ending_value
+        period.position_tracker = perf.position_tracker
+        for dt in sorted(transactions):
+            for txn in transactions[dt]:
+                period.record_transaction(txn)
+
+        for order in orders:
+            period.record_order(order)
+
+        log.info('restored the state of {} at checkpoint {}'.format(
+            self.algo_name, self.seq
+        ))
+        self.snapshot(tracker)
+
+        return True
+
+
+class JournaledPerformanceTracker(PerformanceTracker):
+    """
+    Performance tracker recording the orders and transactions it processes
+    in a checkpoint journal.
+
+    """
+
+    def __init__(self, sim_params, trading_calendar, env, checkpoint):
+        super(JournaledPerformanceTracker, self).__init__(
+            sim_params, trading_calendar, env
+        )
+        self.checkpoint = checkpoint
+
+    def process_transaction(self, transaction):
+        super(JournaledPerformanceTracker, self).process_transaction(
+            transaction
+        )
+        self.checkpoint.record_transaction(transaction)
+
+    def process_order(self, event):
+        super(JournaledPerformanceTracker, self).process_order(event)
+        self.checkpoint.record_order(event)
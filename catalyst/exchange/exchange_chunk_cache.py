@@ -0,0 +1,281 @@
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import threading
+import time
+
+import requests
+from logbook import Logger
+
+from catalyst.constants import LOG_LEVEL, CHUNK_CACHE_SIZE
+from catalyst.exchange.utils.exchange_utils import get_exchange_folder
+from catalyst.utils.paths import ensure_directory
+
+log = Logger('ExchangeChunkCache', level=LOG_LEVEL)
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+chunk_caches = dict()
+chunk_caches_lock = threading.Lock()
+
+
+def get_file_checksum(path):
+    """
+    The SHA-256 digest of a file, read by blocks.
+
+    Parameters
+    ----------
+    path: str
+
+    Returns
+    -------
+    str
+
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def extract_archive(archive, path):
+    """
+    Extract a tar.gz archive from disk into the specified folder.
+
+    The archive is extracted next to the folder which is only created once
+    the extraction completes.
+
+    Parameters
+    ----------
+    archive: str
+    path: str
+
+    """
+    temp_path = '{}.tmp'.format(path)
+    if os.path.isdir(temp_path):
+        shutil.rmtree(temp_path)
+
+    with tarfile.open(archive, 'r:gz') as tar:
+        tar.extractall(temp_path)
+
+    os.rename(temp_path, path)
+
+
+class ExchangeChunkCache(object):
+    """
+    Content-addressed cache of downloaded bundle chunk archives.
+
+    Archives are stored by checksum and indexed by chunk name. A cached
+    chunk is used as long as its content matches the recorded checksum,
+    so it is never downloaded twice. The least recently used archives are
+    evicted once the cache exceeds its maximum size. Interrupted downloads
+    resume where they stopped.
+
+    Parameters
+    ----------
+    folder: str
+    max_size: int
+        The maximum size of the cached archives in bytes.
+
+    """
+
+    def __init__(self, folder, max_size=CHUNK_CACHE_SIZE):
+        self.folder = folder
+        self.max_size = max_size
+
+        ensure_directory(os.path.join(folder, 'objects'))
+        ensure_directory(os.path.join(folder, 'partial'))
+
+        self._lock = threading.Lock()
+        self._index = self._read_index()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.folder, 'index.json')
+
+    @property
+    def size(self):
+        return sum([entry['size'] for entry in self._index.values()])
+
+    def _read_index(self):
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _write_index(self):
+        temp_path = '{}.tmp'.format(self.index_path)
+        with open(temp_path, 'w') as f:
+            json.dump(self._index, f)
+
+        try:
+            os.rename(temp_path, self.index_path)
+
+        except OSError:
+            # Windows does not replace existing files
+            os.remove(self.index_path)
+            os.rename(temp_path, self.index_path)
+
+    def _object_path(self, checksum):
+        return os.path.join(
+            self.folder, 'objects', checksum[:2], '{}.tar.gz'.format(checksum)
+        )
+
+    def _remove_entry(self, name):
+        entry = self._index.pop(name)
+
+        checksums = [e['checksum'] for e in self._index.values()]
+        path = self._object_path(entry['checksum'])
+        if entry['checksum'] not in checksums and os.path.isfile(path):
+            os.remove(path)
+
+    def _evict(self, keep):
+        names = sorted(
+            self._index.keys(), key=lambda n: self._index[n]['last_access']
+        )
+        size = self.size
+        for name in names:
+            if size <= self.max_size:
+                break
+
+            if name == keep:
+                continue
+
+            log.debug('evicting chunk from cache: {}'.format(name))
+            size -= self._index[name]['size']
+            self._remove_entry(name)
+
+    def download(self, url, path):
+        """
+        Stream the content of a URL to a file, resuming from the size of
+        an existing partial file when the server supports ranges.
+
+        Parameters
+        ----------
+        url: str
+        path: str
+
+        """
+        offset = os.path.getsize(path) if os.path.isfile(path) else 0
+        headers = {'Range': 'bytes={}-'.format(offset)} if offset else None
+
+        resp = requests.get(url, headers=headers, stream=True)
+        try:
+            if resp.status_code == 416:
+                # The partial file does not match the remote file
+                os.remove(path)
+                return self.download(url, path)
+
+            resp.raise_for_status()
+
+            mode = 'ab' if resp.status_code == 206 else 'wb'
+            if offset and mode == 'ab':
+                log.debug('resuming download at {} bytes: {}'.format(
+                    offset, url
+                ))
+
+            with open(path, mode) as f:
+                for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+        finally:
+            resp.close()
+
+    def get_archive(self, name, url, immutable=True):
+        """
+        The local path of a chunk archive, downloading it when missing.
+
+        Parameters
+        ----------
+        name: str
+            The name of the chunk.
+        url: str
+        immutable: bool
+            Whether the chunk is final, only final chunks are cached. The
+            archive of other chunks is a temporary file to be removed by
+            the caller.
+
+        Returns
+        -------
+        str
+
+        """
+        if immutable:
+            with self._lock:
+                entry = self._index.get(name)
+
+            if entry is not None:
+                path = self._object_path(entry['checksum'])
+                if os.path.isfile(path) \
+                        and get_file_checksum(path) == entry['checksum']:
+                    with self._lock:
+                        entry['last_access'] = time.time()
+                        self._write_index()
+
+                    return path
+
+                log.warn('invalid cached chunk {}, downloading it '
+                         'again'.format(name))
+                with self._lock:
+                    self._remove_entry(name)
+                    self._write_index()
+
+        partial_path = os.path.join(
+            self.folder, 'partial', '{}.tar.gz'.format(name)
+        )
+        if not immutable and os.path.isfile(partial_path):
+            # The remote file may have changed since
+            os.remove(partial_path)
+
+        self.download(url, partial_path)
+        if not immutable:
+            return partial_path
+
+        checksum = get_file_checksum(partial_path)
+        path = self._object_path(checksum)
+        ensure_directory(os.path.dirname(path))
+
+        with self._lock:
+            if os.path.isfile(path):
+                os.remove(partial_path)
+            else:
+                os.rename(partial_path, path)
+
+            self._index[name] = dict(
+                checksum=checksum,
+                size=os.path.getsize(path),
+                last_access=time.time(),
+            )
+            self._evict(keep=name)
+            self._write_index()
+
+        return path
+
+
+def get_chunk_cache(exchange_name, environ=None):
+    """
+    The chunk cache of an exchange, shared by all bundles of the process.
+
+    Parameters
+    ----------
+    exchange_name: str
+    environ:
+
+    Returns
+    -------
+    ExchangeChunkCache
+
+    """
+    folder = os.path.join(
+        get_exchange_folder(exchange_name, environ), 'chunk_cache'
+    )
+    with chunk_caches_lock:
+        if folder not in chunk_caches:
+            chunk_caches[folder] = ExchangeChunkCache(folder)
+
+        return chunk_caches[folder]
@@ -9,9 +9,14 @@ from redo import retry
 from catalyst.constants import LOG_LEVEL, AUTO_INGEST
 from catalyst.data.data_portal import DataPortal
 from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.exchange_candle_cache import CandleCache
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
+    LastCandleTooEarlyError,
     PricingDataNotLoadedError)
+from catalyst.exchange.exchange_history_loader import ExchangeHistoryLoader
+from catalyst.exchange.utils.bundle_utils import get_delta, \
+    get_periods_range, get_start_dt
 from catalyst.exchange.utils.exchange_utils import get_frequency, \
     resample_history_df, group_assets_by_exchange
 
@@ -179,6 +184,8 @@ class DataPortalExchangeLive(DataPortalExchangeBase):
         self.exchanges = kwargs.pop('exchanges', None)
         super(DataPortalExchangeLive, self).__init__(*args, **kwargs)
 
+        self.candle_cache = CandleCache()
+
     def get_exchange_history_window(self,
                                     exchange_name,
                                     assets,
@@ -191,6 +198,9 @@ class DataPortalExchangeLive(DataPortalExchangeBase):
         """
         Fetching price history window from the exchange.
 
+        The candles are kept in a rolling cache so that only the candles
+        added since the previous window are fetched.
+
         Parameters
         ----------
         exchange_name: Exchange
@@ -209,14 +219,51 @@ class DataPortalExchangeLive(DataPortalExchangeBase):
         """
         exchange = self.exchanges[exchange_name]
 
-        df = exchange.get_history_window(
-            assets,
-            end_dt,
-            bar_count,
-            frequency,
-            field,
-            data_frequency,
-            False)
+        freq, candle_size, unit, data_frequency = get_frequency(
+            frequency, data_frequency
+        )
+        start_dt = get_start_dt(end_dt, candle_size * bar_count,
+                                data_frequency)
+
+        windows = self.candle_cache.get_windows(
+            exchange, assets, freq, bar_count, start_dt, end_dt
+        )
+
+        periods = get_periods_range(start_dt, end_dt, frequency)
+        adj_end_dt = end_dt - get_delta(candle_size, data_frequency)
+
+        series = dict()
+        for asset in assets:
+            dts, values = windows[asset]
+
+            # The candles are opened before end_dt, the last period
+            # carries the last candle forward
+            if 0 < len(dts) == len(periods) - 1 \
+                    and (dts == periods.asi8[:-1]).all():
+                # No missing candle
+                asset_values = values[field]
+                asset_series = pd.Series(
+                    np.append(asset_values, asset_values[-1]), index=periods
+                )
+
+            else:
+                asset_series = pd.Series(
+                    values[field], index=pd.to_datetime(dts, utc=True)
+                ).reindex(periods, method='ffill')
+
+            last_traded = asset_series.index[-1]
+            if last_traded < adj_end_dt:
+                raise LastCandleTooEarlyError(
+                    last_traded=last_traded,
+                    end_dt=adj_end_dt,
+                    exchange=exchange_name,
+                )
+
+            series[asset] = asset_series
+
+        df = pd.DataFrame(series)
+        df.dropna(inplace=True)
+
         return df
 
     def get_exchange_spot_value(self, exchange_name, assets, field, dt,
@@ -256,6 +303,9 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
 
         for name in self.exchange_names:
             self.exchange_bundles[name] = ExchangeBundle(name)
+            self.history_loaders[name] = ExchangeHistoryLoader(
+                self.exchange_bundles[name]
+            )
 
     def _get_first_trading_day(self, assets):
         first_date = None
@@ -276,6 +326,9 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         """
         Fetching price history window from the exchange bundle.
 
+        The values are read ahead in blocks by the history loader of the
+        exchange, see ExchangeHistoryLoader.
+
         Parameters
         ----------
         exchange: Exchange
@@ -292,7 +345,7 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         DataFrame
 
         """
-        bundle = self.exchange_bundles[exchange_name]  # type: ExchangeBundle
+        loader = self.history_loaders[exchange_name]
 
         freq, candle_size, unit, adj_data_frequency = get_frequency(
             frequency, data_frequency
@@ -303,7 +356,7 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         if data_frequency == 'minute' and adj_data_frequency == 'daily':
             end_dt = end_dt.floor('1D')
 
-        series = bundle.get_history_window_series_and_load(
+        series = loader.history(
             assets=assets,
             end_dt=end_dt,
             bar_count=adj_bar_count,
@@ -315,3 +315,10 @@ class BalanceTooLowError(ZiplineError):
         'add positions to hold a free amount greater than {amount}, or clean '
         'the state of this algo and restart.'
     ).strip()
+
+
+class InvalidRateLimitBackend(ZiplineError):
+    msg = (
+        'Invalid rate limit backend: {backend}, supported backends: '
+        '{backends}.'
+    ).strip()
@@ -0,0 +1,255 @@
+from datetime import datetime, timedelta
+from numbers import Integral, Number
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+# The stats holding a list of items per bar, stored as event tables
+# instead of columns.
+EVENT_FIELDS = ('positions', 'transactions', 'orders')
+
+NAT = np.datetime64('NaT', 'ns').astype(np.int64)
+
+MISSING_VALUES = dict(
+    float=np.nan,
+    datetime=NAT,
+    object=None,
+)
+
+
+def _value_kind(value):
+    if isinstance(value, (bool, np.bool_)):
+        return 'object'
+
+    if isinstance(value, (Number, np.number)):
+        return 'float'
+
+    if isinstance(value, datetime):
+        return 'datetime'
+
+    return 'object'
+
+
+class FrameStatsAccumulator(object):
+    """
+    Columnar storage of the stats of each bar of a backtest.
+
+    The scalar stats are stored in preallocated numpy columns. The
+    positions are only stored when they change and the transactions and
+    orders only for the bars which have some. The DataFrame is only built
+    when requested.
+
+    Parameters
+    ----------
+    capacity: int
+        The number of rows to preallocate, the columns grow as needed.
+    frequency: int or str
+        Record every bar with 1, every Nth bar with N or only the last bar
+        of each day with 'daily'.
+
+    """
+
+    def __init__(self, capacity=1024, frequency=1):
+        if frequency != 'daily' and not (
+                isinstance(frequency, Integral) and frequency >= 1):
+            raise ValueError(
+                'frequency must be a positive integer or \'daily\', '
+                'got {}'.format(frequency)
+            )
+
+        self.capacity = max(1, int(capacity))
+        self.frequency = frequency
+
+        self._size = 0
+        self._bars = 0
+
+        self._columns = dict()
+        self._kinds = dict()
+        self._integers = dict()
+        self._timezones = dict()
+
+        self._event_rows = dict((field, []) for field in EVENT_FIELDS)
+        self._event_values = dict((field, []) for field in EVENT_FIELDS)
+        self._event_fields = set()
+
+    def __len__(self):
+        return self._size
+
+    def should_record(self, dt):
+        """
+        Whether the bar ending at the specified minute must be recorded.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+
+        Returns
+        -------
+        bool
+
+        """
+        bar = self._bars
+        self._bars += 1
+
+        if self.frequency == 'daily':
+            return (dt + timedelta(minutes=1)).date() > dt.date()
+
+        return bar % self.frequency == 0
+
+    def _grow(self):
+        capacity = self.capacity * 2
+        for name, column in iteritems(self._columns):
+            grown = np.full(
+                capacity, MISSING_VALUES[self._kinds[name]],
+                dtype=column.dtype
+            )
+            grown[:self.capacity] = column
+            self._columns[name] = grown
+
+        self.capacity = capacity
+
+    def _create_column(self, name, kind, value=None):
+        dtype = dict(float=np.float64, datetime=np.int64, object=object)
+        self._columns[name] = np.full(
+            self.capacity, MISSING_VALUES[kind], dtype=dtype[kind]
+        )
+        self._kinds[name] = kind
+        self._integers[name] = True
+
+        if kind == 'datetime':
+            self._timezones[name] = pd.Timestamp(value).tz
+
+    def _only_missing(self, name):
+        return self._kinds[name] == 'float' \
+            and np.isnan(self._columns[name][:self._size]).all()
+
+    def _to_object_column(self, name):
+        self._columns[name] = np.array(
+            list(self._materialize(name, self.capacity)), dtype=object
+        )
+        self._kinds[name] = 'object'
+
+    def _set(self, name, row, value):
+        if value is None:
+            if name not in self._columns:
+                self._create_column(name, 'float')
+
+            return
+
+        kind = _value_kind(value)
+        if name not in self._columns or (
+                self._kinds[name] != kind and self._only_missing(name)):
+            self._create_column(name, kind, value)
+
+        elif self._kinds[name] != kind:
+            self._to_object_column(name)
+
+        kind = self._kinds[name]
+        if kind == 'float':
+            if not isinstance(value, (Integral, np.integer)):
+                self._integers[name] = False
+
+            self._columns[name][row] = value
+
+        elif kind == 'datetime':
+            self._columns[name][row] = pd.Timestamp(value).value
+
+        else:
+            self._columns[name][row] = value
+
+    def _add_event(self, field, row, items):
+        self._event_fields.add(field)
+
+        rows = self._event_rows[field]
+        values = self._event_values[field]
+        if field == 'positions':
+            # Positions rarely change from one bar to the next
+            if not values or values[-1] != items:
+                rows.append(row)
+                values.append(items)
+
+        elif items:
+            rows.append(row)
+            values.append(items)
+
+    def append(self, stats):
+        """
+        Add the stats of one bar.
+
+        Parameters
+        ----------
+        stats: dict[str, object]
+
+        """
+        row = self._size
+        if row == self.capacity:
+            self._grow()
+
+        for name, value in iteritems(stats):
+            if name in EVENT_FIELDS:
+                self._add_event(name, row, value)
+
+            else:
+                self._set(name, row, value)
+
+        self._size += 1
+
+    def _materialize(self, name, size=None):
+        size = self._size if size is None else size
+        column = self._columns[name][:size]
+        kind = self._kinds[name]
+
+        if kind == 'datetime':
+            tz = self._timezones.get(name)
+            if tz is None:
+                return pd.DatetimeIndex(column.astype('datetime64[ns]'))
+
+            return pd.DatetimeIndex(
+                column.astype('datetime64[ns]')
+            ).tz_localize('UTC').tz_convert(tz)
+
+        if kind == 'float' and self._integers[name] \
+                and not np.isnan(column).any():
+            return column.astype(np.int64)
+
+        return column.copy()
+
+    def _materialize_events(self, field):
+        rows = self._event_rows[field]
+        values = self._event_values[field]
+
+        result = []
+        index = 0
+        current = []
+        for row in range(self._size):
+            if index < len(rows) and rows[index] == row:
+                current = values[index]
+                index += 1
+                result.append(current)
+
+            elif field == 'positions':
+                result.append(current)
+
+            else:
+                result.append([])
+
+        return result
+
+    def to_frame(self):
+        """
+        Build the DataFrame of the recorded stats.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        data = dict()
+        for name in self._columns:
+            data[name] = self._materialize(name)
+
+        for field in self._event_fields:
+            data[field] = self._materialize_events(field)
+
+        return pd.DataFrame(data, columns=sorted(data))
@@ -0,0 +1,153 @@
+import pandas as pd
+from logbook import Logger
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_errors import PricingDataNotLoadedError
+from catalyst.exchange.utils.bundle_utils import get_delta, get_periods, \
+    get_start_dt
+
+log = Logger('ExchangeHistoryLoader', level=LOG_LEVEL)
+
+# The number of periods read ahead of the history windows
+DEFAULT_PREFETCH_LENGTH = dict(
+    minute=1440,
+    daily=40,
+)
+
+
+class ExchangeHistoryLoader(object):
+    """
+    Sliding history windows of an exchange bundle.
+
+    The values of each asset, field and data frequency are read in blocks
+    extending `prefetch_length` periods past the window requested. The
+    following windows are sliced from the block until the simulation
+    moves past its end, so the bundle is read once per block rather
+    than once per window.
+
+    Parameters
+    ----------
+    bundle: ExchangeBundle
+    prefetch_length: dict[str, int]
+        The number of periods prefetched for each data frequency.
+
+    """
+
+    def __init__(self, bundle, prefetch_length=None):
+        self.bundle = bundle
+        self.prefetch_length = prefetch_length \
+            if prefetch_length is not None else DEFAULT_PREFETCH_LENGTH
+
+        # The start requested, dates and values of each block
+        self._blocks = dict()
+
+    def _covers(self, key, start_dt, end_dt):
+        block = self._blocks.get(key)
+        if block is None:
+            return False
+
+        requested_start, periods, _ = block
+        return requested_start <= start_dt and len(periods) > 0 \
+            and periods[-1] >= end_dt
+
+    def _load_blocks(self, assets, field, data_frequency, start_dt, end_dt,
+                     algo_end_dt):
+        block_end_dt = end_dt + get_delta(
+            self.prefetch_length.get(data_frequency, 0), data_frequency
+        )
+        if algo_end_dt is not None:
+            # Not prefetching past the last session of the simulation
+            if data_frequency == 'minute':
+                last_dt = algo_end_dt + get_delta(1, 'daily') \
+                    - get_delta(1, 'minute')
+            else:
+                last_dt = algo_end_dt
+
+            block_end_dt = max(min(block_end_dt, last_dt), end_dt)
+
+        try:
+            series = self._load_series(
+                assets, field, data_frequency, start_dt, block_end_dt,
+                algo_end_dt,
+            )
+
+        except PricingDataNotLoadedError:
+            if block_end_dt == end_dt:
+                raise
+
+            # The bundle might not cover the prefetched periods
+            log.debug('unable to prefetch {} history until {}'.format(
+                self.bundle.exchange_name, block_end_dt
+            ))
+            series = self._load_series(
+                assets, field, data_frequency, start_dt, end_dt, algo_end_dt,
+            )
+
+        for asset in assets:
+            asset_series = series[asset]
+            self._blocks[(asset, field, data_frequency)] = (
+                start_dt, asset_series.index, asset_series.values,
+            )
+
+    def _load_series(self, assets, field, data_frequency, start_dt, end_dt,
+                     algo_end_dt):
+        return self.bundle.get_history_window_series_and_load(
+            assets=assets,
+            end_dt=end_dt,
+            bar_count=get_periods(start_dt, end_dt, data_frequency),
+            field=field,
+            data_frequency=data_frequency,
+            algo_end_dt=algo_end_dt,
+        )
+
+    def history(self, assets, end_dt, bar_count, field, data_frequency,
+                algo_end_dt=None, trailing_bar_count=None):
+        """
+        The values of each asset in the history window.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+        bar_count: int
+        field: str
+        data_frequency: str
+        algo_end_dt: pd.Timestamp
+            The last session of the bundle which can be prefetched.
+        trailing_bar_count: int
+            The number of periods included after end_dt.
+
+        Returns
+        -------
+        dict[TradingPair, pd.Series]
+
+        """
+        start_dt = get_start_dt(end_dt, bar_count, data_frequency, False)
+        if trailing_bar_count:
+            end_dt += get_delta(trailing_bar_count, data_frequency)
+
+        missing_assets = [
+            asset for asset in assets
+            if not self._covers((asset, field, data_frequency),
+                                start_dt, end_dt)
+        ]
+        if missing_assets:
+            self._load_blocks(
+                missing_assets, field, data_frequency, start_dt, end_dt,
+                algo_end_dt,
+            )
+
+        series = dict()
+        for asset in assets:
+            _, periods, values = self._blocks[(asset, field, data_frequency)]
+
+            start = periods.searchsorted(start_dt)
+            end = periods.searchsorted(end_dt, side='right')
+
+            # The series share the values of the block, the data frame
+            # built from them holds a copy.
+            series[asset] = pd.Series(
+                values[start:end], index=periods[start:end]
+            )
+
+        return series
@@ -11,24 +11,41 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import OrderedDict
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
 from logbook import Logger
+from lru import LRU
 from numpy import (
     iinfo,
     uint32,
 )
+from six import iteritems
 
 from catalyst.constants import LOG_LEVEL
 from catalyst.data.us_equity_pricing import BcolzDailyBarReader
 from catalyst.errors import NoFurtherDataError
-from catalyst.exchange.utils.factory import get_exchange
+from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.lib.adjusted_array import AdjustedArray
 from catalyst.pipeline.data import DataSet, Column
 from catalyst.pipeline.loaders.base import PipelineLoader
 from catalyst.utils.calendars import get_calendar
+from catalyst.utils.calendars.exchange_calendar_open import NANOS_IN_DAY
+from catalyst.utils.calendars.trading_calendar import NANOS_IN_MINUTE
 from catalyst.utils.numpy_utils import float64_dtype
 
 UINT32_MAX = iinfo(uint32).max
 
+# The number of periods read from the bundles at once
+DEFAULT_BLOCK_SIZE = dict(
+    daily=256,
+    minute=1440,
+)
+# The number of blocks of values of a field kept in memory
+DEFAULT_CACHE_SIZE = 64
+
 log = Logger('ExchangePriceLoader', level=LOG_LEVEL)
 
 
@@ -48,29 +65,131 @@ class ExchangePricingLoader(PipelineLoader):
     PipelineLoader for Crypto Pricing data
 
     Delegates loading of baselines and adjustments.
-    """
 
-    def __init__(self, data_frequency):
+    The values are read from the bundle of each exchange in blocks of
+    periods aligned on the epoch, which are kept in a LRU cache by
+    exchange, field and block. The chunks of a pipeline share the blocks
+    of their overlapping periods instead of reading them again.
 
-        cal = get_calendar('OPEN')
-
-        if data_frequency == 'daily':
-            reader = None
-            all_sessions = cal.all_sessions
+    Parameters
+    ----------
+    data_frequency: str
+    cache_size: int
+        The number of blocks kept in memory.
+    block_size: int
+        The number of periods of each block.
+    """
 
-        elif data_frequency == 'minute':
-            reader = None
-            all_sessions = cal.all_minutes
+    def __init__(self, data_frequency, cache_size=DEFAULT_CACHE_SIZE,
+                 block_size=None):
 
-        else:
+        if data_frequency not in ('daily', 'minute'):
             raise ValueError(
                 'Invalid data frequency: {}'.format(data_frequency)
             )
 
         self.data_frequency = data_frequency
-        self.raw_price_loader = reader
+        self.raw_price_loader = None
         self._columns = TradingPairPricing.columns
-        self._all_sessions = all_sessions
+        self._calendar = get_calendar('OPEN')
+
+        self._period_nanos = NANOS_IN_DAY \
+            if data_frequency == 'daily' else NANOS_IN_MINUTE
+        self._block_size = block_size \
+            if block_size is not None else DEFAULT_BLOCK_SIZE[data_frequency]
+
+        self._bundles = dict()
+        # The first period and the values of each sid read, by exchange,
+        # field and block index
+        self._blocks = LRU(cache_size)
+
+    def _get_bundle(self, exchange_name):
+        if exchange_name not in self._bundles:
+            self._bundles[exchange_name] = ExchangeBundle(exchange_name)
+
+        return self._bundles[exchange_name]
+
+    def _get_reader(self, exchange_name):
+        return self._get_bundle(exchange_name).get_reader(self.data_frequency)
+
+    def _get_block(self, exchange_name, reader, fields, block_idx, sids):
+        """
+        The values of a block of periods, reading the fields and sids
+        which are not cached yet.
+
+        Parameters
+        ----------
+        exchange_name: str
+        reader: BcolzExchangeBarReader
+        fields: list[str]
+        block_idx: int
+        sids: list[int]
+
+        Returns
+        -------
+        dict[str, dict[int, tuple[int, np.ndarray]]]
+            The nanos of the first period read and the values of each sid
+            by field, the sids which the bundle does not cover in the
+            block being omitted.
+
+        """
+        blocks = dict()
+        for field in fields:
+            key = (exchange_name, field, block_idx)
+            if key not in self._blocks:
+                self._blocks[key] = dict()
+
+            blocks[field] = self._blocks[key]
+
+        missing_fields = [
+            field for field in fields
+            if any(sid not in blocks[field] for sid in sids)
+        ]
+        if not missing_fields:
+            return blocks
+
+        block_nanos = self._block_size * self._period_nanos
+        start = max(block_idx * block_nanos, reader.first_trading_day.value)
+        end = min(
+            (block_idx + 1) * block_nanos - self._period_nanos,
+            reader.last_available_dt.value,
+        )
+        # The daily bundles end on the session of their last minute
+        end -= end % self._period_nanos
+
+        if start > end:
+            return blocks
+
+        missing_sids = sorted(set(
+            sid for field in missing_fields for sid in sids
+            if sid not in blocks[field]
+        ))
+        start_dt = pd.Timestamp(start, tz='UTC')
+        end_dt = pd.Timestamp(end, tz='UTC')
+
+        log.debug('reading {} {} of {} sids from {} to {}'.format(
+            exchange_name, missing_fields, len(missing_sids), start_dt, end_dt
+        ))
+        arrays = reader.load_raw_arrays(
+            missing_fields, start_dt, end_dt, missing_sids,
+        )
+        for field, array in zip(missing_fields, arrays):
+            for index, sid in enumerate(missing_sids):
+                blocks[field][sid] = (start, array[:, index])
+
+        return blocks
+
+    def _get_sessions(self, start_date, end_date, shift):
+        """
+        The sessions or minutes of the calendar needed to shift the
+        specified dates, the minutes being only built for the range.
+        """
+        if self.data_frequency == 'daily':
+            return self._calendar.all_sessions
+
+        return self._calendar.minutes_in_range(
+            start_date - timedelta(minutes=shift), end_date
+        )
 
     @classmethod
     def from_files(cls, pricing_path):
@@ -94,7 +213,8 @@ class ExchangePricingLoader(PipelineLoader):
         # known on day N is the data from day (N - 1), so we shift all query
         # dates back by a day.
         start_date, end_date = _shift_dates(
-            self._all_sessions, dates[0], dates[-1], shift=1,
+            self._get_sessions(dates[0], dates[-1], shift=1),
+            dates[0], dates[-1], shift=1,
         )
         colnames = [c.name for c in columns]
 
@@ -103,20 +223,60 @@ class ExchangePricingLoader(PipelineLoader):
                 'Pipeline cannot load data with eligible assets.'
             )
 
-        exchange_names = []
-        for asset in assets:
-            if asset.exchange not in exchange_names:
-                exchange_names.append(asset.exchange)
+        # The columns of the assets of each exchange
+        exchange_columns = OrderedDict()
+        for index, asset in enumerate(assets):
+            exchange_columns.setdefault(asset.exchange, []).append(
+                (index, asset.sid)
+            )
 
-        exchange = get_exchange(exchange_names[0])
-        reader = exchange.bundle.get_reader(self.data_frequency)
+        start = start_date.value
+        end = end_date.value + self._period_nanos
+        shape = (end - start) // self._period_nanos, len(assets)
 
-        raw_arrays = reader.load_raw_arrays(
-            colnames,
-            start_date,
-            end_date,
-            assets,
-        )
+        raw_arrays = [
+            np.full(shape, 0.0 if name == 'volume' else np.nan)
+            for name in colnames
+        ]
+
+        block_nanos = self._block_size * self._period_nanos
+        for exchange_name, asset_columns in iteritems(exchange_columns):
+            reader = self._get_reader(exchange_name)
+            if reader is None:
+                log.warn('no {} bundle found for {}'.format(
+                    self.data_frequency, exchange_name
+                ))
+                continue
+
+            sids = [sid for _, sid in asset_columns]
+            for block_idx in range(start // block_nanos,
+                                   (end - 1) // block_nanos + 1):
+                blocks = self._get_block(
+                    exchange_name, reader, colnames, block_idx, sids
+                )
+
+                for name, raw in zip(colnames, raw_arrays):
+                    for index, sid in asset_columns:
+                        if sid not in blocks[name]:
+                            continue
+
+                        block_start, sid_values = blocks[name][sid]
+                        block_end = block_start \
+                            + len(sid_values) * self._period_nanos
+
+                        first = max(start, block_start)
+                        last = min(end, block_end)
+                        if first >= last:
+                            continue
+
+                        raw[
+                            (first - start) // self._period_nanos:
+                            (last - start) // self._period_nanos,
+                            index
+                        ] = sid_values[
+                            (first - block_start) // self._period_nanos:
+                            (last - block_start) // self._period_nanos
+                        ]
 
         out = {}
         for c, c_raw in zip(columns, raw_arrays):
@@ -132,6 +292,27 @@ class ExchangePricingLoader(PipelineLoader):
     def columns(self):
         return self._columns
 
+    def data_version(self, assets):
+        """
+        The periods ingested for the assets in the bundle of each exchange,
+        which change when their data is ingested.
+        """
+        exchange_sids = dict()
+        for asset in assets:
+            exchange_sids.setdefault(asset.exchange, []).append(asset.sid)
+
+        version = []
+        for exchange_name, sids in sorted(iteritems(exchange_sids)):
+            coverage = self._get_bundle(exchange_name).get_coverage(
+                self.data_frequency
+            )
+            version.append((
+                exchange_name,
+                [(sid, coverage.get_ranges(sid)) for sid in sorted(sids)],
+            ))
+
+        return '{} {}'.format(self.data_frequency, version)
+
 
 def _shift_dates(dates, start_date, end_date, shift):
     try:
@@ -0,0 +1,272 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import sleep, time
+
+from logbook import Logger
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_errors import InvalidRateLimitBackend
+from catalyst.exchange.utils.exchange_utils import get_exchange_folder
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+log = Logger('ExchangeRateLimiter', level=LOG_LEVEL)
+
+RATE_LIMIT_BACKENDS = ('memory', 'file')
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TokenBucket(object):
+    """
+    Token bucket shared by the threads of the current process.
+
+    The bucket refills continuously at `rate` tokens per second up to
+    `capacity` tokens. Requests reserve their weight right away, even
+    when the bucket runs into debt, and wait until the debt is repaid.
+    Waits are therefore spread evenly between requests instead of
+    stalling until the end of a time window.
+
+    Parameters
+    ----------
+    rate: float
+        The number of tokens added per second.
+    capacity: float
+        The maximum number of tokens, which is the largest burst allowed.
+
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+
+        self._lock = threading.Lock()
+        self._bucket = None
+
+    def _new_bucket(self):
+        return dict(tokens=self.capacity, updated=time())
+
+    @contextmanager
+    def state(self):
+        with self._lock:
+            if self._bucket is None:
+                self._bucket = self._new_bucket()
+
+            yield self._bucket
+
+    def reserve(self, weight=1):
+        """
+        Take the specified number of tokens from the bucket.
+
+        Parameters
+        ----------
+        weight: float
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before issuing the request.
+
+        """
+        with self.state() as bucket:
+            now = time()
+            tokens = min(
+                self.capacity,
+                bucket['tokens'] + (now - bucket['updated']) * self.rate
+            ) - weight
+
+            bucket['tokens'] = tokens
+            bucket['updated'] = now
+
+        return max(0.0, -tokens / self.rate)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket stored in a locked file.
+
+    All processes using the same file share the same budget, for example
+    several live algorithms using the same exchange API key.
+
+    Parameters
+    ----------
+    path: str
+        The bucket file, created when missing.
+    rate: float
+    capacity: float
+
+    """
+
+    def __init__(self, path, rate, capacity):
+        super(FileTokenBucket, self).__init__(rate, capacity)
+        self.path = path
+
+    @contextmanager
+    def state(self):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+            with os.fdopen(fd, 'r+') as f:
+                _lock_file(f)
+                try:
+                    content = f.read()
+                    bucket = json.loads(content) \
+                        if content else self._new_bucket()
+
+                    yield bucket
+
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(bucket, f)
+                    f.flush()
+
+                finally:
+                    _unlock_file(f)
+
+
+class ExchangeRateLimiter(object):
+    """
+    Rate limiter of the requests issued to an exchange.
+
+    Each request takes tokens from the exchange bucket and from the bucket
+    of its endpoint class when that class has its own limit.
+
+    Parameters
+    ----------
+    exchange_name: str
+    requests_per_minute: float
+        The budget of all the requests issued to the exchange.
+    endpoint_limits: dict[str, float], optional
+        The budget in requests per minute of specific endpoint classes,
+        for example `dict(private=30)`.
+    backend: str
+        'memory' to share the budget between the threads of this process,
+        'file' to share it between all processes using the exchange folder.
+    burst: float, optional
+        The number of requests which can be issued without waiting,
+        defaults to the budget of one minute.
+    environ: dict, optional
+        An environment dict to forward to catalyst_root.
+
+    Attributes
+    ----------
+    metrics: dict[str, dict[str, float]]
+        By endpoint class: the number of requests, their total weight, the
+        number of requests which had to wait, the total and max waiting time
+        in seconds.
+
+    """
+
+    def __init__(self, exchange_name, requests_per_minute,
+                 endpoint_limits=None, backend='memory', burst=None,
+                 environ=None):
+        if backend not in RATE_LIMIT_BACKENDS:
+            raise InvalidRateLimitBackend(
+                backend=backend, backends=RATE_LIMIT_BACKENDS
+            )
+
+        self.exchange_name = exchange_name
+        self.backend = backend
+        self.environ = environ
+
+        self.metrics = dict()
+        self._metrics_lock = threading.Lock()
+
+        self._bucket = self._create_bucket(
+            'exchange', requests_per_minute, burst
+        )
+        self._endpoint_buckets = dict()
+        if endpoint_limits is not None:
+            for endpoint, limit in endpoint_limits.items():
+                self._endpoint_buckets[endpoint] = self._create_bucket(
+                    endpoint, limit, burst
+                )
+
+    def _create_bucket(self, name, requests_per_minute, burst):
+        rate = requests_per_minute / 60.0
+        capacity = burst if burst is not None \
+            else max(1.0, float(requests_per_minute))
+
+        if self.backend == 'file':
+            folder = os.path.join(
+                get_exchange_folder(self.exchange_name, self.environ),
+                'rate_limits'
+            )
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+
+            return FileTokenBucket(
+                os.path.join(folder, '{}.json'.format(name)), rate, capacity
+            )
+
+        else:
+            return TokenBucket(rate, capacity)
+
+    def acquire(self, endpoint='public', weight=1):
+        """
+        Wait until the request fits in the budget.
+
+        Parameters
+        ----------
+        endpoint: str
+            The endpoint class of the request, typically 'public' or
+            'private'.
+        weight: float
+            The cost of the request in units of the budget.
+
+        Returns
+        -------
+        float
+            The number of seconds spent waiting.
+
+        """
+        wait = self._bucket.reserve(weight)
+        if endpoint in self._endpoint_buckets:
+            wait = max(wait, self._endpoint_buckets[endpoint].reserve(weight))
+
+        if wait > 0:
+            log.debug(
+                'waiting {:.3f}s for the {} {} rate limit'.format(
+                    wait, self.exchange_name, endpoint
+                )
+            )
+            sleep(wait)
+
+        with self._metrics_lock:
+            if endpoint not in self.metrics:
+                self.metrics[endpoint] = dict(
+                    requests=0,
+                    weight=0,
+                    waits=0,
+                    wait_time=0.0,
+                    max_wait=0.0,
+                )
+
+            metrics = self.metrics[endpoint]
+            metrics['requests'] += 1
+            metrics['weight'] += weight
+            if wait > 0:
+                metrics['waits'] += 1
+                metrics['wait_time'] += wait
+                metrics['max_wait'] = max(metrics['max_wait'], wait)
+
+        return wait
@@ -0,0 +1,245 @@
+from functools import partial
+from multiprocessing.pool import ThreadPool
+
+from catalyst.assets._assets import TradingPair
+from logbook import Logger
+
+from catalyst.constants import LOG_LEVEL
+
+log = Logger('MarketSnapshot', level=LOG_LEVEL)
+
+
+class MarketSnapshot(object):
+    """
+    The market data of an exchange for the current live bar.
+
+    The tickers, candles, balances and order states are requested at most
+    once per bar: the data portal, the portfolio synchronization and the
+    blotter share the result of the first request. Its methods have the
+    same signatures as the exchange methods they cache.
+
+    `prefetch` requests the data expected for the bar concurrently: the
+    tickers of the specified assets, the balances, the state of the open
+    orders and the candles requested during the previous bar.
+
+    Parameters
+    ----------
+    exchange: Exchange
+
+    """
+
+    def __init__(self, exchange):
+        self.exchange = exchange
+        self.dt = None
+
+        self._tickers = dict()
+        self._candles = dict()
+        self._orders = dict()
+        self._balances = None
+
+        # The candle requests of the bar and of the previous bar,
+        # relative to their dt
+        self._candle_requests = set()
+        self._previous_candle_requests = set()
+
+    def start(self, dt):
+        """
+        Discard the data of the previous bar.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+
+        Returns
+        -------
+        bool
+            Whether a new bar started.
+
+        """
+        if dt == self.dt:
+            return False
+
+        self.dt = dt
+        self._previous_candle_requests = self._candle_requests
+        self._candle_requests = set()
+
+        self._tickers = dict()
+        self._candles = dict()
+        self._orders = dict()
+        self._balances = None
+
+        return True
+
+    def _relative_dt(self, dt):
+        return dt - self.dt if dt is not None else None
+
+    def _absolute_dt(self, delta):
+        return self.dt + delta if delta is not None else None
+
+    def tickers(self, assets):
+        missing_assets = [
+            asset for asset in assets if asset not in self._tickers
+        ]
+        if missing_assets:
+            self._tickers.update(self.exchange.tickers(missing_assets))
+
+        return dict(
+            (asset, self._tickers[asset])
+            for asset in assets if asset in self._tickers
+        )
+
+    def get_candles(self, freq, assets, bar_count=None, start_dt=None,
+                    end_dt=None):
+        is_single = isinstance(assets, TradingPair)
+        if is_single:
+            assets = [assets]
+
+        key = (freq, bar_count, start_dt, end_dt)
+        missing_assets = [
+            asset for asset in assets if (asset, key) not in self._candles
+        ]
+        if missing_assets:
+            candles = self.exchange.get_candles(
+                freq=freq,
+                assets=missing_assets,
+                bar_count=bar_count,
+                start_dt=start_dt,
+                end_dt=end_dt,
+            )
+            self._store_candles(key, candles)
+
+        if self.dt is not None:
+            self._candle_requests.add((
+                freq,
+                tuple(assets),
+                bar_count,
+                self._relative_dt(start_dt),
+                self._relative_dt(end_dt),
+            ))
+
+        if is_single:
+            return self._candles[(assets[0], key)]
+
+        return dict(
+            (asset, self._candles[(asset, key)]) for asset in assets
+        )
+
+    def _store_candles(self, key, candles):
+        for asset in candles:
+            self._candles[(asset, key)] = candles[asset]
+
+    def get_balances(self):
+        if self._balances is None:
+            self._balances = self.exchange.get_balances()
+
+        return self._balances
+
+    def get_order(self, order_id, asset_or_symbol=None):
+        if order_id not in self._orders:
+            self._orders[order_id] = self.exchange.get_order(
+                order_id, asset_or_symbol
+            )
+
+        return self._orders[order_id]
+
+    def get_orders(self, orders):
+        missing_orders = [
+            (order_id, asset) for order_id, asset in orders
+            if order_id not in self._orders
+        ]
+        if missing_orders:
+            self._orders.update(self.exchange.get_orders(missing_orders))
+
+        return dict(
+            (order_id, self._orders[order_id])
+            for order_id, _ in orders if order_id in self._orders
+        )
+
+    def prefetch(self, dt, assets=None, orders=None, balances=False):
+        """
+        Start the bar and request its data concurrently.
+
+        The requests which fail are only logged, they are made again
+        when the data is used.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+        assets: list[TradingPair]
+            The assets whose tickers are needed.
+        orders: list[tuple[str, TradingPair]]
+            The id and asset of the open orders.
+        balances: bool
+            Whether the balances are needed.
+
+        """
+        if not self.start(dt):
+            return
+
+        requests = []
+        if assets:
+            requests.append(
+                (self._tickers.update, partial(self.exchange.tickers, assets))
+            )
+
+        if balances:
+            requests.append(
+                (partial(setattr, self, '_balances'),
+                 self.exchange.get_balances)
+            )
+
+        if orders:
+            requests.append((
+                self._orders.update,
+                partial(self.exchange.get_orders, orders),
+            ))
+
+        for freq, request_assets, bar_count, start, end in \
+                self._previous_candle_requests:
+            start_dt = self._absolute_dt(start)
+            end_dt = self._absolute_dt(end)
+            requests.append((
+                partial(self._store_candles, (freq, bar_count, start_dt,
+                                              end_dt)),
+                partial(self.exchange.get_candles, freq, list(request_assets),
+                        bar_count, start_dt, end_dt),
+            ))
+
+        if not requests:
+            return
+
+        def request(item):
+            try:
+                return True, item[1]()
+
+            except Exception as e:
+                return False, e
+
+        processes = min(
+            getattr(self.exchange, 'max_concurrent_requests', 1) or 1,
+            len(requests),
+        )
+        if processes <= 1:
+            results = [request(item) for item in requests]
+
+        else:
+            pool = ThreadPool(processes=processes)
+            try:
+                results = pool.map(request, requests)
+
+            finally:
+                pool.terminate()
+                pool.join()
+
+        for (store, _), (success, result) in zip(requests, results):
+            if success:
+                store(result)
+
+            else:
+                log.warn('unable to prefetch {} data: {}'.format(
+                    self.exchange.name, result
+                ))
+
+        log.debug('prefetched {} requests of {} for bar {}'.format(
+            len(requests), self.exchange.name, dt
+        ))
@@ -0,0 +1,275 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from logbook import Logger
+from six import string_types
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.exchange_utils import get_algo_folder
+from catalyst.exchange.utils.serialization_utils import ExchangeJSONEncoder
+from catalyst.utils.paths import ensure_directory
+
+log = Logger('ExchangeStatsStore', level=LOG_LEVEL)
+
+
+def _stringify_keys(obj):
+    if isinstance(obj, dict):
+        return dict(
+            (key if isinstance(key, string_types) else str(key),
+             _stringify_keys(value))
+            for key, value in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple)):
+        return [_stringify_keys(value) for value in obj]
+
+    return obj
+
+
+class StatsJSONEncoder(ExchangeJSONEncoder):
+    """
+    Encoder of the recorded values, which can be of any type. Dicts keyed
+    by assets use the string representation of their keys and values
+    which cannot be serialized are stored as strings.
+    """
+
+    def iterencode(self, o, _one_shot=False):
+        return super(StatsJSONEncoder, self).iterencode(
+            _stringify_keys(o), _one_shot
+        )
+
+    def default(self, obj):
+        if isinstance(obj, np.generic):
+            return obj.item()
+
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+
+        if isinstance(obj, pd.Series):
+            return _stringify_keys(obj.to_dict())
+
+        try:
+            return super(StatsJSONEncoder, self).default(obj)
+
+        except TypeError:
+            return str(obj)
+
+
+def _read_csv_frame(filename):
+    if not os.path.isfile(filename):
+        return pd.DataFrame()
+
+    try:
+        with open(filename, 'rb') as handle:
+            df = pd.read_csv(handle, index_col=0, parse_dates=True)
+
+    except (IOError, ValueError):
+        return pd.DataFrame()
+
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is None:
+        df.index = df.index.tz_localize('UTC')
+
+    return df
+
+
+def _read_log_rows(filename):
+    dates = []
+    rows = []
+    if not os.path.isfile(filename):
+        return dates, rows
+
+    with open(filename, 'rt') as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A partial line left by an interrupted append
+                log.warn('skipping corrupt stats line in {}'.format(filename))
+                continue
+
+            dates.append(entry['dt'])
+            rows.append(entry['values'])
+
+    return dates, rows
+
+
+def _rows_to_frame(dates, rows):
+    if not rows:
+        return pd.DataFrame()
+
+    return pd.DataFrame(data=rows, index=pd.to_datetime(dates, utc=True))
+
+
+def _merge_frames(frames):
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    # Rows logged again after an interrupted compaction
+    return df[~df.index.duplicated(keep='last')]
+
+
+class AlgoStatsStore(object):
+    """
+    Append-only storage of the stats of a live algorithm.
+
+    The stats consist of a compacted csv file, readable by `get_algo_df`,
+    and of a log where each bar appends a single json line. Bars therefore
+    cost a constant amount of I/O regardless of the length of the run.
+    The log is folded into the csv once it grows as large as the csv
+    itself, which keeps the amortized cost of compaction constant too.
+
+    Parameters
+    ----------
+    algo_name: str
+    key: str
+        The name of the stats, for example 'pnl_stats'.
+    environ:
+    compact_rows: int
+        The minimum number of logged rows before compacting.
+
+    """
+
+    def __init__(self, algo_name, key, environ=None, compact_rows=1440):
+        self.algo_name = algo_name
+        self.key = key
+        self.compact_rows = compact_rows
+
+        self.folder = get_algo_folder(algo_name, environ)
+        self.csv_path = os.path.join(self.folder, '{}.csv'.format(key))
+        self.log_path = os.path.join(self.folder, '{}.log'.format(key))
+
+        self._frame = None
+        self._pending_dates = []
+        self._pending_rows = []
+
+        self._csv_rows = None
+        self._log_rows = None
+
+    def _count_rows(self):
+        if self._csv_rows is None:
+            self._csv_rows = 0
+            if os.path.isfile(self.csv_path):
+                with open(self.csv_path, 'rt') as handle:
+                    # Excluding the header
+                    self._csv_rows = max(0, sum(1 for _ in handle) - 1)
+
+        if self._log_rows is None:
+            self._log_rows = 0
+            if os.path.isfile(self.log_path):
+                with open(self.log_path, 'rt') as handle:
+                    self._log_rows = sum(1 for _ in handle)
+
+    def append(self, dt, values):
+        """
+        Append the stats of one bar.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+        values: dict[str, object]
+
+        """
+        dt = pd.Timestamp(dt)
+        line = json.dumps(
+            dict(dt=dt.isoformat(), values=values), cls=StatsJSONEncoder
+        )
+
+        ensure_directory(self.folder)
+        with open(self.log_path, 'at') as handle:
+            handle.write(line + '\n')
+
+        if self._frame is not None:
+            self._pending_dates.append(dt)
+            self._pending_rows.append(dict(values))
+
+        self._count_rows()
+        self._log_rows += 1
+        if self._log_rows >= max(self.compact_rows, self._csv_rows):
+            self.compact()
+
+    def load(self):
+        """
+        Read the stats from disk, discarding the cached frame.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        csv_df = _read_csv_frame(self.csv_path)
+        log_df = _rows_to_frame(*_read_log_rows(self.log_path))
+
+        self._frame = _merge_frames([csv_df, log_df])
+        self._pending_dates = []
+        self._pending_rows = []
+
+        self._csv_rows = len(csv_df)
+        self._log_rows = len(log_df)
+
+        return self._frame
+
+    @property
+    def frame(self):
+        """
+        DataFrame: All the stats, only read from disk on first access.
+        """
+        if self._frame is None:
+            return self.load()
+
+        if self._pending_rows:
+            self._frame = _merge_frames([
+                self._frame,
+                _rows_to_frame(self._pending_dates, self._pending_rows),
+            ])
+            self._pending_dates = []
+            self._pending_rows = []
+
+        return self._frame
+
+    def compact(self):
+        """
+        Fold the log into the csv file.
+
+        """
+        df = self.frame
+
+        tmp_path = '{}.tmp'.format(self.csv_path)
+        with open(tmp_path, 'wt') as handle:
+            df.to_csv(handle, encoding='UTF_8')
+
+        os.rename(tmp_path, self.csv_path)
+        if os.path.isfile(self.log_path):
+            os.remove(self.log_path)
+
+        self._csv_rows = len(df)
+        self._log_rows = 0
+
+        log.debug('compacted {} {} rows of {}'.format(
+            len(df), self.key, self.algo_name
+        ))
+
+
+def get_algo_stats(algo_name, key, environ=None):
+    """
+    The stats of an algo name and key.
+
+    Reads the stats written by `AlgoStatsStore` as well as the csv files
+    written by `save_algo_df`.
+
+    Parameters
+    ----------
+    algo_name: str
+    key: str
+    environ:
+
+    Returns
+    -------
+    DataFrame
+
+    """
+    return AlgoStatsStore(algo_name, key, environ).load()
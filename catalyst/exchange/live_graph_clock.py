@@ -6,6 +6,7 @@ from catalyst.gens.sim_engine import (
 from logbook import Logger
 
 from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.simple_clock import BarScheduler
 from catalyst.exchange.utils.stats_utils import prepare_stats
 
 log = Logger('LiveGraphClock', level=LOG_LEVEL)
@@ -34,15 +35,23 @@ class LiveGraphClock(object):
     __iter__ method in order to yield events to Zipline.
 
     The :param:`time_skew` parameter represents the time difference between
-    the exchange and the live trading machine's clock. It's not used currently.
+    the exchange and the live trading machine's clock. The bars are emitted
+    on the minute boundaries of the exchange clock, see
+    :class:`BarScheduler` for the other parameters.
     """
 
     def __init__(self, sessions, context, callback=None,
-                 time_skew=pd.Timedelta('0s')):
+                 time_skew=pd.Timedelta('0s'), missed_bars='skip',
+                 prefetch=None, prefetch_seconds=0):
 
         self.sessions = sessions
         self.time_skew = time_skew
-        self._last_emit = None
+        self.scheduler = BarScheduler(
+            time_skew=time_skew,
+            missed_bars=missed_bars,
+            prefetch=prefetch,
+            prefetch_seconds=prefetch_seconds,
+        )
         self._before_trading_start_bar_yielded = True
         self.context = context
         self.callback = callback
@@ -51,25 +60,19 @@ class LiveGraphClock(object):
         from matplotlib import pyplot as plt
         yield pd.Timestamp.utcnow(), SESSION_START
 
-        while True:
-            current_time = pd.Timestamp.utcnow()
-            current_minute = current_time.floor('1T')
+        # I can't use the "animate" reactive approach here because
+        # I need to yield from the main loop. Pausing instead of sleeping
+        # keeps the chart interactive between the bars.
 
-            if self._last_emit is None or current_minute > self._last_emit:
-                log.debug('emitting minutely bar: {}'.format(current_minute))
+        # Workaround: https://stackoverflow.com/a/33050617/814633
+        self.scheduler.sleep = plt.pause
 
-                self._last_emit = current_minute
-                yield current_minute, BAR
+        for current_minute in self.scheduler:
+            log.debug('emitting minutely bar: {}'.format(current_minute))
+            yield current_minute, BAR
 
-                recorded_cols = list(self.context.recorded_vars.keys())
-                df, _ = prepare_stats(
-                    self.context.frame_stats, recorded_cols=recorded_cols
-                )
-                self.callback(self.context, df)
-
-            else:
-                # I can't use the "animate" reactive approach here because
-                # I need to yield from the main loop.
-
-                # Workaround: https://stackoverflow.com/a/33050617/814633
-                plt.pause(1)
+            recorded_cols = list(self.context.recorded_vars.keys())
+            df, _ = prepare_stats(
+                self.context.frame_stats, recorded_cols=recorded_cols
+            )
+            self.callback(self.context, df)
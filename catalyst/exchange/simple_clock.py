@@ -11,7 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from time import sleep
+import time
+from collections import deque
 
 import pandas as pd
 from catalyst.gens.sim_engine import (
@@ -24,6 +25,162 @@ from catalyst.constants import LOG_LEVEL
 
 log = Logger('ExchangeClock', level=LOG_LEVEL)
 
+MISSED_BARS_POLICIES = ('skip', 'catch_up')
+
+
+class BarScheduler(object):
+    """
+    Schedules the live bars on the minute boundaries of the exchange clock.
+
+    The scheduler sleeps until the next boundary instead of polling the
+    clock, so the bars do not drift. When handle_data runs longer than a
+    bar, the bars missed in the meantime are reported and either skipped
+    or emitted one after the other depending on the policy. The wake
+    jitter and the processing time of each bar are kept in `metrics`.
+
+    Parameters
+    ----------
+    time_skew: pd.Timedelta
+        The time difference between the exchange and the local clock.
+    missed_bars: str
+        'skip' to only emit the current bar after an overrun or
+        'catch_up' to emit each missed bar.
+    prefetch: callable[pd.Timestamp -> None]
+        Loads the market data of the next bar ahead of its boundary.
+    prefetch_seconds: float
+        The number of seconds before the boundary to call `prefetch`.
+    metrics_size: int
+        The number of bars to keep in the metrics.
+
+    """
+
+    def __init__(self, time_skew=None, missed_bars='skip', prefetch=None,
+                 prefetch_seconds=0, metrics_size=1440):
+        if missed_bars not in MISSED_BARS_POLICIES:
+            raise ValueError(
+                'missed_bars must be one of {}, got {}'.format(
+                    MISSED_BARS_POLICIES, missed_bars
+                )
+            )
+
+        self.time_skew = time_skew \
+            if time_skew is not None else pd.Timedelta('0s')
+        self.missed_bars = missed_bars
+        self.prefetch = prefetch
+        self.prefetch_seconds = prefetch_seconds or 0
+
+        self.frequency = pd.Timedelta('1min')
+        self.sleep = time.sleep
+
+        self.last_bar = None
+        self.missed_count = 0
+        self.overrun_count = 0
+        self.metrics = deque(maxlen=metrics_size)
+
+    def now(self):
+        return pd.Timestamp.utcnow() + self.time_skew
+
+    def _sleep_until(self, dt):
+        # The sleep can end early, e.g. when interrupted by a signal
+        while True:
+            remaining = (dt - self.now()).total_seconds()
+            if remaining <= 0:
+                return
+
+            self.sleep(remaining)
+
+    def _prefetch(self, dt):
+        start_dt = dt - pd.Timedelta(seconds=self.prefetch_seconds)
+        self._sleep_until(start_dt)
+
+        if self.now() >= dt:
+            # Already late for the bar
+            return
+
+        try:
+            self.prefetch(dt)
+
+        except Exception as e:
+            log.warn('unable to prefetch the data of bar {}: {}'.format(
+                dt, e
+            ))
+
+    def _wait(self):
+        """
+        Sleep until the next bar.
+
+        Returns
+        -------
+        list[pd.Timestamp], float
+            The bars to emit and the wake jitter in seconds.
+
+        """
+        if self.last_bar is None:
+            return [self.now().floor('1min')], 0.0
+
+        boundary = self.last_bar + self.frequency
+        if self.prefetch is not None and self.prefetch_seconds > 0:
+            self._prefetch(boundary)
+
+        self._sleep_until(boundary)
+
+        now = self.now()
+        current_bar = now.floor('1min')
+        jitter = (now - current_bar).total_seconds()
+
+        missed = int((current_bar - boundary) / self.frequency)
+        if missed <= 0:
+            return [current_bar], jitter
+
+        self.missed_count += missed
+        log.warn(
+            'missed {count} bar(s) from {start} to {end}, '
+            'the bars are {action}'.format(
+                count=missed,
+                start=boundary,
+                end=current_bar - self.frequency,
+                action='emitted late' if self.missed_bars == 'catch_up'
+                else 'skipped',
+            )
+        )
+
+        if self.missed_bars == 'catch_up':
+            return [
+                boundary + self.frequency * index
+                for index in range(missed + 1)
+            ], jitter
+
+        return [current_bar], jitter
+
+    def __iter__(self):
+        while True:
+            bars, jitter = self._wait()
+
+            for dt in bars:
+                self.last_bar = dt
+
+                start = time.time()
+                yield dt
+                processing = time.time() - start
+
+                self.metrics.append(dict(
+                    dt=dt,
+                    jitter=jitter,
+                    processing=processing,
+                ))
+                log.debug(
+                    'bar {} woke up {:.3f}s after its boundary and was '
+                    'processed in {:.3f}s'.format(dt, jitter, processing)
+                )
+
+            if self.now() >= bars[-1] + self.frequency:
+                self.overrun_count += 1
+                log.warn(
+                    'bar {} overran its {} interval'.format(
+                        bars[-1], self.frequency
+                    )
+                )
+
 
 class SimpleClock(object):
     """Realtime clock for live trading.
@@ -35,27 +192,27 @@ class SimpleClock(object):
     around the clock.
 
     The :param:`time_skew` parameter represents the time difference between
-    the Broker and the live trading machine's clock.
+    the Broker and the live trading machine's clock. The bars are emitted
+    on the minute boundaries of the Broker clock, see :class:`BarScheduler`
+    for the other parameters.
     """
 
-    def __init__(self, sessions, time_skew=pd.Timedelta("0s")):
+    def __init__(self, sessions, time_skew=pd.Timedelta("0s"),
+                 missed_bars='skip', prefetch=None, prefetch_seconds=0):
 
         self.sessions = sessions
         self.time_skew = time_skew
-        self._last_emit = None
+        self.scheduler = BarScheduler(
+            time_skew=time_skew,
+            missed_bars=missed_bars,
+            prefetch=prefetch,
+            prefetch_seconds=prefetch_seconds,
+        )
         self._before_trading_start_bar_yielded = True
 
     def __iter__(self):
         yield pd.Timestamp.utcnow(), SESSION_START
 
-        while True:
-            current_time = pd.Timestamp.utcnow()
-            current_minute = current_time.floor('1 min')
-
-            if self._last_emit is None or current_minute > self._last_emit:
-                log.debug('emitting minutely bar: {}'.format(current_minute))
-
-                self._last_emit = current_minute
-                yield current_minute, BAR
-            else:
-                sleep(1)
+        for current_minute in self.scheduler:
+            log.debug('emitting minutely bar: {}'.format(current_minute))
+            yield current_minute, BAR
@@ -1,17 +1,19 @@
 import calendar
 import os
-import tarfile
 from datetime import timedelta, datetime, date
 
 import numpy as np
 import pandas as pd
 import pytz
 
-from catalyst.data.bundles.core import download_without_progress
+from catalyst.exchange.exchange_chunk_cache import get_chunk_cache, \
+    extract_archive
 from catalyst.exchange.utils.exchange_utils import get_exchange_bundles_folder
 
 EXCHANGE_NAMES = ['bitfinex', 'bittrex', 'poloniex']
 API_URL = 'http://data.enigma.co/api/v1'
+BUNDLES_URL = 'https://s3.amazonaws.com/enigmaco/catalyst-bundles/' \
+              'exchange-{exchange}/{name}.tar.gz'
 
 
 def get_date_from_ms(ms):
@@ -49,16 +51,44 @@ def get_seconds_from_date(date):
     return int((date - epoch).total_seconds())
 
 
-def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
+def is_period_complete(period, data_frequency):
+    """
+    Whether the specified bundle period is over, its data can no longer
+    change.
+
+    Parameters
+    ----------
+    period: str
+    data_frequency: str
+
+    Returns
+    -------
+    bool
+
+    """
+    period_start = pd.to_datetime(period, utc=True)
+    period_end = period_start + pd.DateOffset(months=1) \
+        if data_frequency == 'minute' \
+        else period_start + pd.DateOffset(years=1)
+
+    return pd.Timestamp.utcnow() >= period_end + timedelta(days=1)
+
+
+def get_bcolz_chunk(exchange_name, symbol, data_frequency, period,
+                    cache=None):
     """
     Download and extract a bcolz bundle.
 
+    The archives of completed periods are kept in the chunk cache of
+    the exchange.
+
     Parameters
     ----------
     exchange_name: str
     symbol: str
     data_frequency: str
     period: str
+    cache: ExchangeChunkCache, optional
 
     Returns
     -------
@@ -76,18 +106,45 @@ def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
     path = os.path.join(root, name)
 
     if not os.path.isdir(path):
-        url = 'https://s3.amazonaws.com/enigmaco/catalyst-bundles/' \
-              'exchange-{exchange}/{name}.tar.gz'.format(
-                exchange=exchange_name,
-                name=name)
+        url = BUNDLES_URL.format(exchange=exchange_name, name=name)
 
-        bytes = download_without_progress(url)
-        with tarfile.open('r', fileobj=bytes) as tar:
-            tar.extractall(path)
+        if cache is None:
+            cache = get_chunk_cache(exchange_name)
+
+        immutable = is_period_complete(period, data_frequency)
+        archive = cache.get_archive(name, url, immutable)
+        try:
+            extract_archive(archive, path)
+
+        finally:
+            if not immutable:
+                os.remove(archive)
 
     return path
 
 
+def get_folder_size(path):
+    """
+    The total size of the files contained in a folder.
+
+    Parameters
+    ----------
+    path: str
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    """
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            size += os.path.getsize(os.path.join(root, name))
+
+    return size
+
+
 def get_delta(periods, data_frequency):
     """
     Get a time delta based on the specified data frequency.
@@ -1,13 +1,14 @@
-import copy
 import csv
 import json
 import numbers
 import os
 import time
+from collections import deque
 
 import numpy as np
 import pandas as pd
 from catalyst.assets._assets import TradingPair
+from six import StringIO, string_types
 
 from catalyst.exchange.utils.exchange_utils import get_algo_folder
 from catalyst.utils.paths import data_root, ensure_directory
@@ -131,137 +132,296 @@ def vwap(df):
     return ret
 
 
-def set_position_row(row, asset, asset_values=list()):
-    """
-    Apply the position data as individual columns.
+# The stats displayed as the index of the stats DataFrame, the recorded
+# columns which are not specific to an asset are appended to them.
+INDEX_COLUMNS = [
+    'period_close', 'starting_cash', 'ending_cash', 'portfolio_value',
+    'pnl', 'long_exposure', 'short_exposure', 'orders', 'transactions',
+]
 
-    Parameters
-    ----------
-    row: dict[str, Object]
-    asset: TradingPair
-    asset_values: list[str]
-        If a recorded_col contains a tuple which first value is an asset
-        matching a position, its value will be displayed with the
-        position and not in the index.
+POSITION_COLUMNS = ['amount', 'cost_basis', 'last_sale_price']
 
-    Returns
-    -------
 
+def _asset_values(value):
     """
-    asset_cols = ['symbol']
-    row['symbol'] = asset.symbol
+    The values of a recorded column by asset or None if the values
+    are not specific to assets.
+    """
+    if isinstance(value, pd.Series):
+        value = value.to_dict()
 
-    position = next((p for p in row['positions'] if p['sid'] == asset), None)
+    if type(value) is dict and value \
+            and all(isinstance(asset, TradingPair) for asset in value):
+        return value
 
-    columns = ['amount', 'cost_basis', 'last_sale_price']
-    for column in columns:
-        if position is not None:
-            row[column] = position[column]
+    return None
 
-        else:
-            row[column] = 0
 
-        asset_cols.append(column)
+def _csv_value(value):
+    if isinstance(value, np.generic):
+        value = value.item()
 
-    values = asset_values[asset] if asset in asset_values else list()
-    for column in values:
-        row[column] = values[column]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
 
-        asset_cols.append(column)
+    if isinstance(value, (numbers.Number, string_types)):
+        return value
 
-    return asset_cols
+    return str(value)
 
 
-def prepare_stats(stats, recorded_cols=list()):
+class StatsFormatter(object):
     """
-    Prepare the stats DataFrame for user-friendly output.
+    Incremental formatting of the stats of each bar for user-friendly
+    output.
+
+    Each bar is formatted once, into one row by asset with a position or
+    recorded value. The layout of the columns is kept between bars and
+    the CSV output only appends the rows of the new bars. The rows are
+    formatted again only when the layout changes, for example when the
+    first asset or a new recorded column appears.
 
     Parameters
     ----------
-    stats: list[Object]
     recorded_cols: list[str]
-
-    Returns
-    -------
+    num_rows: int
+        The number of bars to display, all bars are kept with None.
 
     """
-    asset_cols = list()
-
-    stats = copy.deepcopy(stats)
-    # Using a copy since we are adding rows inside the loop.
-    for row_index, row_data in enumerate(list(stats)):
-        assets = [p['sid'] for p in row_data['positions']]
 
-        asset_values = dict()
-        if recorded_cols is not None:
-            for column in recorded_cols[:]:
-                value = row_data[column]
-                if isinstance(value, pd.Series):
-                    value = value.to_dict()
-
-                if type(value) is dict:
-                    for asset in value:
-                        if not isinstance(asset, TradingPair):
-                            break
+    def __init__(self, recorded_cols=None, num_rows=10):
+        self.recorded_cols = list(recorded_cols) if recorded_cols else []
+        self.num_rows = num_rows
+
+        self._asset_cols = []
+        self._has_assets = False
+        self.reset()
+
+    def reset(self):
+        """
+        Start over with a new list of stats.
+        """
+        self._stats = []
+        self._count = 0
+        self._recent = deque(maxlen=self.num_rows)
+        self._pending = []
+        self._rewrite = True
+
+    @property
+    def columns(self):
+        """
+        The index and value columns of the stats.
+
+        Returns
+        -------
+        tuple[list[str], list[str]]
+
+        """
+        recorded_cols = [
+            column for column in self.recorded_cols
+            if column not in self._asset_cols
+        ]
+        if self._has_assets:
+            return (
+                INDEX_COLUMNS + recorded_cols,
+                ['symbol'] + POSITION_COLUMNS + self._asset_cols
+            )
 
-                        if asset not in assets:
-                            assets.append(asset)
+        return ['period_close'], INDEX_COLUMNS[1:] + recorded_cols
 
-                        if asset not in asset_values:
-                            asset_values[asset] = dict()
+    def _format(self, stats):
+        assets = [position['sid'] for position in stats['positions']]
 
-                        asset_values[asset][column] = value[asset]
+        asset_values = dict()
+        row = dict(
+            (column, stats.get(column)) for column in INDEX_COLUMNS
+        )
+        row['orders'] = len(stats['orders'])
+        row['transactions'] = len(stats['transactions'])
+
+        for column in self.recorded_cols:
+            value = stats.get(column)
+            values = _asset_values(value)
+            if values is None:
+                row[column] = value
+                continue
+
+            if column not in self._asset_cols:
+                self._asset_cols.append(column)
+
+            for asset in values:
+                if asset not in assets:
+                    assets.append(asset)
+
+                asset_values.setdefault(asset, dict())[column] = \
+                    values[asset]
+
+        if not assets:
+            return [row]
+
+        self._has_assets = True
+        positions = dict(
+            (position['sid'], position) for position in stats['positions']
+        )
+
+        rows = []
+        for asset in assets:
+            asset_row = row.copy()
+            asset_row['symbol'] = asset.symbol
+
+            position = positions.get(asset)
+            for column in POSITION_COLUMNS:
+                asset_row[column] = \
+                    position[column] if position is not None else 0
+
+            asset_row.update(asset_values.get(asset, dict()))
+            rows.append(asset_row)
+
+        return rows
+
+    def update(self, stats, recorded_cols=None):
+        """
+        Format the bars added to the stats since the last update.
+
+        Parameters
+        ----------
+        stats: list[dict[str, Object]]
+        recorded_cols: list[str]
+
+        """
+        if recorded_cols is not None \
+                and list(recorded_cols) != self.recorded_cols:
+            self.recorded_cols = list(recorded_cols)
+            self.reset()
+
+        elif stats is not self._stats or len(stats) < self._count:
+            self.reset()
+
+        self._stats = stats
+
+        columns = self.columns
+        formatted = self._count
+        for bar_stats in stats[formatted:]:
+            rows = self._format(bar_stats)
+            self._recent.append(rows)
+            self._pending.extend(rows)
+
+        self._count = len(stats)
+
+        if formatted and self.columns != columns:
+            self.reset()
+            self.update(stats)
+
+    def to_frame(self, num_rows=None):
+        """
+        The DataFrame of the last formatted bars.
+
+        Parameters
+        ----------
+        num_rows: int
+            The number of bars, all the bars kept with None.
+
+        Returns
+        -------
+        tuple[DataFrame, list[str]]
+            The DataFrame and its value columns.
+
+        """
+        bars = list(self._recent)
+        if num_rows is not None:
+            bars = bars[-num_rows:]
+
+        index_cols, columns = self.columns
+        df = pd.DataFrame(
+            [row for rows in bars for row in rows],
+            columns=index_cols + columns,
+        )
+        df.set_index(
+            index_cols, drop=self._has_assets, inplace=True
+        )
+        df.dropna(axis=1, how='all', inplace=True)
+        df.sort_index(axis=0, level=0, inplace=True)
+
+        return df, [column for column in columns if column in df.columns]
+
+    def to_string(self):
+        """
+        The table of the last formatted bars.
+
+        Returns
+        -------
+        str
+
+        """
+        df, columns = self.to_frame(self.num_rows)
+
+        pd.set_option('display.expand_frame_repr', False)
+        pd.set_option('precision', 8)
+        pd.set_option('display.width', 1000)
+        pd.set_option('display.max_colwidth', 1000)
+
+        return df.to_string(columns=columns)
+
+    def write_csv(self, filename):
+        """
+        Append the new rows to a CSV file, the file is written again
+        with all the rows if it does not exist or if the layout changed.
+
+        Parameters
+        ----------
+        filename: str
+
+        """
+        rewrite = self._rewrite or not os.path.isfile(filename)
+        if rewrite:
+            rows = [
+                row for bar_stats in self._stats
+                for row in self._format(bar_stats)
+            ]
 
-        if len(assets) == 1:
-            row = stats[row_index]
-            asset_cols = set_position_row(row, assets[0], asset_values)
+        else:
+            rows = self._pending
 
-        elif len(assets) > 1:
-            for asset_index, asset in enumerate(assets):
-                if asset_index > 0:
-                    row = copy.deepcopy(row_data)
-                    stats.append(row)
+        index_cols, columns = self.columns
+        header = index_cols + columns
 
-                else:
-                    row = stats[row_index]
+        buffer = StringIO()
+        writer = csv.writer(
+            buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n'
+        )
+        if rewrite:
+            writer.writerow(header)
 
-                asset_cols = set_position_row(row, assets[asset_index],
-                                              asset_values)
+        for row in rows:
+            writer.writerow([_csv_value(row.get(column)) for column in header])
 
-    df = pd.DataFrame(stats)
+        with open(filename, 'wb' if rewrite else 'ab') as handle:
+            handle.write(buffer.getvalue().encode())
 
-    index_cols = [
-        'period_close', 'starting_cash', 'ending_cash', 'portfolio_value',
-        'pnl', 'long_exposure', 'short_exposure', 'orders', 'transactions',
-    ]
+        self._pending = []
+        self._rewrite = False
 
-    # Removing the asset specific entries
-    if recorded_cols is not None:
-        recorded_cols = [x for x in recorded_cols if x not in asset_cols]
-        for column in recorded_cols:
-            index_cols.append(column)
 
-    df['orders'] = df['orders'].apply(lambda orders: len(orders))
-    df['transactions'] = df['transactions'].apply(
-        lambda transactions: len(transactions)
-    )
+def prepare_stats(stats, recorded_cols=list()):
+    """
+    Prepare the stats DataFrame for user-friendly output.
 
-    if asset_cols:
-        columns = asset_cols
-        df.set_index(index_cols, drop=True, inplace=True)
+    Parameters
+    ----------
+    stats: list[Object]
+    recorded_cols: list[str]
 
-    else:
-        columns = index_cols
-        columns.remove('period_close')
-        df.set_index('period_close', drop=False, inplace=True)
+    Returns
+    -------
 
-    df.dropna(axis=1, how='all', inplace=True)
-    df.sort_index(axis=0, level=0, inplace=True)
+    """
+    formatter = StatsFormatter(recorded_cols=recorded_cols, num_rows=None)
+    formatter.update(stats)
 
-    return df, columns
+    return formatter.to_frame()
 
 
-def get_pretty_stats(stats, recorded_cols=None, num_rows=10):
+def get_pretty_stats(stats, recorded_cols=None, num_rows=10, formatter=None):
     """
     Format and print the last few rows of a statistics DataFrame.
     See the pyfolio project for the data structure.
@@ -274,25 +434,26 @@ def get_pretty_stats(stats, recorded_cols=None, num_rows=10):
     num_rows: int
         The number of rows to display on the screen.
 
+    formatter: StatsFormatter
+        Only formats the rows added since its last use if specified.
+
     Returns
     -------
     str
 
     """
     if isinstance(stats, pd.DataFrame):
-        stats = stats.T.to_dict().values()
+        stats = list(stats.T.to_dict().values())
 
-    display_stats = stats[-num_rows:] if len(stats) > num_rows else stats
-    df, columns = prepare_stats(
-        display_stats, recorded_cols=recorded_cols
-    )
+    if formatter is None:
+        formatter = StatsFormatter(
+            recorded_cols=recorded_cols, num_rows=num_rows
+        )
+        stats = stats[-num_rows:] if len(stats) > num_rows else stats
 
-    pd.set_option('display.expand_frame_repr', False)
-    pd.set_option('precision', 8)
-    pd.set_option('display.width', 1000)
-    pd.set_option('display.max_colwidth', 1000)
+    formatter.update(stats, recorded_cols=recorded_cols)
 
-    return df.to_string(columns=columns)
+    return formatter.to_string()
 
 
 def get_csv_stats(stats, recorded_cols=None):
@@ -387,7 +548,8 @@ def email_error(algo_name, dt, e, environ=None):
             )})
 
 
-def stats_to_algo_folder(stats, algo_namespace, recorded_cols=None):
+def stats_to_algo_folder(stats, algo_namespace, recorded_cols=None,
+                         formatter=None):
     """
     Saves the performance stats to the algo local folder.
 
@@ -396,13 +558,20 @@ def stats_to_algo_folder(stats, algo_namespace, recorded_cols=None):
     stats: list[Object]
     algo_namespace: str
     recorded_cols: list[str]
+    formatter: StatsFormatter
+        Only appends the rows added since its last use to the file
+        if specified.
 
     Returns
     -------
     str
+        The path of the CSV file.
 
     """
-    bytes_to_write = get_csv_stats(stats, recorded_cols=recorded_cols)
+    if formatter is None:
+        formatter = StatsFormatter(recorded_cols=recorded_cols)
+
+    formatter.update(stats, recorded_cols=recorded_cols)
 
     timestr = time.strftime('%Y%m%d')
     folder = get_algo_folder(algo_namespace)
@@ -411,11 +580,9 @@ def stats_to_algo_folder(stats, algo_namespace, recorded_cols=None):
     ensure_directory(stats_folder)
 
     filename = os.path.join(stats_folder, '{}.csv'.format(timestr))
+    formatter.write_csv(filename)
 
-    with open(filename, 'wb') as handle:
-        handle.write(bytes_to_write)
-
-    return bytes_to_write
+    return filename
 
 
 def df_to_string(df):
@@ -73,6 +73,8 @@ omitted).
 from __future__ import division
 import logbook
 
+from bisect import bisect_left, insort
+
 import numpy as np
 
 from collections import namedtuple
@@ -137,6 +139,14 @@ def calc_payout(multiplier, amount, old_price, price):
     return (price - old_price) * multiplier * amount
 
 
+def _insert_dt(dts, dt):
+    # The events mostly come in chronological order
+    if not dts or dts[-1] < dt:
+        dts.append(dt)
+    else:
+        insort(dts, dt)
+
+
 class PerformancePeriod(object):
 
     def __init__(
@@ -205,6 +215,19 @@ class PerformancePeriod(object):
         self.orders_by_modified = {}
         self.orders_by_id = OrderedDict()
 
+        # The sorted dts of the keys of processed_transactions and
+        # orders_by_modified, for range queries.
+        self._transaction_dts = []
+        self._order_dts = []
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        # Periods pickled before the dts were indexed
+        if '_transaction_dts' not in state:
+            self._transaction_dts = sorted(self.processed_transactions)
+            self._order_dts = sorted(self.orders_by_modified)
+
     @property
     def position_tracker(self):
         return self._position_tracker
@@ -348,6 +371,7 @@ class PerformancePeriod(object):
                     del dt_orders[order.id]
             except KeyError:
                 self.orders_by_modified[order.dt] = dt_orders = OrderedDict()
+                _insert_dt(self._order_dts, order.dt)
             dt_orders[order.id] = order
             # to preserve the order of the orders by modified date
             # we delete and add back. (ordered dictionary is sorted by
@@ -376,11 +400,37 @@ class PerformancePeriod(object):
             except KeyError:
                 self._payout_last_sale_prices[asset] = txn.price
 
+        self.record_transaction(txn)
+
+    def record_transaction(self, txn):
         if self.keep_transactions:
             try:
                 self.processed_transactions[txn.dt].append(txn)
             except KeyError:
                 self.processed_transactions[txn.dt] = [txn]
+                _insert_dt(self._transaction_dts, txn.dt)
+
+    def transactions_between(self, start_dt, end_dt):
+        """
+        The transactions processed in [start_dt, end_dt).
+        """
+        dts = self._transaction_dts
+        transactions = []
+        for dt in dts[bisect_left(dts, start_dt):bisect_left(dts, end_dt)]:
+            transactions.extend(self.processed_transactions[dt])
+
+        return transactions
+
+    def orders_between(self, start_dt, end_dt):
+        """
+        The orders modified in [start_dt, end_dt).
+        """
+        dts = self._order_dts
+        orders = []
+        for dt in dts[bisect_left(dts, start_dt):bisect_left(dts, end_dt)]:
+            orders.extend(itervalues(self.orders_by_modified[dt]))
+
+        return orders
 
     @staticmethod
     def _calculate_execution_cash_flow(txn):
@@ -13,8 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import functools
 import logbook
+import math
 import numpy as np
 
 import pandas as pd
@@ -28,6 +30,7 @@ from .risk import (
 )
 
 from catalyst.patches.stats import (
+    APPROX_BDAYS_PER_YEAR,
     alpha_beta_aligned,
     annual_volatility,
     downside_risk,
@@ -45,6 +48,223 @@ log = logbook.Logger('Risk Cumulative', level=LOG_LEVEL)
 choose_treasury = functools.partial(choose_treasury, lambda *args: '10year',
                                     compound=False)
 
+RISK_MODES = ('streaming', 'batch', 'verify')
+
+STREAMING_METRICS = (
+    'algorithm_cumulative_returns',
+    'benchmark_cumulative_returns',
+    'algorithm_volatility',
+    'benchmark_volatility',
+    'alpha',
+    'beta',
+    'sharpe',
+    'downside_risk',
+    'sortino',
+    'information',
+    'max_drawdown',
+)
+
+
+class Moments(object):
+    """
+    Running count, sum and sum of squares of the non-nan values of a series.
+
+    The values are shifted by the first one to avoid the cancellation
+    of the naive sum of squares, constant series have exactly no variance.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.shift = None
+        self.sum = 0.0
+        self.sum_sq = 0.0
+
+    def add(self, value):
+        if np.isnan(value):
+            return
+
+        if self.shift is None:
+            self.shift = value
+
+        value -= self.shift
+        self.count += 1
+        self.sum += value
+        self.sum_sq += value * value
+
+    def mean(self):
+        if self.count == 0:
+            return np.nan
+
+        return self.shift + self.sum / self.count
+
+    def std(self, ddof=1):
+        if self.count <= ddof:
+            return np.nan
+
+        var = (self.sum_sq - self.sum * self.sum / self.count) \
+            / (self.count - ddof)
+        return math.sqrt(var) if var > 0 else 0.0
+
+
+class CoMoments(object):
+    """
+    Running sums of the pairs of values which are both not nan, enough to
+    derive the population covariance of the pairs.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.shift_x = None
+        self.shift_y = None
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.sum_yy = 0.0
+
+    def add(self, x, y):
+        if np.isnan(x) or np.isnan(y):
+            return
+
+        if self.shift_x is None:
+            self.shift_x = x
+            self.shift_y = y
+
+        x -= self.shift_x
+        y -= self.shift_y
+        self.count += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xy += x * y
+        self.sum_yy += y * y
+
+    def means(self):
+        return (
+            self.shift_x + self.sum_x / self.count,
+            self.shift_y + self.sum_y / self.count,
+        )
+
+    def cov(self):
+        mean_x = self.sum_x / self.count
+        mean_y = self.sum_y / self.count
+        return self.sum_xy / self.count - mean_x * mean_y
+
+    def var_y(self):
+        mean_y = self.sum_y / self.count
+        return self.sum_yy / self.count - mean_y * mean_y
+
+
+class RiskAccumulator(object):
+    """
+    Running state of the algorithm and benchmark returns, from which the
+    cumulative risk metrics are derived in constant time.
+
+    The metrics are equivalent to the functions of `catalyst.patches.stats`
+    applied to the whole series of returns added so far.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+        self.algorithm = Moments()
+        self.benchmark = Moments()
+        self.active = Moments()
+        self.joint = CoMoments()
+        self.downside_sum_sq = 0.0
+
+        self.algorithm_growth = 1.0
+        self.benchmark_growth = 1.0
+        self.peak = -np.inf
+        self.max_drawdown = np.nan
+
+    def add(self, algorithm_returns, benchmark_returns):
+        algorithm_returns = float(algorithm_returns)
+        benchmark_returns = float(benchmark_returns)
+
+        self.count += 1
+        self.algorithm.add(algorithm_returns)
+        self.benchmark.add(benchmark_returns)
+        self.active.add(algorithm_returns - benchmark_returns)
+        self.joint.add(algorithm_returns, benchmark_returns)
+
+        if algorithm_returns < 0:
+            self.downside_sum_sq += algorithm_returns * algorithm_returns
+
+        # Like cum_returns, nan returns are treated as no change
+        if not np.isnan(algorithm_returns):
+            self.algorithm_growth *= algorithm_returns + 1
+        if not np.isnan(benchmark_returns):
+            self.benchmark_growth *= benchmark_returns + 1
+
+        value = self.algorithm_growth * 100
+        self.peak = max(self.peak, value)
+
+        # Like max_drawdown, the drawdown from a zero peak is nan and
+        # ignored, the growth remaining zero after a total loss
+        if self.peak != 0:
+            self.max_drawdown = np.fmin(
+                self.max_drawdown, (value - self.peak) / self.peak
+            )
+
+    def metrics(self):
+        """
+        The cumulative risk metrics of the returns added so far.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        nan = np.nan
+        ann_factor = APPROX_BDAYS_PER_YEAR
+        metrics = dict((name, nan) for name in STREAMING_METRICS)
+        if self.count < 1:
+            return metrics
+
+        metrics['algorithm_cumulative_returns'] = self.algorithm_growth - 1
+        metrics['benchmark_cumulative_returns'] = self.benchmark_growth - 1
+        metrics['max_drawdown'] = self.max_drawdown
+
+        if self.algorithm.count > 0:
+            metrics['downside_risk'] = math.sqrt(
+                self.downside_sum_sq / self.algorithm.count
+            ) * math.sqrt(ann_factor)
+
+        if self.count < 2:
+            return metrics
+
+        algorithm_std = self.algorithm.std()
+        metrics['algorithm_volatility'] = \
+            algorithm_std * math.sqrt(ann_factor)
+        metrics['benchmark_volatility'] = \
+            self.benchmark.std() * math.sqrt(ann_factor)
+
+        if algorithm_std > 0:
+            metrics['sharpe'] = self.algorithm.mean() / algorithm_std * \
+                math.sqrt(ann_factor)
+
+        downside_risk = metrics['downside_risk']
+        if downside_risk > 0:
+            metrics['sortino'] = \
+                self.algorithm.mean() / downside_risk * ann_factor
+
+        tracking_error = self.active.std()
+        if np.isnan(tracking_error):
+            metrics['information'] = 0.0
+        elif tracking_error > 0:
+            metrics['information'] = self.active.mean() / tracking_error
+
+        if self.joint.count >= 2:
+            var = self.joint.var_y()
+            if abs(var) >= 1.0e-30:
+                beta = self.joint.cov() / var
+                mean_algorithm, mean_benchmark = self.joint.means()
+
+                metrics['beta'] = beta
+                metrics['alpha'] = \
+                    (mean_algorithm - beta * mean_benchmark) * ann_factor
+
+        return metrics
+
 
 class RiskMetricsCumulative(object):
     """
@@ -65,7 +285,13 @@ class RiskMetricsCumulative(object):
     )
 
     def __init__(self, sim_params, treasury_curves, trading_calendar,
-                 create_first_day_stats=False):
+                 create_first_day_stats=False, mode='streaming'):
+        if mode not in RISK_MODES:
+            raise ValueError(
+                'Risk mode must be one of {}, got {}'.format(RISK_MODES, mode)
+            )
+
+        self.mode = mode
         self.treasury_curves = treasury_curves
         self.trading_calendar = trading_calendar
         self.start_session = sim_params.start_session
@@ -143,6 +369,11 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        # The returns of the sessions before `_accumulated_loc` are folded
+        # into the streaming accumulator.
+        self._accumulator = RiskAccumulator()
+        self._accumulated_loc = 0
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         warnings.filterwarnings('error')
 
@@ -161,13 +392,24 @@ class RiskMetricsCumulative(object):
             if len(self.algorithm_returns) == 1:
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
-        try:
-            self.algorithm_cumulative_returns[dt_loc] = cum_returns(
-                self.algorithm_returns
-            )[-1]
-        except Exception as e:
-            log.debug('unable to calculate cum returns: {}'.format(e))
-            self.algorithm_cumulative_returns[dt_loc] = np.nan
+        self.benchmark_returns_cont[dt_loc] = benchmark_returns
+        self.benchmark_returns = self.benchmark_returns_cont[:dt_loc + 1]
+
+        if self.create_first_day_stats:
+            if len(self.benchmark_returns) == 1:
+                self.benchmark_returns = np.append(0.0, self.benchmark_returns)
+
+        if self.mode == 'batch':
+            metrics = self.batch_metrics()
+
+        else:
+            metrics = self.streaming_metrics()
+
+            if self.mode == 'verify':
+                metrics = self.verify_metrics(metrics, self.batch_metrics())
+
+        self.algorithm_cumulative_returns[dt_loc] = \
+            metrics['algorithm_cumulative_returns']
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -189,22 +431,8 @@ class RiskMetricsCumulative(object):
                 self.annualized_mean_returns = np.append(
                     0.0, self.annualized_mean_returns)
 
-        self.benchmark_returns_cont[dt_loc] = benchmark_returns
-        self.benchmark_returns = self.benchmark_returns_cont[:dt_loc + 1]
-
-        if self.create_first_day_stats:
-            if len(self.benchmark_returns) == 1:
-                self.benchmark_returns = np.append(0.0, self.benchmark_returns)
-
-        try:
-            self.benchmark_cumulative_returns[dt_loc] = cum_returns(
-                self.benchmark_returns
-            )[-1]
-        except Exception as e:
-            log.debug(
-                'unable to calculate benchmark cum returns: {}'.format(e)
-            )
-            self.benchmark_cumulative_returns[dt_loc] = np.nan
+        self.benchmark_cumulative_returns[dt_loc] = \
+            metrics['benchmark_cumulative_returns']
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -244,12 +472,8 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             raise Exception(message)
 
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = annual_volatility(
-            self.benchmark_returns
-        )
-        self.algorithm_volatility[dt_loc] = annual_volatility(
-            self.algorithm_returns
-        )
+        self.benchmark_volatility[dt_loc] = metrics['benchmark_volatility']
+        self.algorithm_volatility[dt_loc] = metrics['algorithm_volatility']
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -269,55 +493,165 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
 
-        self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
+        self.alpha[dt_loc] = metrics['alpha']
+        self.beta[dt_loc] = metrics['beta']
+        self.sharpe[dt_loc] = metrics['sharpe']
+        self.downside_risk[dt_loc] = metrics['downside_risk']
+        self.sortino[dt_loc] = metrics['sortino']
+        self.information[dt_loc] = metrics['information']
+
+        self.max_drawdown = metrics['max_drawdown']
+        self.max_drawdowns[dt_loc] = self.max_drawdown
+        self.max_leverage = self.calculate_max_leverage()
+        self.max_leverages[dt_loc] = self.max_leverage
+
+        warnings.resetwarnings()
+
+    def streaming_metrics(self):
+        """
+        The risk metrics of the returns up to the latest dt, in constant
+        time per update.
+
+        The returns of the previous sessions are final, they are folded
+        into the accumulator once. Only the returns of the latest session,
+        which change every minute, are added to a copy of the accumulator.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        dt_loc = self.latest_dt_loc
+        if dt_loc < self._accumulated_loc:
+            # Going back in time, the previous sessions must be folded again
+            self._accumulator = RiskAccumulator()
+            self._accumulated_loc = 0
+
+        while self._accumulated_loc < dt_loc:
+            self._accumulator.add(
+                self.algorithm_returns_cont[self._accumulated_loc],
+                self.benchmark_returns_cont[self._accumulated_loc],
+            )
+            self._accumulated_loc += 1
+
+        accumulator = copy.deepcopy(self._accumulator)
+        if self.create_first_day_stats and dt_loc == 0:
+            accumulator.add(0.0, 0.0)
+
+        accumulator.add(
+            self.algorithm_returns_cont[dt_loc],
+            self.benchmark_returns_cont[dt_loc],
+        )
+        return accumulator.metrics()
+
+    def batch_metrics(self):
+        """
+        The risk metrics of the returns up to the latest dt, computed
+        over the whole series of returns.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        metrics = dict()
+
+        try:
+            metrics['algorithm_cumulative_returns'] = cum_returns(
+                self.algorithm_returns
+            )[-1]
+        except Exception as e:
+            log.debug('unable to calculate cum returns: {}'.format(e))
+            metrics['algorithm_cumulative_returns'] = np.nan
+
+        try:
+            metrics['benchmark_cumulative_returns'] = cum_returns(
+                self.benchmark_returns
+            )[-1]
+        except Exception as e:
+            log.debug(
+                'unable to calculate benchmark cum returns: {}'.format(e)
+            )
+            metrics['benchmark_cumulative_returns'] = np.nan
+
+        metrics['benchmark_volatility'] = annual_volatility(
+            self.benchmark_returns
+        )
+        metrics['algorithm_volatility'] = annual_volatility(
+            self.algorithm_returns
+        )
+
+        metrics['alpha'], metrics['beta'] = alpha_beta_aligned(
             self.algorithm_returns,
             self.benchmark_returns,
         )
-        self.sharpe[dt_loc] = sharpe_ratio(
+        metrics['sharpe'] = sharpe_ratio(
             self.algorithm_returns,
         )
 
         try:
-            self.downside_risk[dt_loc] = downside_risk(
+            metrics['downside_risk'] = downside_risk(
                 self.algorithm_returns
             )
         except Exception as e:
             log.debug(
                 'unable to calculate downside risk returns: {}'.format(e)
             )
-            self.downside_risk[dt_loc] = np.nan
+            metrics['downside_risk'] = np.nan
 
         try:
-            risk = self.downside_risk[dt_loc]
-            self.sortino[dt_loc] = sortino_ratio(
+            metrics['sortino'] = sortino_ratio(
                 self.algorithm_returns,
-                _downside_risk=risk
+                _downside_risk=metrics['downside_risk']
             )
         except Exception as e:
             log.debug(
                 'unable to calculate benchmark cum returns: {}'.format(e)
             )
-            self.sortino[dt_loc] = np.nan
+            metrics['sortino'] = np.nan
 
-        self.information[dt_loc] = information_ratio(
+        metrics['information'] = information_ratio(
             self.algorithm_returns,
             self.benchmark_returns,
         )
         try:
-            self.max_drawdown = max_drawdown(
+            metrics['max_drawdown'] = max_drawdown(
                 self.algorithm_returns
             )
         except Exception as e:
             log.debug(
                 'unable to calculate max drawdown: {}'.format(e)
             )
-            self.max_drawdown = np.nan
+            metrics['max_drawdown'] = np.nan
 
-        self.max_drawdowns[dt_loc] = self.max_drawdown
-        self.max_leverage = self.calculate_max_leverage()
-        self.max_leverages[dt_loc] = self.max_leverage
+        return metrics
 
-        warnings.resetwarnings()
+    def verify_metrics(self, streaming_metrics, batch_metrics):
+        """
+        Compare the streaming metrics with the batch metrics.
+
+        Parameters
+        ----------
+        streaming_metrics: dict[str, float]
+        batch_metrics: dict[str, float]
+
+        Returns
+        -------
+        dict[str, float]
+            The batch metrics, which remain the reference.
+
+        """
+        for name in STREAMING_METRICS:
+            if not np.isclose(streaming_metrics[name], batch_metrics[name],
+                              rtol=1e-6, atol=1e-10, equal_nan=True):
+                log.warn(
+                    'streaming {} diverged on {}: {} instead of {}'.format(
+                        name, self.latest_dt, streaming_metrics[name],
+                        batch_metrics[name],
+                    )
+                )
+
+        return batch_metrics
 
     def to_dict(self):
         """
@@ -8,6 +8,7 @@ from .filters import Filter, CustomFilter
 from .term import Term
 from .graph import ExecutionPlan, TermGraph
 from .pipeline import Pipeline
+from .result_cache import PipelineResultCache
 from .loaders import USEquityPricingLoader
 
 
@@ -57,6 +58,7 @@ __all__ = (
     'Factor',
     'Filter',
     'Pipeline',
+    'PipelineResultCache',
     'SimplePipelineEngine',
     'Term',
     'TermGraph',
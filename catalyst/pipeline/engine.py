@@ -5,6 +5,10 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from collections import deque
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import sys
 from uuid import uuid4
 
 import six
@@ -12,9 +16,10 @@ from six import (
     iteritems,
     with_metaclass,
 )
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
-from toolz import groupby, juxt
+from toolz import groupby, juxt, merge
 from toolz.curried.operator import getitem
 
 from catalyst.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
@@ -26,6 +31,7 @@ from catalyst.utils.numpy_utils import (
 )
 from catalyst.utils.pandas_utils import explode
 
+from .graph import ExecutionPlan
 from .term import AssetExists, InputDates, LoadableTerm
 
 from catalyst.utils.date_utils import compute_date_range_chunks
@@ -185,6 +191,16 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`catalyst.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    max_workers : int, optional
+        The number of threads computing the terms whose inputs are ready.
+        Defaults to the number of CPUs. With 1, the terms are computed
+        serially in the calling thread. Only the computations releasing the
+        GIL, like numpy's vectorized ones, run in parallel: factors computed
+        in pure Python won't scale with the number of workers.
+    result_cache : catalyst.pipeline.result_cache.PipelineResultCache, optional
+        The cache of the results of the pipeline columns loaded from data
+        whose loaders provide a version. The cached columns are neither
+        loaded nor computed again.
 
     See Also
     --------
@@ -197,16 +213,23 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_max_workers',
+        '_result_cache',
     )
 
     def __init__(self,
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 max_workers=None,
+                 result_cache=None):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
+        self._max_workers = max_workers \
+            if max_workers is not None else cpu_count()
+        self._result_cache = result_cache
 
         self._root_mask_term = AssetExists()
         self._root_mask_dates_term = InputDates()
@@ -232,7 +255,8 @@ class SimplePipelineEngine(PipelineEngine):
 
         2. Compute each term in the dependency order determined in (0), caching
            the results in a a dictionary to that they can be fed into future
-           terms.
+           terms.  The terms whose dependencies are computed run concurrently
+           on a pool of ``max_workers`` threads.
 
         3. For each date, determine the number of assets passing
            pipeline.screen.  The sum, N, of all these values is the total
@@ -306,13 +330,26 @@ class SimplePipelineEngine(PipelineEngine):
             assets,
         )
 
+        cache_keys = self._result_cache_keys(
+            graph, dates, assets, initial_workspace, start_date, end_date,
+        )
+        cached = {}
+        for term, key in iteritems(cache_keys):
+            value = self._result_cache.get(key)
+            if value is not None:
+                cached[term] = value
+
         results = self.compute_chunk(
             graph,
             dates,
             assets,
-            initial_workspace,
+            merge(initial_workspace, cached),
         )
 
+        for name, term in iteritems(graph.outputs):
+            if term in cache_keys and term not in cached:
+                self._result_cache.set(cache_keys[term], results[name])
+
         return self._to_narrow(
             graph.outputs,
             results,
@@ -431,6 +468,87 @@ class SimplePipelineEngine(PipelineEngine):
     def get_loader(self, term):
         return self._get_loader(term)
 
+    def _result_cache_keys(self,
+                           graph,
+                           dates,
+                           assets,
+                           initial_workspace,
+                           start_date,
+                           end_date):
+        """
+        Compute the keys of the outputs of ``graph`` in the result cache.
+
+        The outputs computed with extra rows, or from a loader which does
+        not provide the version of its data, are not cached.
+
+        Returns
+        -------
+        keys : dict[Term -> str]
+        """
+        if self._result_cache is None:
+            return {}
+
+        root_mask = initial_workspace[self._root_mask_term]
+        root_extra_rows = graph.extra_rows[self._root_mask_term]
+
+        data_versions = {}
+        keys = {}
+        for term in set(six.itervalues(graph.outputs)):
+            if term in initial_workspace or graph.extra_rows[term]:
+                continue
+
+            # The rows of the root mask read to compute ``term`` alone.
+            term_plan = ExecutionPlan(
+                {'term': term}, self._calendar, start_date, end_date,
+            )
+            lookback = term_plan.extra_rows.get(self._root_mask_term, 0)
+
+            versions = []
+            for loadable in term_plan.loadable_terms:
+                loader = self.get_loader(loadable)
+                if loader not in data_versions:
+                    data_versions[loader] = loader.data_version(assets)
+
+                versions.append(data_versions[loader])
+
+            if any(version is None for version in versions):
+                continue
+
+            start = root_extra_rows - lookback
+            key = self._result_cache.key(
+                term, dates[start:], assets, root_mask[start:], versions,
+            )
+            if key is not None:
+                keys[term] = key
+
+        return keys
+
+    @staticmethod
+    def _compute_term(term, inputs, mask_dates, assets, mask):
+        """
+        Compute a non-loadable term from the values of its inputs.
+        """
+        result = term._compute(inputs, mask_dates, assets, mask)
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
+
+        return result
+
+    @classmethod
+    def _compute_term_async(cls, completed, term, *args):
+        """
+        Compute a term on the pool, putting the result or the error raised
+        into the ``completed`` queue.
+        """
+        try:
+            result = cls._compute_term(term, *args)
+        except Exception:
+            completed.put((term, None, sys.exc_info()))
+        else:
+            completed.put((term, result, None))
+
     def compute_chunk(self, graph, dates, assets, initial_workspace):
         """
         Compute the Pipeline terms in the graph for the requested start and end
@@ -467,51 +585,111 @@ class SimplePipelineEngine(PipelineEngine):
 
         refcounts = graph.initial_refcounts(workspace)
 
-        for term in graph.execution_order(refcounts):
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
-
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = graph.mask_and_dates_for_term(
-                term,
-                self._root_mask_term,
-                workspace,
-                dates,
-            )
+        # `term` may have been supplied in `initial_workspace`, and in the
+        # future we may pre-compute loadable terms coming from the same
+        # dataset.  In either case, we will already have an entry for this
+        # term, which we shouldn't re-compute.
+        execution_order = [
+            term for term in graph.execution_order(refcounts)
+            if term not in workspace
+        ]
+
+        # The number of dependencies each term is still waiting for.
+        waiting = dict.fromkeys(execution_order, 0)
+        for term in execution_order:
+            for parent, _ in graph.graph.in_edges([term]):
+                if parent in waiting:
+                    waiting[term] += 1
+
+        ready = deque(term for term in execution_order if not waiting[term])
+
+        def release(term):
+            # Edges are tuple of (from, to).
+            for _, child in graph.graph.out_edges([term]):
+                if child in waiting:
+                    waiting[child] -= 1
+                    if not waiting[child]:
+                        ready.append(child)
+
+        def store(term, result):
+            workspace[term] = result
+
+            # Decref dependencies of ``term``, and clear any terms whose
+            # refcounts hit 0.
+            for garbage_term in graph.decref_dependencies(term, refcounts):
+                del workspace[garbage_term]
+
+            del waiting[term]
+            release(term)
+
+        # The terms are computed on the pool as soon as their dependencies
+        # are in the workspace. The loads, the workspace and the refcounts
+        # are only touched from this thread, so the loaders don't need to be
+        # thread-safe.
+        pool = ThreadPool(self._max_workers) \
+            if self._max_workers > 1 else None
+        completed = Queue()
+        running = 0
+
+        try:
+            while ready or running:
+                while ready:
+                    term = ready.popleft()
+                    if term not in waiting:
+                        # Loaded along with another term of its group.
+                        continue
+
+                    # Asset labels are always the same, but date labels vary
+                    # by how many extra rows are needed.
+                    mask, mask_dates = graph.mask_and_dates_for_term(
+                        term,
+                        self._root_mask_term,
+                        workspace,
+                        dates,
+                    )
 
-            if isinstance(term, LoadableTerm):
-                term_key = loader_group_key(term)
-                # TODO: temp workaround
-                to_load = sorted(
-                    six.next(six.itervalues(loader_groups)),
-                    key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
-                )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
-                    mask,
-                )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
-
-                # Decref dependencies of ``term``, and clear any terms whose
-                # refcounts hit 0.
-                for garbage_term in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage_term]
+                    if isinstance(term, LoadableTerm):
+                        to_load = sorted(
+                            loader_groups[loader_group_key(term)],
+                            key=lambda t: t.dataset
+                        )
+                        loader = get_loader(term)
+                        loaded = loader.load_adjusted_array(
+                            to_load, mask_dates, assets, mask,
+                        )
+                        workspace.update(loaded)
+
+                        for loaded_term in loaded:
+                            if loaded_term in waiting:
+                                del waiting[loaded_term]
+                                release(loaded_term)
+                        continue
+
+                    args = (
+                        term,
+                        self._inputs_for_term(term, workspace, graph),
+                        mask_dates,
+                        assets,
+                        mask,
+                    )
+                    if pool is None:
+                        store(term, self._compute_term(*args))
+                    else:
+                        pool.apply_async(
+                            self._compute_term_async, (completed,) + args,
+                        )
+                        running += 1
+
+                if running:
+                    term, result, exc_info = completed.get()
+                    running -= 1
+                    if exc_info is not None:
+                        six.reraise(*exc_info)
+
+                    store(term, result)
+        finally:
+            if pool is not None:
+                pool.terminate()
 
         out = {}
         graph_extra_rows = graph.extra_rows
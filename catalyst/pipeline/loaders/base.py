@@ -23,3 +23,16 @@ class PipelineLoader(with_metaclass(ABCMeta)):
     @abstractmethod
     def columns(self):
         pass
+
+    def data_version(self, assets):
+        """
+        The version of the data loaded for the assets, which changes when
+        the data does.
+
+        Returns
+        -------
+        version : str
+            None when the version is unknown, in which case the results
+            of the pipelines loading the data are not cached.
+        """
+        return None
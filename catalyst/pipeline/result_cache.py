@@ -0,0 +1,434 @@
+"""
+Disk cache of the results of pipeline terms.
+"""
+import errno
+import hashlib
+import os
+import sys
+import sysconfig
+from types import CodeType, FunctionType, ModuleType
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from six import iteritems
+
+import catalyst
+from catalyst.utils.paths import (
+    cache_path,
+    ensure_directory,
+    update_modified_time,
+)
+
+from .term import Term
+
+# The maximum size of the cached results in bytes
+DEFAULT_MAX_SIZE = 1024 ** 3
+
+EXTENSION = '.npy'
+
+
+class UnstableToken(Exception):
+    """
+    Raised when a value has no representation which is the same across
+    runs, like the default repr of objects holding their address.
+    """
+
+
+# The class attributes which do not define the behavior of a class
+IGNORED_CLASS_ATTRIBUTES = frozenset([
+    '__dict__', '__doc__', '__module__', '__qualname__', '__weakref__',
+])
+
+_library_paths = None
+_catalyst_source_token = None
+
+
+def _get_library_paths():
+    global _library_paths
+    if _library_paths is None:
+        paths = sysconfig.get_paths()
+        _library_paths = tuple(set(
+            os.path.join(os.path.realpath(paths[name]), '')
+            for name in ('stdlib', 'platstdlib', 'purelib', 'platlib')
+            if paths.get(name)
+        ))
+
+    return _library_paths
+
+
+def _get_catalyst_source_token():
+    """
+    A digest of the sources of catalyst, which identifies the code of its
+    classes and functions in development installs as well as releases.
+    """
+    global _catalyst_source_token
+    if _catalyst_source_token is None:
+        root = os.path.dirname(os.path.realpath(catalyst.__file__))
+        digest = hashlib.sha1()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith(('.py', '.pyx', '.pxd')):
+                    continue
+
+                path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(path, root).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+
+        _catalyst_source_token = digest.hexdigest()
+
+    return _catalyst_source_token
+
+
+def _module_kind(module_name):
+    """
+    Whether a module is part of catalyst, of an installed library or of
+    the user code, whose functions and classes are hashed by their code.
+    """
+    if not module_name:
+        return 'user'
+
+    package = module_name.split('.')[0]
+    if package == 'catalyst':
+        return 'catalyst'
+
+    if package in ('builtins', '__builtin__'):
+        return 'library'
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        return 'user'
+
+    path = getattr(module, '__file__', None)
+    if path is None:
+        return 'user' if module_name == '__main__' else 'library'
+
+    if os.path.realpath(path).startswith(_get_library_paths()):
+        return 'library'
+
+    return 'user'
+
+
+def _qualified_name(obj):
+    module = getattr(obj, '__module__', None)
+    name = '{}.{}'.format(
+        module, getattr(obj, '__qualname__', obj.__name__)
+    )
+
+    # The code of catalyst is identified by the digest of its sources
+    if _module_kind(module) == 'library':
+        package = sys.modules.get(module.split('.')[0])
+        name = '{}({})'.format(name, getattr(package, '__version__', ''))
+
+    return name
+
+
+def _code_token(code, namespace, tokens, seen):
+    parts = [hashlib.sha1(code.co_code).hexdigest()]
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            parts.append(_code_token(const, namespace, tokens, seen))
+        else:
+            parts.append(repr(const))
+
+    # The global names are hashed with their values, like the module
+    # constants and the helper functions called by the code. The other
+    # names are attributes or builtins.
+    for name in code.co_names:
+        if name in namespace:
+            parts.append('{}={}'.format(
+                name, _value_token(namespace[name], tokens, seen)
+            ))
+        else:
+            parts.append(name)
+
+    return '({})'.format(', '.join(parts))
+
+
+def _function_token(func, tokens, seen):
+    """
+    The code of a function of the user code, including its default
+    arguments, its closure and the globals it references.
+    """
+    if _module_kind(func.__module__) != 'user':
+        return _qualified_name(func)
+
+    code = func.__code__
+    if code in seen:
+        # A recursive function
+        return _qualified_name(func)
+
+    seen.add(code)
+
+    closure = getattr(func, '__closure__', None) or ()
+    cells = []
+    for cell in closure:
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:
+            # An empty cell
+            cells.append(None)
+
+    return '{}({}, defaults={}, kwdefaults={}, closure={})'.format(
+        _qualified_name(func),
+        _code_token(code, func.__globals__, tokens, seen),
+        _value_token(func.__defaults__, tokens, seen),
+        _value_token(getattr(func, '__kwdefaults__', None), tokens, seen),
+        _value_token(tuple(cells), tokens, seen),
+    )
+
+
+def _type_token(cls, tokens, seen):
+    """
+    The name of the class and its bases, including the code and the
+    attributes of the classes of the user code.
+    """
+    parts = []
+    for base in cls.__mro__:
+        parts.append(_qualified_name(base))
+        if _module_kind(base.__module__) != 'user' or base in seen:
+            continue
+
+        seen.add(base)
+        for name, attr in sorted(iteritems(vars(base))):
+            if name in IGNORED_CLASS_ATTRIBUTES or name.startswith('_abc_'):
+                continue
+
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            elif isinstance(attr, property):
+                attr = attr.fget
+
+            parts.append('{}={}'.format(
+                name, _value_token(attr, tokens, seen)
+            ))
+
+    return '[{}]'.format(', '.join(parts))
+
+
+def _value_token(value, tokens, seen):
+    if isinstance(value, Term):
+        return _term_token(value, tokens)
+
+    if isinstance(value, type):
+        return _type_token(value, tokens, seen)
+
+    if isinstance(value, FunctionType):
+        return _function_token(value, tokens, seen)
+
+    if isinstance(value, ModuleType):
+        return 'module({})'.format(value.__name__)
+
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            data = _value_token(value.tolist(), tokens, seen)
+        else:
+            data = hashlib.sha1(np.ascontiguousarray(value).tobytes()) \
+                .hexdigest()
+
+        return 'ndarray({}, {}, {})'.format(value.dtype, value.shape, data)
+
+    if isinstance(value, dict):
+        return '{{{}}}'.format(', '.join(sorted(
+            '{}: {}'.format(
+                _value_token(k, tokens, seen), _value_token(v, tokens, seen)
+            )
+            for k, v in iteritems(value)
+        )))
+
+    if isinstance(value, (set, frozenset)):
+        return '{{{}}}'.format(', '.join(sorted(
+            _value_token(item, tokens, seen) for item in value
+        )))
+
+    if isinstance(value, (list, tuple)):
+        return '({})'.format(', '.join(
+            _value_token(item, tokens, seen) for item in value
+        ))
+
+    if callable(value) and hasattr(value, '__name__') \
+            and _module_kind(getattr(value, '__module__', None)) != 'user':
+        # The functions of the libraries which are not plain functions
+        return _qualified_name(value)
+
+    token = repr(value)
+    if ' at 0x' in token:
+        raise UnstableToken(token)
+
+    return token
+
+
+def _term_token(term, tokens):
+    """
+    A digest of the class and the attributes of a term, the terms it
+    depends on being included through their own digest.
+    """
+    try:
+        return tokens[term]
+    except KeyError:
+        pass
+
+    seen = set()
+    token = '{}({})'.format(
+        _type_token(type(term), tokens, seen),
+        ', '.join(
+            '{}={}'.format(name, _value_token(value, tokens, seen))
+            for name, value in sorted(iteritems(vars(term)))
+        ),
+    )
+    tokens[term] = hashlib.sha1(token.encode('utf-8')).hexdigest()
+    return tokens[term]
+
+
+class PipelineResultCache(object):
+    """
+    A disk cache of the results of pipeline terms.
+
+    The results are keyed by a digest of the definition of the term, the
+    dates and assets computed and the version of the data loaded, so the
+    runs computing the same terms over the same data share them. Each
+    result is stored in its own ``.npy`` file, the columns of a pipeline
+    being stored separately. The least recently used files are removed
+    when their size exceeds ``max_size``.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory of the cache, ``pipeline`` in the catalyst cache
+        root by default.
+    max_size : int, optional
+        The maximum size of the cached results in bytes.
+    environ : dict, optional
+        An environment dict to forward to catalyst_root.
+    """
+    def __init__(self, path=None, max_size=DEFAULT_MAX_SIZE, environ=None):
+        self.path = path if path is not None \
+            else cache_path(['pipeline'], environ=environ)
+        self.max_size = max_size
+
+        # The digests of the terms, which are immutable
+        self._tokens = WeakKeyDictionary()
+        self._size = None
+
+        ensure_directory(self.path)
+
+    def _keypath(self, key):
+        return os.path.join(self.path, key + EXTENSION)
+
+    def _entries(self):
+        """
+        The modification time, size and path of each cached result.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(EXTENSION):
+                continue
+
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Removed by another process
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if self._size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+
+            self._size -= size
+
+    def key(self, term, dates, assets, mask, data_versions):
+        """
+        The key of the results of a term.
+
+        Parameters
+        ----------
+        term : catalyst.pipeline.term.Term
+        dates : pd.DatetimeIndex
+            The dates of the rows read to compute the results.
+        assets : pd.Int64Index
+        mask : np.ndarray[bool]
+            The asset lifetimes of the dates.
+        data_versions : list[str]
+            The versions of the data loaded to compute the term.
+
+        Returns
+        -------
+        str
+            The key, or None if the term cannot be identified across runs.
+        """
+        try:
+            token = _term_token(term, self._tokens)
+        except UnstableToken:
+            return None
+
+        digest = hashlib.sha1()
+        parts = [catalyst.__version__, _get_catalyst_source_token(), token]
+        for part in parts + sorted(data_versions):
+            digest.update(part.encode('utf-8'))
+
+        sids = np.array([int(asset) for asset in assets], dtype=np.int64)
+        for array in (dates.values, sids, mask):
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        The cached results of a key, or None if they are not cached.
+        """
+        path = self._keypath(key)
+        try:
+            with open(path, 'rb') as f:
+                value = np.load(f, allow_pickle=False)
+
+        except (IOError, OSError, ValueError):
+            # Missing, or partially removed by another process
+            return None
+
+        update_modified_time(path)
+        return value
+
+    def set(self, key, value):
+        """
+        Cache the results of a key. Only the plain arrays of numbers,
+        booleans and dates are cached.
+        """
+        if type(value) is not np.ndarray or value.dtype == object:
+            return
+
+        path = self._keypath(key)
+        temp_path = '{}.{}.tmp'.format(path, uuid4().hex)
+        with open(temp_path, 'wb') as f:
+            np.save(f, value, allow_pickle=False)
+
+        try:
+            os.rename(temp_path, path)
+
+        except OSError:
+            # Windows does not replace existing files
+            os.remove(path)
+            os.rename(temp_path, path)
+
+        if self._size is None:
+            self._evict()
+        else:
+            self._size += os.path.getsize(path)
+            if self._size > self.max_size:
+                self._evict()
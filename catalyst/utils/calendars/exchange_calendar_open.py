@@ -1,15 +1,34 @@
 from datetime import time
 from pytz import timezone
 
-from pandas import Timestamp
+import numpy as np
+from pandas import DatetimeIndex, Timestamp
 from pandas.tseries.offsets import DateOffset
 
+from catalyst.utils.input_validation import (
+    attrgetter,
+    coerce,
+    preprocess,
+)
 from catalyst.utils.memoize import lazyval
 
-from .trading_calendar import TradingCalendar
+from .trading_calendar import TradingCalendar, NANOS_IN_MINUTE
+
+MINUTES_PER_SESSION = 1440
+NANOS_IN_DAY = MINUTES_PER_SESSION * NANOS_IN_MINUTE
 
 
 class OpenExchangeCalendar(TradingCalendar):
+    """
+    The calendar of the markets trading around the clock.
+
+    Each session is the day from midnight to 23:59 UTC, so the minutes of
+    the calendar are contiguous. The minute and session lookups are
+    computed from the position of the dates instead of searching the
+    index of all the minutes, which is only built when `all_minutes` is
+    requested.
+    """
+
     @property
     def name(self):
         return 'OPEN'
@@ -33,3 +52,141 @@ class OpenExchangeCalendar(TradingCalendar):
     def __init__(self, *args, **kwargs):
         super(OpenExchangeCalendar, self).__init__(
             start=Timestamp('2015-3-1', tz='UTC'), **kwargs)
+
+    @lazyval
+    def _first_minute_nanos(self):
+        return int(self.market_opens_nanos[0])
+
+    @lazyval
+    def _minutes_count(self):
+        return len(self.schedule) * MINUTES_PER_SESSION
+
+    def _minute_position(self, value, side='left'):
+        """
+        The equivalent of `searchsorted` on the nanos of all the minutes.
+        """
+        offset = value - self._first_minute_nanos
+        if side == 'left':
+            position = -(-offset // NANOS_IN_MINUTE)
+        else:
+            position = offset // NANOS_IN_MINUTE + 1
+
+        return int(min(max(position, 0), self._minutes_count))
+
+    def _minute(self, position):
+        if position < 0 or position >= self._minutes_count:
+            raise IndexError(
+                'minute {} is outside of the calendar'.format(position)
+            )
+
+        return Timestamp(
+            self._first_minute_nanos + position * NANOS_IN_MINUTE, tz='UTC'
+        )
+
+    def _minutes_slice(self, start, end):
+        """
+        The equivalent of `all_minutes[start:end]` for positive positions.
+        """
+        start = min(max(start, 0), self._minutes_count)
+        end = min(max(end, start), self._minutes_count)
+
+        first = self._first_minute_nanos
+        return DatetimeIndex(np.arange(
+            first + start * NANOS_IN_MINUTE,
+            first + end * NANOS_IN_MINUTE,
+            NANOS_IN_MINUTE,
+            dtype=np.int64,
+        ).astype('datetime64[ns]')).tz_localize('UTC')
+
+    def is_open_on_minute(self, dt):
+        offset = dt.value - self._first_minute_nanos
+        if offset < 0 or offset >= self._minutes_count * NANOS_IN_MINUTE:
+            return False
+
+        return offset % NANOS_IN_DAY <= NANOS_IN_DAY - NANOS_IN_MINUTE
+
+    def next_minute(self, dt):
+        return self._minute(self._minute_position(dt.value, 'right'))
+
+    def previous_minute(self, dt):
+        position = self._minute_position(dt.value, 'left')
+        if position == 0:
+            raise ValueError("Cannot go earlier in calendar!")
+
+        return self._minute(position - 1)
+
+    def minutes_window(self, start_dt, count):
+        start_idx = self._minute_position(start_dt.value, 'left')
+
+        # The minute on or before start_dt
+        if start_idx == self._minutes_count \
+                or self._minute(start_idx).value != start_dt.value:
+            start_idx -= 1
+
+        if start_idx < 0 or start_idx >= self._minutes_count:
+            raise KeyError("Can't start minute window at {}".format(start_dt))
+
+        end_idx = start_idx + count
+
+        if start_idx > end_idx:
+            return self._minutes_slice(end_idx + 1, start_idx + 1)
+        else:
+            return self._minutes_slice(start_idx, end_idx)
+
+    def minutes_in_range(self, start_minute, end_minute):
+        return self._minutes_slice(
+            self._minute_position(start_minute.value, 'left'),
+            self._minute_position(end_minute.value, 'right'),
+        )
+
+    def minutes_count_for_sessions_in_range(self, start_session, end_session):
+        return len(self.sessions_in_range(start_session, end_session)) \
+            * MINUTES_PER_SESSION
+
+    def sessions_in_range(self, start_session_label, end_session_label):
+        first = self._first_minute_nanos
+        sessions_count = len(self.schedule)
+
+        start = -(-(start_session_label.value - first) // NANOS_IN_DAY)
+        end = (end_session_label.value - first) // NANOS_IN_DAY + 1
+
+        start = int(min(max(start, 0), sessions_count))
+        end = int(min(max(end, start), sessions_count))
+        return self.all_sessions[start:end]
+
+    @preprocess(dt=coerce(Timestamp, attrgetter('value')))
+    def minute_to_session_label(self, dt, direction="next"):
+        # The session of the first close on or after dt
+        first_close = self._first_minute_nanos + NANOS_IN_DAY \
+            - NANOS_IN_MINUTE
+        idx = max(-(-(dt - first_close) // NANOS_IN_DAY), 0)
+        current_or_next_session = self.all_sessions[idx]
+
+        if direction == "next":
+            return current_or_next_session
+
+        is_open = dt >= current_or_next_session.value
+        if direction == "previous":
+            if not is_open:
+                # if the exchange is closed, use the previous session
+                return self.all_sessions[idx - 1]
+        elif direction == "none":
+            if not is_open:
+                # if the exchange is closed, blow up
+                raise ValueError("The given dt is not an exchange minute!")
+        else:
+            # invalid direction
+            raise ValueError("Invalid direction parameter: "
+                             "{0}".format(direction))
+
+        return current_or_next_session
+
+    def minute_index_to_session_labels(self, index):
+        first_close = self._first_minute_nanos + NANOS_IN_DAY \
+            - NANOS_IN_MINUTE
+        minutes = index.values.astype(np.int64)
+
+        idx = np.maximum(-((first_close - minutes) // NANOS_IN_DAY), 0)
+        labels = self._first_minute_nanos + idx * NANOS_IN_DAY
+
+        return DatetimeIndex(labels.astype('datetime64[ns]'), tz='UTC')
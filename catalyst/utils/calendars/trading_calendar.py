@@ -115,9 +115,6 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         self.market_closes_nanos = self.schedule.market_close.values.\
             astype(np.int64)
 
-        self._trading_minutes_nanos = self.all_minutes.values.\
-            astype(np.int64)
-
         self.first_trading_session = _all_days[0]
         self.last_trading_session = _all_days[-1]
 
@@ -125,6 +122,12 @@ class TradingCalendar(with_metaclass(ABCMeta)):
             _special_closes.map(self.minute_to_session_label)
         )
 
+    @lazyval
+    def _trading_minutes_nanos(self):
+        # Built with all_minutes on first use, the calendars which do not
+        # search the minutes never build them.
+        return self.all_minutes.values.astype(np.int64)
+
     @lazyval
     def day(self):
         return CustomBusinessDay(
@@ -28,6 +28,7 @@ from toolz import valfilter, concatv
 from functools import partial
 
 from catalyst.finance.trading import TradingEnvironment
+from catalyst.pipeline.result_cache import PipelineResultCache
 from catalyst.utils.calendars import get_calendar
 from catalyst.utils.factory import create_simulation_parameters
 from catalyst.data.loader import load_crypto_market_data
@@ -138,10 +139,10 @@ def _pretty_print_code(algotext):
         click.echo(algotext)
 
 
-def _choose_loader(data_frequency, column):
+def _choose_loader(pricing_loader, column):
     bound_cols = TradingPairPricing.columns
     if column in bound_cols:
-        return ExchangePricingLoader(data_frequency)
+        return pricing_loader
     raise ValueError(
         "No PipelineLoader registered for column %s." % column)
 
@@ -210,7 +211,8 @@ def _fetch_capital_base(base_currency, exchange_name, exchange,
 
 def _algorithm_class_for_live(algo_namespace, live_graph, stats_output,
                               analyze_live, base_currency, simulate_orders,
-                              exchanges, capital_base):
+                              exchanges, capital_base, missed_bars='skip',
+                              prefetch_seconds=None):
     if not simulate_orders:
         for exchange_name in exchanges:
             exchange = exchanges[exchange_name]
@@ -231,7 +233,9 @@ def _algorithm_class_for_live(algo_namespace, live_graph, stats_output,
         live_graph=live_graph,
         simulate_orders=simulate_orders,
         stats_output=stats_output,
-        analyze_live=analyze_live,)
+        analyze_live=analyze_live,
+        missed_bars=missed_bars,
+        prefetch_seconds=prefetch_seconds,)
 
     return algorithm_class
 
@@ -253,14 +257,16 @@ def _build_live_algo_and_data(sim_params, exchanges, env, open_calendar,
                               simulate_orders, algo_namespace, capital_base,
                               live_graph, stats_output, analyze_live,
                               base_currency, namespace, choose_loader,
-                              algorithm_class_kwargs):
+                              algorithm_class_kwargs, missed_bars='skip',
+                              prefetch_seconds=None):
     sim_params._arena = 'live'  # TODO: use the constructor instead
 
     data = _data_for_live_trading(sim_params, exchanges, env, open_calendar)
 
     algorithm_class = _algorithm_class_for_live(
         algo_namespace, live_graph, stats_output, analyze_live,
-        base_currency, simulate_orders, exchanges, capital_base)
+        base_currency, simulate_orders, exchanges, capital_base,
+        missed_bars, prefetch_seconds)
 
     return data, algorithm_class(
         namespace=namespace,
@@ -273,7 +279,7 @@ def _build_live_algo_and_data(sim_params, exchanges, env, open_calendar,
 def _build_backtest_algo_and_data(
         exchanges, bundle, env, environ, bundle_timestamp, open_calendar,
         start, end, namespace, choose_loader, sim_params,
-        algorithm_class_kwargs):
+        algorithm_class_kwargs, stats_frequency=None):
     if exchanges:
         # Removed the existing Poloniex fork to keep things simple
         # We can add back the complexity if required.
@@ -290,9 +296,13 @@ def _build_backtest_algo_and_data(
             first_trading_day=start,
             last_available_session=end)
 
+        # The pipeline results are reused by the backtests of the same
+        # pipelines over the same data
         algorithm_class = partial(
             ExchangeTradingAlgorithmBacktest,
-            exchanges=exchanges)
+            exchanges=exchanges,
+            stats_frequency=stats_frequency,
+            pipeline_result_cache=PipelineResultCache(environ=environ))
     elif bundle is not None:
         # TODO This branch should probably be removed or fixed: it doesn't even
         # build `algorithm_class`, so it will break when trying to instantiate
@@ -325,7 +335,8 @@ def _build_algo_and_data(handle_data, initialize, before_trading_start,
                          end, output, print_algo, local_namespace, environ,
                          live, exchange, algo_namespace, base_currency,
                          live_graph, analyze_live, simulate_orders,
-                         stats_output):
+                         stats_output, stats_frequency=None,
+                         missed_bars='skip', prefetch_seconds=None):
     namespace = _build_namespace(algotext, local_namespace, defines)
     if algotext is not None:
         algotext = algofile.read()
@@ -350,7 +361,11 @@ def _build_algo_and_data(handle_data, initialize, before_trading_start,
 
     env.asset_finder = ExchangeAssetFinder(exchanges=exchanges)
 
-    choose_loader = partial(_choose_loader, data_frequency)
+    # A single loader so that its columns are loaded together and its
+    # cached blocks are shared by the pipeline chunks
+    choose_loader = partial(
+        _choose_loader, ExchangePricingLoader(data_frequency)
+    )
 
     if live:
         start, end = _get_live_time_range()
@@ -378,19 +393,20 @@ def _build_algo_and_data(handle_data, initialize, before_trading_start,
             sim_params, exchanges, env, open_calendar, simulate_orders,
             algo_namespace, capital_base, live_graph, stats_output,
             analyze_live, base_currency, namespace, choose_loader,
-            algorithm_class_kwargs)
+            algorithm_class_kwargs, missed_bars, prefetch_seconds)
     else:
         return _build_backtest_algo_and_data(
             exchanges, bundle, env, environ, bundle_timestamp, open_calendar,
             start, end, namespace, choose_loader, sim_params,
-            algorithm_class_kwargs)
+            algorithm_class_kwargs, stats_frequency)
 
 
 def _run(handle_data, initialize, before_trading_start, analyze, algofile,
          algotext, defines, data_frequency, capital_base, data, bundle,
          bundle_timestamp, start, end, output, print_algo, local_namespace,
          environ, live, exchange, algo_namespace, base_currency, live_graph,
-         analyze_live, simulate_orders, stats_output):
+         analyze_live, simulate_orders, stats_output, stats_frequency=None,
+         missed_bars='skip', prefetch_seconds=None):
     """Run an algorithm in backtest,
     paper-trading or live-trading mode.
 
@@ -402,7 +418,8 @@ def _run(handle_data, initialize, before_trading_start, analyze, algofile,
         algotext, defines, data_frequency, capital_base, data, bundle,
         bundle_timestamp, start, end, output, print_algo, local_namespace,
         environ, live, exchange, algo_namespace, base_currency, live_graph,
-        analyze_live, simulate_orders, stats_output)
+        analyze_live, simulate_orders, stats_output, stats_frequency,
+        missed_bars, prefetch_seconds)
     perf = algorithm.run(
         data,
         overwrite_sim_params=False)
@@ -490,6 +507,9 @@ def run_algorithm(initialize,
                   analyze_live=None,
                   simulate_orders=True,
                   stats_output=None,
+                  stats_frequency=None,
+                  missed_bars='skip',
+                  prefetch_seconds=None,
                   output=os.devnull):
     """Run a trading algorithm.
 
@@ -546,6 +566,16 @@ def run_algorithm(initialize,
         This defaults to ``os.environ``.
     live: execute live trading
     exchange_conn: The exchange connection parameters
+    stats_frequency : int or str, optional
+        In minute backtests, record the performance of every Nth minute
+        or of the last minute of each day with ``'daily'``. All the
+        minutes are recorded by default.
+    missed_bars : {'skip', 'catch_up'}, optional
+        In live mode, when ``handle_data`` runs longer than a minute,
+        skip the missed bars or emit each of them late.
+    prefetch_seconds : float, optional
+        In live mode, fetch the market data of each bar this number of
+        seconds before the bar.
 
     Supported Exchanges
     -------------------
@@ -618,4 +648,7 @@ def run_algorithm(initialize,
         live_graph=live_graph,
         analyze_live=analyze_live,
         simulate_orders=simulate_orders,
-        stats_output=stats_output)
+        stats_output=stats_output,
+        stats_frequency=stats_frequency,
+        missed_bars=missed_bars,
+        prefetch_seconds=prefetch_seconds)
@@ -0,0 +1,140 @@
+from unittest import TestCase
+
+import pandas as pd
+from pandas.util.testing import assert_index_equal
+
+from catalyst.utils.calendars.exchange_calendar_open import (
+    OpenExchangeCalendar,
+)
+from catalyst.utils.calendars.trading_calendar import TradingCalendar
+
+
+class OpenCalendarTestCase(TestCase):
+    """
+    Checks the arithmetic lookups of the open calendar against the
+    lookups of TradingCalendar which search all the minutes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = OpenExchangeCalendar(
+            end=pd.Timestamp('2015-03-10', tz='UTC')
+        )
+        cls.dts = [
+            pd.Timestamp(dt, tz='UTC') for dt in [
+                '2015-03-01 00:00',
+                '2015-03-01 00:01',
+                '2015-03-02 12:30',
+                '2015-03-02 12:30:30',
+                '2015-03-04 23:59',
+                '2015-03-04 23:59:30',
+                '2015-03-05 00:00',
+                '2015-03-10 23:58',
+            ]
+        ]
+
+    def test_no_minute_index(self):
+        calendar = OpenExchangeCalendar(
+            end=pd.Timestamp('2015-03-10', tz='UTC')
+        )
+        calendar.minutes_in_range(self.dts[0], self.dts[-1])
+        calendar.minutes_window(self.dts[2], -100)
+        calendar.next_minute(self.dts[2])
+        calendar.minute_to_session_label(self.dts[2])
+
+        self.assertNotIn(
+            calendar, TradingCalendar.__dict__['all_minutes']._cache
+        )
+
+    def test_minutes(self):
+        for dt in self.dts:
+            self.assertEqual(
+                self.calendar.is_open_on_minute(dt),
+                TradingCalendar.is_open_on_minute(self.calendar, dt),
+            )
+            self.assertEqual(
+                self.calendar.next_minute(dt),
+                TradingCalendar.next_minute(self.calendar, dt),
+            )
+
+            if dt != self.dts[0]:
+                self.assertEqual(
+                    self.calendar.previous_minute(dt),
+                    TradingCalendar.previous_minute(self.calendar, dt),
+                )
+
+        with self.assertRaises(ValueError):
+            self.calendar.previous_minute(self.dts[0])
+
+    def test_minutes_window(self):
+        for dt in self.dts:
+            # The base calendar wraps around the windows ending before
+            # its first minute
+            counts = [-100, -1] if dt >= self.dts[2] else []
+            for count in counts + [1, 100, 20000]:
+                assert_index_equal(
+                    self.calendar.minutes_window(dt, count),
+                    TradingCalendar.minutes_window(self.calendar, dt, count),
+                )
+
+    def test_minutes_in_range(self):
+        for start in self.dts:
+            for end in self.dts:
+                assert_index_equal(
+                    self.calendar.minutes_in_range(start, end),
+                    TradingCalendar.minutes_in_range(
+                        self.calendar, start, end
+                    ),
+                )
+
+        assert_index_equal(
+            self.calendar.minutes_in_range(
+                pd.Timestamp('2015-01-01', tz='UTC'),
+                pd.Timestamp('2015-03-01 00:10', tz='UTC'),
+            ),
+            self.calendar.all_minutes[:11],
+        )
+
+    def test_sessions(self):
+        for start in self.dts:
+            for end in self.dts:
+                start_session = start.floor('1D')
+                end_session = end.floor('1D')
+
+                assert_index_equal(
+                    self.calendar.sessions_in_range(
+                        start_session, end_session
+                    ),
+                    TradingCalendar.sessions_in_range(
+                        self.calendar, start_session, end_session
+                    ),
+                )
+                self.assertEqual(
+                    self.calendar.minutes_count_for_sessions_in_range(
+                        start_session, end_session
+                    ),
+                    TradingCalendar.minutes_count_for_sessions_in_range(
+                        self.calendar, start_session, end_session
+                    ),
+                )
+
+    def test_minute_to_session_label(self):
+        for dt in self.dts:
+            for direction in ['next', 'previous']:
+                self.assertEqual(
+                    self.calendar.minute_to_session_label(dt, direction),
+                    TradingCalendar.minute_to_session_label(
+                        self.calendar, dt, direction
+                    ),
+                )
+
+        with self.assertRaises(ValueError):
+            self.calendar.minute_to_session_label(self.dts[5], 'none')
+
+        minutes = self.calendar.minutes_in_range(self.dts[0], self.dts[-1])
+        assert_index_equal(
+            self.calendar.minute_index_to_session_labels(minutes),
+            TradingCalendar.minute_index_to_session_labels(
+                self.calendar, minutes
+            ),
+        )
@@ -1,12 +1,19 @@
+import os
 import random
 import shutil
 import tempfile
+import time
 
+import numpy as np
 import pandas as pd
 from nose.tools import assert_equals
 
+from catalyst.assets._assets import TradingPair
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarWriter, \
-    BcolzExchangeBarReader
+    BcolzExchangeBarReader, BcolzExchangeSparseBarWriter, \
+    BcolzExchangeSparseBarReader, MmapExchangeBarWriter, \
+    MmapExchangeBarReader, BundleCoverage, COVERAGE_FILENAME, \
+    get_bundle_format, convert_bundle
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.utils.bundle_utils import get_df_from_arrays
 
@@ -147,3 +154,337 @@ class TestBcolzWriter(object):
 
     def test_bcolz_poloniex_daily_write_read(self):
         self.bcolz_exchange_daily_write_read('poloniex')
+
+    def test_bcolz_minute_multi_sid_read(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-01 23:59', utc=True)
+        freq = 'minute'
+
+        df1 = self.generate_df('bitfinex', freq, start, end)
+        df2 = self.generate_df('bitfinex', freq, start, end)
+        # The second sid does not trade in the first half of the day
+        df2.iloc[:720] = 0
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+        writer.write([(1, df1), (2, df2)])
+
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+
+        arrays = reader.load_raw_arrays(self.columns, start, end, [1, 2])
+        for sid, index in ((1, 0), (2, 1)):
+            single_arrays = reader.load_raw_arrays(
+                self.columns, start, end, [sid]
+            )
+            for field_index in range(len(self.columns)):
+                np.testing.assert_array_equal(
+                    arrays[field_index][:, index],
+                    single_arrays[field_index][:, 0],
+                )
+
+        closes = arrays[self.columns.index('close')]
+        assert_equals(np.isnan(closes[:720, 1]).all(), True)
+        assert_equals(np.isnan(closes[:, 0]).any(), False)
+
+    def test_bcolz_minute_sparse_write_read(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-01 23:59', utc=True)
+        freq = 'minute'
+
+        df = self.generate_df('bitfinex', freq, start, end)
+        # Only every tenth minute trades
+        df.iloc[[index % 10 != 0 for index in range(len(df))]] = 0
+
+        dense_dir = os.path.join(self.root_dir, 'dense')
+        sparse_dir = os.path.join(self.root_dir, 'sparse')
+        for rootdir, writer_class in ((dense_dir, BcolzExchangeBarWriter),
+                                      (sparse_dir,
+                                       BcolzExchangeSparseBarWriter)):
+            os.makedirs(rootdir)
+            writer = writer_class(
+                rootdir=rootdir,
+                start_session=start,
+                end_session=end,
+                data_frequency=freq,
+                write_metadata=True)
+            writer.write([(1, df)])
+
+        dense = BcolzExchangeBarReader(rootdir=dense_dir,
+                                       data_frequency=freq)
+        sparse = BcolzExchangeSparseBarReader(rootdir=sparse_dir,
+                                              data_frequency=freq)
+        assert_equals(get_bundle_format(sparse_dir), 'sparse')
+        assert_equals(sparse.table_len(1), len(df) // 10)
+
+        window_start = start + pd.Timedelta(minutes=5)
+        window_end = end - pd.Timedelta(minutes=5)
+        dense_arrays = dense.load_raw_arrays(
+            self.columns, window_start, window_end, [1]
+        )
+        sparse_arrays = sparse.load_raw_arrays(
+            self.columns, window_start, window_end, [1]
+        )
+        for dense_array, sparse_array in zip(dense_arrays, sparse_arrays):
+            np.testing.assert_array_equal(dense_array, sparse_array)
+
+        for minutes in (0, 1, 10, 25):
+            dt = start + pd.Timedelta(minutes=minutes)
+            np.testing.assert_equal(
+                dense.get_value(1, dt, 'close'),
+                sparse.get_value(1, dt, 'close'),
+            )
+
+    def test_bcolz_minute_convert_round_trip(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-01 23:59', utc=True)
+        freq = 'minute'
+
+        df = self.generate_df('bitfinex', freq, start, end)
+        # Only every tenth minute trades
+        df.iloc[[index % 10 != 0 for index in range(len(df))]] = 0
+
+        sparse_dir = os.path.join(self.root_dir, 'sparse')
+        os.makedirs(sparse_dir)
+        writer = BcolzExchangeSparseBarWriter(
+            rootdir=sparse_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+        writer.write([(1, df)])
+
+        # Converting to each format and back to the dense format
+        reader = BcolzExchangeSparseBarReader(rootdir=sparse_dir,
+                                              data_frequency=freq)
+        for bundle_format, writer_class, reader_class in (
+                ('mmap', MmapExchangeBarWriter, MmapExchangeBarReader),
+                ('bcolz', BcolzExchangeBarWriter, BcolzExchangeBarReader)):
+            rootdir = os.path.join(self.root_dir, bundle_format)
+            os.makedirs(rootdir)
+            convert_bundle(reader, writer_class(
+                rootdir=rootdir,
+                start_session=start,
+                end_session=end,
+                data_frequency=freq,
+                write_metadata=True), [1])
+
+            assert_equals(get_bundle_format(rootdir), bundle_format)
+            reader = reader_class(rootdir=rootdir, data_frequency=freq)
+
+        dense_arrays = reader.load_raw_arrays(self.columns, start, end, [1])
+        expected = [df[[field]].values for field in self.columns]
+        expected = [
+            np.where(values == 0, 0 if field == 'volume' else np.nan, values)
+            for field, values in zip(self.columns, expected)
+        ]
+        for dense_array, expected_array in zip(dense_arrays, expected):
+            np.testing.assert_allclose(dense_array, expected_array)
+
+        # The last traded minute is 23:50
+        coverage = BundleCoverage(rootdir, freq)
+        assert coverage.covers(1, start, end - pd.Timedelta(minutes=9))
+
+    def test_bcolz_minute_mmap_benchmark(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-03 23:59', utc=True)
+        freq = 'minute'
+
+        df = self.generate_df('bitfinex', freq, start, end)
+
+        readers = dict()
+        for name, writer_class, reader_class in (
+                ('bcolz', BcolzExchangeBarWriter, BcolzExchangeBarReader),
+                ('mmap', MmapExchangeBarWriter, MmapExchangeBarReader)):
+            rootdir = os.path.join(self.root_dir, name)
+            os.makedirs(rootdir)
+            writer = writer_class(
+                rootdir=rootdir,
+                start_session=start,
+                end_session=end,
+                data_frequency=freq,
+                write_metadata=True)
+            writer.write([(1, df)])
+
+            readers[name] = reader_class(rootdir=rootdir,
+                                         data_frequency=freq)
+
+        assert_equals(
+            get_bundle_format(os.path.join(self.root_dir, 'mmap')), 'mmap'
+        )
+
+        windows = []
+        for _ in range(100):
+            window_end = start + pd.Timedelta(
+                minutes=random.randint(1440, 3 * 1440 - 1)
+            )
+            windows.append((window_end - pd.Timedelta(minutes=1439),
+                            window_end))
+
+        results = dict()
+        for name, reader in readers.items():
+            timer = time.time()
+            results[name] = [
+                reader.load_raw_arrays(self.columns, window_start,
+                                       window_end, [1])
+                for window_start, window_end in windows
+            ]
+            print('{}: {} windows in {:.4f}s'.format(
+                name, len(windows), time.time() - timer
+            ))
+
+        for dense_arrays, mmap_arrays in zip(results['bcolz'],
+                                             results['mmap']):
+            for dense_array, mmap_array in zip(dense_arrays, mmap_arrays):
+                np.testing.assert_allclose(dense_array, mmap_array)
+
+    def test_bcolz_minute_coverage(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-05 23:59', utc=True)
+        freq = 'minute'
+
+        df = self.generate_df('bitfinex', freq, start, end)
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        first_day = df.loc[:'2015-04-01 23:59']
+        last_days = df.loc['2015-04-04 00:00':]
+        writer.write([(1, first_day), (2, df)])
+        writer.write([(1, last_days)])
+
+        coverage = BundleCoverage(self.root_dir, freq)
+        assert coverage.exists
+        assert coverage.covers(1, start, first_day.index[-1])
+        assert not coverage.covers(1, start, end)
+        assert coverage.covers(2, start, end)
+
+        missing = coverage.get_missing_ranges([1, 2, 3], start, end)
+        assert_equals(sorted(missing.keys()), [1, 3])
+        assert_equals(missing[1], [(
+            pd.Timestamp('2015-04-02 00:00', tz='UTC'),
+            pd.Timestamp('2015-04-03 23:59', tz='UTC'),
+        )])
+        assert_equals(missing[3], [(start, end)])
+
+        # Bundles without coverage file are indexed from their data
+        os.remove(os.path.join(self.root_dir, COVERAGE_FILENAME))
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        coverage = BundleCoverage(self.root_dir, freq)
+        assert not coverage.exists
+        coverage.build(reader, [1, 2])
+        assert coverage.covers(2, start, end)
+
+        # Planning thousands of chunks only queries the ranges in memory
+        for sid in range(3, 5000):
+            coverage.add(sid, start, end)
+
+        timer = time.time()
+        chunks = [
+            (sid, day) for sid in range(5000)
+            for day in pd.date_range(start, end, freq='D')
+            if not coverage.covers(sid, day, day + pd.Timedelta(hours=23))
+        ]
+        print('planned {} missing chunks in {:.4f}s'.format(
+            len(chunks), time.time() - timer
+        ))
+
+    def test_bcolz_minute_coverage_build_gaps(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-06-30 23:59', utc=True)
+        freq = 'minute'
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        # Two separate ranges ingested, nothing in May
+        writer.write([(1, self.generate_df(
+            'bitfinex', freq, start.replace(day=10),
+            start.replace(day=10, hour=23, minute=59)))])
+        writer.write([(1, self.generate_df(
+            'bitfinex', freq, pd.to_datetime('2015-06-10 00:00', utc=True),
+            pd.to_datetime('2015-06-10 23:59', utc=True)))])
+
+        os.remove(os.path.join(self.root_dir, COVERAGE_FILENAME))
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        coverage = BundleCoverage(self.root_dir, freq)
+        coverage.build(reader, [1])
+
+        assert coverage.covers(
+            1, start, pd.to_datetime('2015-04-30 23:59', utc=True)
+        )
+        assert coverage.covers(
+            1, pd.to_datetime('2015-06-01 00:00', utc=True),
+            pd.to_datetime('2015-06-10 23:59', utc=True)
+        )
+        assert not coverage.covers(
+            1, pd.to_datetime('2015-05-01 00:00', utc=True),
+            pd.to_datetime('2015-05-31 23:59', utc=True)
+        )
+        missing = coverage.get_missing_ranges([1], start, end)
+        assert_equals(missing[1][0], (
+            pd.Timestamp('2015-05-01 00:00', tz='UTC'),
+            pd.Timestamp('2015-05-31 23:59', tz='UTC'),
+        ))
+
+    def test_bcolz_minute_coverage_empty_edges(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-30 23:59', utc=True)
+        freq = 'minute'
+
+        asset = TradingPair(
+            symbol='eth_btc',
+            exchange='bitfinex',
+            sid=1,
+            start_date=pd.to_datetime('2015-03-01', utc=True),
+            end_minute=pd.to_datetime('2015-06-01', utc=True),
+        )
+
+        # An illiquid chunk without trades in its first and last hours
+        df = self.generate_df('bitfinex', freq, start, end)
+        df.iloc[:60] = np.nan
+        df.iloc[-60:] = np.nan
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        bundle = ExchangeBundle('bitfinex')
+        bundle.write_ctable(
+            ctable=dict(asset=asset, period='2015-04', path=None, df=df),
+            data_frequency=freq,
+            writer=writer,
+            empty_rows_behavior='strip'
+        )
+
+        # The chunk is not planned again by the next ingestion
+        coverage = BundleCoverage(self.root_dir, freq)
+        assert coverage.covers(
+            asset.sid, start.replace(hour=23, minute=59), end
+        )
+        assert coverage.covers(asset.sid, start, end)
+
+        # Bundles without coverage file are indexed by whole chunks
+        os.remove(os.path.join(self.root_dir, COVERAGE_FILENAME))
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        coverage = BundleCoverage(self.root_dir, freq)
+        coverage.build(reader, [asset.sid])
+        assert coverage.covers(asset.sid, start, end)
@@ -1,8 +1,12 @@
 # import hashlib
 import os
+import random
+import shutil
 import tempfile
+import time
 from logging import getLogger
 
+import numpy as np
 import pandas as pd
 
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
@@ -11,7 +15,8 @@ from catalyst.exchange.exchange_bundle import ExchangeBundle, \
     BUNDLE_NAME_TEMPLATE
 from catalyst.exchange.utils.bundle_utils import get_bcolz_chunk, \
     get_start_dt, get_df_from_arrays
-from catalyst.exchange.utils.exchange_utils import get_exchange_folder
+from catalyst.exchange.utils.exchange_utils import get_exchange_folder, \
+    get_sid
 from catalyst.exchange.utils.factory import get_exchange
 from catalyst.exchange.utils.stats_utils import df_to_string
 from catalyst.utils.paths import ensure_directory
@@ -547,3 +552,80 @@ class TestExchangeBundle:
             end_dt=end_dt
         )
         pass
+
+    def test_ingest_csv_chunks(self):
+        data_frequency = 'minute'
+        start_dt = pd.to_datetime('2017-6-3 10:00', utc=True)
+
+        class CsvExchange(object):
+            name = 'bittrex'
+
+            def get_market(self, symbol):
+                base, quote = symbol.upper().split('_')
+                return dict(
+                    id='{}-{}'.format(quote, base), base=base, quote=quote
+                )
+
+            def get_asset_def(self, market, is_local=False):
+                return None
+
+        rows = []
+        for minute in range(0, 1800, 3):
+            dt = (start_dt + pd.Timedelta(minutes=minute)).tz_localize(None)
+            for index, symbol in enumerate(['bat_eth', 'neo_eth']):
+                if minute > 1200 and symbol == 'neo_eth':
+                    continue
+
+                price = 1 + index + minute / 10000.0
+                rows.append(dict(
+                    symbol=symbol, last_traded=dt, open=price, high=price,
+                    low=price, close=price, volume=minute + 1
+                ))
+
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, 'prices.csv')
+        pd.DataFrame(rows).to_csv(path, index=False)
+
+        readers = []
+        exchange_folders = []
+        for exchange_name, chunksize in (('csv_memory', None),
+                                         ('csv_chunks', 100)):
+            exchange_bundle = ExchangeBundle(exchange_name)
+            exchange_bundle.exchange = CsvExchange()
+            exchange_bundle.ingest_csv(
+                path, data_frequency, chunksize=chunksize
+            )
+
+            readers.append(exchange_bundle.get_reader(data_frequency))
+            exchange_folders.append(get_exchange_folder(exchange_name))
+
+        end_dt = pd.to_datetime('2017-6-4 23:59', utc=True)
+        for sid in (get_sid('bat_eth'), get_sid('neo_eth')):
+            arrays = [
+                reader.load_raw_arrays(
+                    ['close', 'volume'], start_dt, end_dt, [sid]
+                ) for reader in readers
+            ]
+            for memory_array, chunks_array in zip(*arrays):
+                np.testing.assert_array_equal(memory_array, chunks_array)
+
+        # The last day is filled with the last row of each symbol
+        close = readers[1].get_value(get_sid('neo_eth'), end_dt, 'close')
+        np.testing.assert_almost_equal(close, 2 + 1200 / 10000.0)
+
+        for exchange_folder in exchange_folders + [folder]:
+            shutil.rmtree(exchange_folder)
+
+    def test_iter_ctables_order(self):
+        chunks = [dict(asset=None, period=str(index)) for index in range(20)]
+
+        class DelayedBundle(ExchangeBundle):
+            def read_ctable(self, asset, data_frequency, period):
+                time.sleep(random.random() / 100)
+                return dict(period=period, nbytes=0)
+
+        exchange_bundle = DelayedBundle('poloniex')
+        ctables = exchange_bundle.iter_ctables(chunks, 'minute', jobs=4)
+
+        periods = [ctable['period'] for ctable in ctables]
+        assert periods == [chunk['period'] for chunk in chunks]
@@ -0,0 +1,84 @@
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_candle_cache import CandleCache
+
+
+class FakeExchange(object):
+    def __init__(self, now):
+        self.name = 'binance'
+        self.now = now
+        self.requests = []
+
+    @property
+    def market(self):
+        return self
+
+    def get_candles(self, freq, assets, bar_count=None, start_dt=None,
+                    end_dt=None):
+        self.requests.append(bar_count)
+
+        candles = []
+        for index in range(bar_count):
+            dt = start_dt + pd.Timedelta(minutes=index)
+            if dt > self.now:
+                break
+
+            # The price is the number of minutes since the epoch
+            price = float(dt.value // 60000000000)
+            candles.append(dict(
+                last_traded=dt, open=price, high=price, low=price,
+                close=price, volume=1.0,
+            ))
+
+        return dict((asset, candles) for asset in assets)
+
+
+class TestCandleCache(object):
+    def setUp(self):
+        self.asset = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.end_dt = pd.Timestamp('2018-01-01 01:00', tz='UTC')
+        self.exchange = FakeExchange(self.end_dt)
+        self.cache = CandleCache()
+
+    def _window(self, bar_count):
+        start_dt = self.end_dt - pd.Timedelta(minutes=bar_count)
+        dts, values = self.cache.get_windows(
+            self.exchange, [self.asset], '1T', bar_count, start_dt,
+            self.end_dt,
+        )[self.asset]
+
+        expected = pd.date_range(start_dt, periods=bar_count, freq='T')
+        assert_equals(list(dts), list(expected.asi8))
+        assert_equals(
+            list(values['close']),
+            [float(dt // 60000000000) for dt in expected.asi8],
+        )
+
+    def test_rolling_updates(self):
+        self._window(100)
+        assert_equals(self.exchange.requests, [100])
+
+        for _ in range(300):
+            self.end_dt += pd.Timedelta(minutes=1)
+            self.exchange.now = self.end_dt
+
+            self._window(100)
+            self._window(20)
+
+        # Only the new candles were fetched, once per minute
+        assert_equals(len(self.exchange.requests), 301)
+        assert_equals(max(self.exchange.requests[1:]), 3)
+
+        buffer = self.cache._buffers[('binance', self.asset, '1T')]
+        assert_equals(len(buffer), buffer.capacity)
+
+    def test_larger_window(self):
+        self._window(20)
+        self._window(50)
+        assert_equals(self.exchange.requests, [20, 50])
+
+        # The smaller window is served from the larger buffer
+        self._window(20)
+        assert_equals(self.exchange.requests, [20, 50])
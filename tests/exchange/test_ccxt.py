@@ -1,8 +1,14 @@
+import threading
+import time
+
 import pandas as pd
 from logbook import Logger
+from nose.tools import assert_equals, assert_raises
 
 from base import BaseExchangeTestCase
+from catalyst.assets._assets import TradingPair
 from catalyst.exchange.ccxt.ccxt_exchange import CCXT
+from catalyst.exchange.exchange_errors import SymbolNotFoundOnExchange
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
 from catalyst.exchange.utils.exchange_utils import get_exchange_auth
 from catalyst.finance.order import Order
@@ -93,3 +99,203 @@ class TestCCXT(BaseExchangeTestCase):
 
     def test_get_fees(self):
         pass
+
+
+class FakeCCXTApi(object):
+    """
+    Local stand-in for a CCXT exchange which records the requests.
+    """
+
+    def __init__(self, has_fetch_tickers=True, delay=0.05):
+        self.has = dict(fetchTickers=has_fetch_tickers)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _request(self, name, symbol):
+        with self._lock:
+            self.calls.append((name, symbol))
+            self.active += 1
+            self.max_active = max(self.active, self.max_active)
+
+        time.sleep(self.delay)
+
+        with self._lock:
+            self.active -= 1
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None,
+                    params=None):
+        self._request('fetch_ohlcv', symbol)
+        price = float(len(symbol))
+        return [
+            [1514764800000 + i * 60000, price, price, price, price, i]
+            for i in range(limit)
+        ]
+
+    def _ticker(self, symbol):
+        return dict(
+            symbol=symbol,
+            timestamp=1514764800000,
+            last=float(len(symbol)),
+            baseVolume=10.0,
+        )
+
+    def fetch_ticker(self, symbol):
+        self._request('fetch_ticker', symbol)
+        return self._ticker(symbol)
+
+    def fetch_tickers(self, symbols=None):
+        self._request('fetch_tickers', symbols)
+        # The bulk response omits the last symbol
+        return dict(
+            (symbol, self._ticker(symbol)) for symbol in symbols[:-1]
+        )
+
+
+class TestCCXTConcurrentRequests(object):
+    def setup(self):
+        self.exchange = CCXT(
+            exchange_name='binance',
+            key='',
+            secret='',
+            base_currency='eth',
+        )
+        self.assets = [
+            TradingPair(symbol=symbol, exchange='binance', sid=sid)
+            for sid, symbol in enumerate(
+                ['eth_btc', 'neo_eth', 'eng_eth', 'trx_eth', 'xrp_eth',
+                 'ltc_eth', 'iota_eth', 'zrx_eth']
+            )
+        ]
+
+    def test_get_candles(self):
+        api = FakeCCXTApi()
+        self.exchange.api = api
+        self.exchange.max_concurrent_requests = 4
+
+        candles = self.exchange.get_candles(
+            freq='1T', assets=self.assets, bar_count=3
+        )
+
+        assert_equals(len(api.calls), len(self.assets))
+        assert_equals(api.max_active, 4)
+        for asset in self.assets:
+            symbol = self.exchange.get_symbol(asset)
+            assert_equals(len(candles[asset]), 3)
+            assert_equals(candles[asset][-1]['close'], float(len(symbol)))
+            assert_equals(
+                candles[asset][0]['last_traded'],
+                pd.Timestamp('2018-01-01', tz='UTC')
+            )
+
+    def test_tickers_bulk(self):
+        api = FakeCCXTApi()
+        self.exchange.api = api
+
+        tickers = self.exchange.tickers(self.assets)
+
+        assert_equals(len(tickers), len(self.assets))
+        assert_equals(
+            [name for name, _ in api.calls],
+            ['fetch_tickers', 'fetch_ticker']
+        )
+        for asset in self.assets:
+            symbol = self.exchange.get_symbol(asset)
+            assert_equals(tickers[asset]['last_price'], float(len(symbol)))
+            assert_equals(tickers[asset]['volume'], 10.0)
+
+    def test_tickers_individual(self):
+        api = FakeCCXTApi(has_fetch_tickers=False)
+        self.exchange.api = api
+        self.exchange.max_concurrent_requests = 2
+
+        tickers = self.exchange.tickers(self.assets)
+
+        assert_equals(len(tickers), len(self.assets))
+        assert_equals(len(api.calls), len(self.assets))
+        assert_equals(api.max_active, 2)
+
+    def test_max_requests_per_minute(self):
+        api = FakeCCXTApi(has_fetch_tickers=False, delay=0)
+        self.exchange.api = api
+        self.exchange.max_requests_per_minute = len(self.assets)
+
+        self.exchange.tickers(self.assets)
+
+        metrics = self.exchange.rate_limiter.metrics['public']
+        assert_equals(metrics['requests'], len(self.assets))
+        assert_equals(metrics['waits'], 0)
+
+
+class TestCCXTAssetIndex(object):
+    def setup(self):
+        self.exchange = CCXT(
+            exchange_name='binance',
+            key='',
+            secret='',
+            base_currency='eth',
+        )
+
+        self.markets = []
+        symbol_map = dict()
+        for i in range(2000):
+            base = 'c{}'.format(i)
+            market = dict(
+                id='{}ETH'.format(base.upper()),
+                symbol='{}/ETH'.format(base.upper()),
+                base=base.upper(),
+                quote='ETH',
+            )
+            self.markets.append(market)
+
+            if i % 2 == 0:
+                symbol_map[market['id']] = dict(
+                    symbol='{}_eth'.format(base),
+                    start_date=pd.Timestamp('2017-01-01', tz='UTC'),
+                    end_daily=pd.Timestamp('2018-01-01', tz='UTC'),
+                    end_minute='N/A',
+                )
+
+        self.exchange.markets = self.markets
+        self.exchange._symbol_maps = [symbol_map, dict()]
+
+    def test_load_assets_benchmark(self):
+        timer = time.time()
+        self.exchange.load_assets()
+        print('cold start: {} markets in {:.4f}s'.format(
+            len(self.markets), time.time() - timer
+        ))
+        assert_equals(len(self.exchange.assets), len(self.markets))
+
+        symbols = ['c{}_eth'.format(i) for i in range(0, 2000, 7)]
+
+        timer = time.time()
+        for symbol in symbols:
+            asset = self.exchange.get_asset(symbol)
+            assert_equals(asset.symbol, symbol)
+            assert_equals(self.exchange.get_assets_by_sid(asset.sid), [asset])
+        elapsed = time.time() - timer
+        print('indexed lookups: {:.0f} lookups/s'.format(
+            2 * len(symbols) / elapsed
+        ))
+
+        timer = time.time()
+        for symbol in symbols:
+            [a for a in self.exchange.assets if a.symbol.lower() == symbol]
+            [a for a in self.exchange.assets if a.sid == asset.sid]
+        elapsed = time.time() - timer
+        print('linear scans: {:.0f} lookups/s'.format(
+            2 * len(symbols) / elapsed
+        ))
+
+        asset = self.exchange.get_asset('C14ETH', is_exchange_symbol=True)
+        assert_equals(asset.symbol, 'c14_eth')
+        assert_equals(asset.end_daily, pd.Timestamp('2018-01-01', tz='UTC'))
+
+        # Refreshing the asset list invalidates the indexes
+        self.exchange.assets = self.exchange.assets[:10]
+        assert_raises(
+            SymbolNotFoundOnExchange, self.exchange.get_asset, 'c14_eth'
+        )
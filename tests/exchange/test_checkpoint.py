@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_checkpoint import AlgoCheckpoint
+from catalyst.finance.performance.period import PerformancePeriod
+from catalyst.finance.performance.position_tracker import PositionTracker
+from catalyst.finance.transaction import Transaction
+
+
+class FakeTracker(object):
+    def __init__(self):
+        self.position_tracker = PositionTracker('minute')
+
+        self.cumulative_performance = PerformancePeriod(
+            starting_cash=1000.0,
+            data_frequency='minute',
+            keep_transactions=False,
+            keep_orders=False,
+        )
+        self.cumulative_performance.position_tracker = self.position_tracker
+
+        self.todays_performance = PerformancePeriod(
+            starting_cash=1000.0,
+            data_frequency='minute',
+            keep_transactions=True,
+            keep_orders=True,
+        )
+        self.todays_performance.position_tracker = self.position_tracker
+
+    def process_transaction(self, txn):
+        self.cumulative_performance.handle_execution(txn)
+        self.todays_performance.handle_execution(txn)
+        self.position_tracker.execute_transaction(txn)
+
+
+class TestAlgoCheckpoint(object):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.environ = dict(CATALYST_ROOT=self.root_dir)
+        self.asset = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.dt = pd.Timestamp('2018-01-01 00:00', tz='UTC')
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir)
+
+    def _trade(self, tracker, checkpoint, amount, price):
+        txn = Transaction(self.asset, amount, self.dt, price, 'order_1')
+        tracker.process_transaction(txn)
+        checkpoint.record_transaction(txn)
+
+        if self.asset in tracker.position_tracker.positions:
+            tracker.position_tracker.update_position(
+                self.asset, last_sale_price=price, last_sale_date=self.dt,
+            )
+        tracker.cumulative_performance.calculate_performance()
+
+    def test_journal_and_restore(self):
+        tracker = FakeTracker()
+        checkpoint = AlgoCheckpoint('algo', self.environ, snapshot_bars=10)
+
+        # The first commit saves the initial state
+        assert checkpoint.commit(tracker)
+        assert not os.path.isfile(checkpoint.journal_path)
+
+        self._trade(tracker, checkpoint, 2, 100.0)
+        assert not checkpoint.commit(tracker)
+        assert_equals(checkpoint.seq, 1)
+
+        # Nothing changed, nothing is journaled
+        assert not checkpoint.commit(tracker)
+        assert_equals(checkpoint.seq, 1)
+
+        self._trade(tracker, checkpoint, -1, 110.0)
+        assert not checkpoint.commit(tracker)
+        assert_equals(checkpoint.seq, 2)
+
+        restored = FakeTracker()
+        assert AlgoCheckpoint('algo', self.environ).restore(restored)
+
+        perf = tracker.cumulative_performance
+        restored_perf = restored.cumulative_performance
+        assert_equals(restored_perf.ending_cash, perf.ending_cash)
+        assert_equals(restored_perf.ending_value, perf.ending_value)
+        assert_equals(restored_perf.pnl, perf.pnl)
+
+        position = restored.position_tracker.positions[self.asset]
+        assert_equals(position.amount, 1)
+        assert_equals(position.last_sale_price, 110.0)
+
+        transactions = restored.todays_performance.processed_transactions
+        assert_equals(len(transactions[self.dt]), 2)
+
+    def test_snapshot_interval(self):
+        tracker = FakeTracker()
+        checkpoint = AlgoCheckpoint('algo', self.environ, snapshot_bars=2)
+
+        assert checkpoint.commit(tracker)
+        self._trade(tracker, checkpoint, 2, 100.0)
+        assert not checkpoint.commit(tracker)
+        assert not checkpoint.commit(tracker)
+
+        # The journal is folded into a new snapshot
+        assert checkpoint.commit(tracker)
+        assert not os.path.isfile(checkpoint.journal_path)
+
+        # Closing the position
+        self._trade(tracker, checkpoint, -2, 100.0)
+        assert not checkpoint.commit(tracker)
+
+        restored = FakeTracker()
+        assert AlgoCheckpoint('algo', self.environ).restore(restored)
+        assert self.asset not in restored.position_tracker.positions
+        assert_equals(
+            restored.cumulative_performance.ending_cash,
+            tracker.cumulative_performance.ending_cash,
+        )
@@ -0,0 +1,156 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+
+from nose.tools import assert_equals
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+from catalyst.exchange.exchange_chunk_cache import ExchangeChunkCache, \
+    extract_archive
+
+
+class ChunkRequestHandler(BaseHTTPRequestHandler):
+    """
+    Local stand-in for the bundle server, supporting range requests.
+    """
+    files = dict()
+    requests = []
+
+    def do_GET(self):
+        name = self.path.lstrip('/')
+        content = self.files.get(name)
+        range_header = self.headers.get('Range')
+        self.requests.append((name, range_header))
+
+        if content is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if range_header is not None:
+            offset = int(range_header.split('=')[1].rstrip('-'))
+            if offset >= len(content):
+                self.send_response(416)
+                self.end_headers()
+                return
+
+            self.send_response(206)
+            content = content[offset:]
+
+        else:
+            self.send_response(200)
+
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def create_archive(files):
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode='w:gz') as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    return data.getvalue()
+
+
+class TestExchangeChunkCache(object):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+
+        ChunkRequestHandler.files = dict(
+            (name, create_archive({'{}.bin'.format(name): os.urandom(4096)}))
+            for name in ['chunk-1', 'chunk-2', 'chunk-3']
+        )
+        ChunkRequestHandler.requests = []
+
+        self.server = HTTPServer(('127.0.0.1', 0), ChunkRequestHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.url = 'http://127.0.0.1:{}/{{}}'.format(self.server.server_port)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.root_dir)
+
+    def test_cached_chunk(self):
+        cache = ExchangeChunkCache(os.path.join(self.root_dir, 'cache'))
+
+        path = cache.get_archive('chunk-1', self.url.format('chunk-1'))
+        extract_archive(path, os.path.join(self.root_dir, 'chunk-1'))
+        assert os.path.isfile(
+            os.path.join(self.root_dir, 'chunk-1', 'chunk-1.bin')
+        )
+
+        # The index is persisted, another cache finds the same archive
+        cache = ExchangeChunkCache(os.path.join(self.root_dir, 'cache'))
+        assert_equals(
+            cache.get_archive('chunk-1', self.url.format('chunk-1')), path
+        )
+        assert_equals(len(ChunkRequestHandler.requests), 1)
+
+        # Corrupted archives are downloaded again
+        with open(path, 'ab') as f:
+            f.write(b'corrupted')
+
+        assert_equals(
+            cache.get_archive('chunk-1', self.url.format('chunk-1')), path
+        )
+        assert_equals(len(ChunkRequestHandler.requests), 2)
+
+    def test_mutable_chunk(self):
+        cache = ExchangeChunkCache(os.path.join(self.root_dir, 'cache'))
+
+        for _ in range(2):
+            path = cache.get_archive(
+                'chunk-1', self.url.format('chunk-1'), immutable=False
+            )
+            os.remove(path)
+
+        assert_equals(len(ChunkRequestHandler.requests), 2)
+        assert_equals(cache.size, 0)
+
+    def test_resume_download(self):
+        cache = ExchangeChunkCache(os.path.join(self.root_dir, 'cache'))
+
+        content = ChunkRequestHandler.files['chunk-2']
+        partial_path = os.path.join(
+            self.root_dir, 'cache', 'partial', 'chunk-2.tar.gz'
+        )
+        with open(partial_path, 'wb') as f:
+            f.write(content[:1000])
+
+        path = cache.get_archive('chunk-2', self.url.format('chunk-2'))
+        with open(path, 'rb') as f:
+            assert_equals(f.read(), content)
+
+        assert_equals(
+            ChunkRequestHandler.requests, [('chunk-2', 'bytes=1000-')]
+        )
+
+    def test_eviction(self):
+        size = len(ChunkRequestHandler.files['chunk-1'])
+        cache = ExchangeChunkCache(
+            os.path.join(self.root_dir, 'cache'), max_size=int(size * 2.5)
+        )
+
+        paths = dict()
+        for name in ['chunk-1', 'chunk-2', 'chunk-1', 'chunk-3']:
+            paths[name] = cache.get_archive(name, self.url.format(name))
+
+        # chunk-2 is the least recently used
+        assert not os.path.isfile(paths['chunk-2'])
+        assert os.path.isfile(paths['chunk-1'])
+        assert os.path.isfile(paths['chunk-3'])
+        assert cache.size <= cache.max_size
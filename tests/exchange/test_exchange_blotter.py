@@ -0,0 +1,117 @@
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_blotter import ExchangeBlotter
+from catalyst.finance.order import Order, ORDER_STATUS
+
+
+class FakeExchange(object):
+    def __init__(self):
+        self.name = 'binance'
+        self.requests = []
+        self.states = dict()
+        self.last_prices = dict()
+
+    @property
+    def market(self):
+        return self
+
+    def get_orders(self, orders):
+        self.requests.append([order_id for order_id, _ in orders])
+        return dict(
+            (order_id, self.states[order_id]) for order_id, _ in orders
+        )
+
+    def tickers(self, assets):
+        return dict(
+            (asset, dict(last_price=self.last_prices[asset]))
+            for asset in assets if asset in self.last_prices
+        )
+
+
+class TestExchangeBlotter(object):
+    def setUp(self):
+        self.exchange = FakeExchange()
+        self.blotter = ExchangeBlotter(
+            data_frequency='minute',
+            exchanges=dict(binance=self.exchange),
+            attempts=dict(
+                get_transactions_attempts=1,
+                retry_sleeptime=0,
+            ),
+        )
+        self.asset = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.dt = pd.Timestamp('2018-01-01', tz='UTC')
+
+    def _open_order(self, order_id, amount):
+        order = Order(
+            dt=self.dt, asset=self.asset, amount=amount, limit=0.1,
+            id=order_id,
+        )
+        self.blotter.open_orders[self.asset].append(order)
+        self.blotter.orders[order_id] = order
+        return order
+
+    def _set_state(self, order_id, amount, filled, executed_price, status):
+        order = Order(
+            dt=self.dt, asset=self.asset, amount=amount, filled=filled,
+            id=order_id,
+        )
+        order.status = status
+        self.exchange.states[order_id] = (order, executed_price)
+
+    def test_partial_fills(self):
+        order = self._open_order('order_1', 10)
+        self._open_order('order_2', -5)
+        self._set_state('order_1', 10, 4, 100.0, ORDER_STATUS.OPEN)
+        self._set_state('order_2', -5, 0, None, ORDER_STATUS.OPEN)
+
+        transactions, _, closed_orders = self.blotter.get_transactions(None)
+        assert_equals(
+            [(txn.order_id, txn.amount, txn.price) for txn in transactions],
+            [('order_1', 4, 100.0)],
+        )
+        assert_equals(closed_orders, [])
+        assert_equals(order.filled, 4)
+
+        # The rest is filled at 105, the average price being 103
+        self._set_state('order_1', 10, 10, 103.0, ORDER_STATUS.FILLED)
+        self._set_state('order_2', -5, 0, None, ORDER_STATUS.CANCELLED)
+
+        transactions, _, closed_orders = self.blotter.get_transactions(None)
+        assert_equals(
+            [(txn.order_id, txn.amount, txn.price) for txn in transactions],
+            [('order_1', 6, 105.0)],
+        )
+        assert_equals(
+            sorted(order.id for order in closed_orders),
+            ['order_1', 'order_2'],
+        )
+
+        # The orders of the exchange are requested at once
+        assert_equals(
+            self.exchange.requests,
+            [['order_1', 'order_2'], ['order_1', 'order_2']],
+        )
+
+    def test_fill_without_price(self):
+        order = self._open_order('order_1', 10)
+        self._set_state('order_1', 10, 10, None, ORDER_STATUS.FILLED)
+
+        # The order stays open until the fill can be priced
+        transactions, _, closed_orders = self.blotter.get_transactions(None)
+        assert_equals(transactions, [])
+        assert_equals(closed_orders, [])
+        assert order.open
+        assert_equals(order.filled, 0)
+
+        # The fill is priced at the last traded price
+        self.exchange.last_prices[self.asset] = 101.0
+        transactions, _, closed_orders = self.blotter.get_transactions(None)
+        assert_equals(
+            [(txn.order_id, txn.amount, txn.price) for txn in transactions],
+            [('order_1', 10, 101.0)],
+        )
+        assert_equals(closed_orders, [order])
+        assert_equals(order.filled, 10)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.exchange_frame_stats import FrameStatsAccumulator
+
+
+class TestFrameStatsAccumulator(object):
+    def setUp(self):
+        self.start_dt = pd.Timestamp('2018-01-01 23:58', tz='UTC')
+
+    def _stats(self, minute):
+        dt = self.start_dt + pd.Timedelta(minutes=minute)
+        return dict(
+            period_open=dt,
+            period_close=dt + pd.Timedelta(minutes=1),
+            portfolio_value=1000.0 + minute,
+            trading_days=minute,
+            period_label=dt.strftime('%Y-%m'),
+            sharpe=None if minute < 2 else 1.5,
+            positions=[dict(amount=1)] if minute >= 3 else [],
+            transactions=[dict(amount=1)] if minute == 3 else [],
+            orders=[],
+        )
+
+    def test_to_frame(self):
+        accumulator = FrameStatsAccumulator(capacity=2)
+        stats = [self._stats(minute) for minute in range(5)]
+        for bar_stats in stats:
+            accumulator.append(bar_stats)
+
+        assert_equals(len(accumulator), 5)
+
+        df = accumulator.to_frame()
+        expected = pd.DataFrame(stats)
+        assert_equals(sorted(df.columns), sorted(expected.columns))
+
+        for column in ('period_close', 'portfolio_value', 'trading_days',
+                       'period_label', 'positions', 'transactions'):
+            assert_equals(list(df[column]), list(expected[column]))
+
+        assert_equals(df['trading_days'].dtype, np.int64)
+        assert np.isnan(df['sharpe'].iloc[0])
+        assert_equals(df['sharpe'].iloc[-1], 1.5)
+
+        # Unchanged positions are stored once
+        assert_equals(len(accumulator._event_values['positions']), 2)
+
+    def test_frequency(self):
+        accumulator = FrameStatsAccumulator(frequency='daily')
+        recorded = [
+            accumulator.should_record(self.start_dt + pd.Timedelta(minutes=m))
+            for m in range(4)
+        ]
+        assert_equals(recorded, [False, True, False, False])
+
+        accumulator = FrameStatsAccumulator(frequency=3)
+        recorded = [accumulator.should_record(self.start_dt) for _ in range(7)]
+        assert_equals(
+            recorded, [True, False, False, True, False, False, True]
+        )
+
+        assert_raises(ValueError, FrameStatsAccumulator, frequency=0)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_history_loader import ExchangeHistoryLoader
+from catalyst.exchange.utils.bundle_utils import get_start_dt
+
+
+class FakeBundle(object):
+    def __init__(self, end_dt):
+        self.exchange_name = 'binance'
+        self.end_dt = end_dt
+        self.reads = []
+
+    def get_history_window_series_and_load(self, assets, end_dt, bar_count,
+                                           field, data_frequency,
+                                           algo_end_dt=None):
+        assert end_dt <= self.end_dt
+
+        self.reads.append(bar_count)
+        start_dt = get_start_dt(end_dt, bar_count, data_frequency, False)
+        periods = pd.date_range(start_dt, end_dt, freq='T')
+
+        # The value is the number of minutes since the epoch
+        values = (periods.asi8 // 60000000000).astype(np.float64)
+        return dict(
+            (asset, pd.Series(values * asset.sid, index=periods))
+            for asset in assets
+        )
+
+
+class TestExchangeHistoryLoader(object):
+    def setUp(self):
+        self.algo_end_dt = pd.Timestamp('2018-01-02', tz='UTC')
+        self.bundle = FakeBundle(
+            self.algo_end_dt + pd.Timedelta(days=1, minutes=-1)
+        )
+        self.loader = ExchangeHistoryLoader(
+            self.bundle, prefetch_length=dict(minute=100)
+        )
+        self.eth = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.neo = TradingPair(symbol='neo_btc', exchange='binance', sid=2)
+
+    def _history(self, end_dt, bar_count):
+        series = self.loader.history(
+            [self.eth, self.neo], end_dt, bar_count, 'close', 'minute',
+            algo_end_dt=self.algo_end_dt,
+        )
+        expected = pd.date_range(end=end_dt, periods=bar_count, freq='T')
+        for asset in series:
+            assert_equals(list(series[asset].index), list(expected))
+            assert_equals(
+                list(series[asset].values),
+                [float(dt // 60000000000) * asset.sid
+                 for dt in expected.asi8],
+            )
+
+    def test_sliding_window(self):
+        end_dt = pd.Timestamp('2018-01-01 12:00', tz='UTC')
+        for minute in range(300):
+            self._history(end_dt + pd.Timedelta(minutes=minute), 200)
+
+        # Reading 200 bars every 100 bars for both assets at once
+        assert_equals(self.bundle.reads, [300, 300, 300])
+
+    def test_algo_end(self):
+        end_dt = pd.Timestamp('2018-01-02 23:00', tz='UTC')
+        for minute in range(60):
+            self._history(end_dt + pd.Timedelta(minutes=minute), 20)
+
+        # Not prefetching beyond the last minute of the simulation
+        assert_equals(self.bundle.reads, [79])
@@ -0,0 +1,106 @@
+from collections import Counter
+
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_snapshot import MarketSnapshot
+
+
+class FakeExchange(object):
+    def __init__(self):
+        self.name = 'binance'
+        self.max_concurrent_requests = 4
+        self.requests = Counter()
+
+    def tickers(self, assets):
+        self.requests['tickers'] += 1
+        return dict((asset, dict(last_price=1.0)) for asset in assets)
+
+    def get_candles(self, freq, assets, bar_count=None, start_dt=None,
+                    end_dt=None):
+        self.requests['candles'] += 1
+        return dict(
+            (asset, [dict(last_traded=end_dt, close=1.0)])
+            for asset in assets
+        )
+
+    def get_balances(self):
+        self.requests['balances'] += 1
+        return dict(btc=dict(free=1.0))
+
+    def get_order(self, order_id, asset_or_symbol=None):
+        self.requests['orders'] += 1
+        return order_id, 1.0
+
+    def get_orders(self, orders):
+        self.requests['orders'] += 1
+        return dict((order_id, (order_id, 1.0)) for order_id, _ in orders)
+
+
+class TestMarketSnapshot(object):
+    def setUp(self):
+        self.exchange = FakeExchange()
+        self.snapshot = MarketSnapshot(self.exchange)
+        self.eth = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.neo = TradingPair(symbol='neo_btc', exchange='binance', sid=2)
+        self.dt = pd.Timestamp('2018-01-01 00:01', tz='UTC')
+
+    def test_deduplicate(self):
+        self.snapshot.start(self.dt)
+
+        self.snapshot.tickers([self.eth])
+        tickers = self.snapshot.tickers([self.eth, self.neo])
+        assert_equals(sorted(tickers, key=lambda a: a.sid),
+                      [self.eth, self.neo])
+        self.snapshot.tickers([self.neo])
+        assert_equals(self.exchange.requests['tickers'], 2)
+
+        self.snapshot.get_balances()
+        self.snapshot.get_balances()
+        assert_equals(self.exchange.requests['balances'], 1)
+
+        self.snapshot.get_order('order_1', self.eth)
+        self.snapshot.get_order('order_1', self.eth)
+        assert_equals(self.exchange.requests['orders'], 1)
+
+        # The data of the previous bar is not used
+        self.snapshot.start(self.dt + pd.Timedelta(minutes=1))
+        self.snapshot.get_balances()
+        assert_equals(self.exchange.requests['balances'], 2)
+
+    def test_prefetch(self):
+        self.snapshot.start(self.dt)
+        self.snapshot.get_candles(
+            '5T', [self.eth], bar_count=10,
+            start_dt=self.dt - pd.Timedelta(minutes=50), end_dt=self.dt,
+        )
+        assert_equals(self.exchange.requests['candles'], 1)
+
+        next_dt = self.dt + pd.Timedelta(minutes=1)
+        self.snapshot.prefetch(
+            next_dt,
+            assets=[self.eth],
+            orders=[('order_1', self.eth)],
+            balances=True,
+        )
+        assert_equals(
+            dict(self.exchange.requests),
+            dict(tickers=1, candles=2, balances=1, orders=1),
+        )
+
+        # The same requests are served from the snapshot
+        self.snapshot.prefetch(next_dt, assets=[self.eth])
+        self.snapshot.tickers([self.eth])
+        self.snapshot.get_balances()
+        self.snapshot.get_order('order_1', self.eth)
+        self.snapshot.get_orders([('order_1', self.eth)])
+        candles = self.snapshot.get_candles(
+            '5T', self.eth, bar_count=10,
+            start_dt=next_dt - pd.Timedelta(minutes=50), end_dt=next_dt,
+        )
+        assert_equals(candles[0]['last_traded'], next_dt)
+        assert_equals(
+            dict(self.exchange.requests),
+            dict(tickers=1, candles=2, balances=1, orders=1),
+        )
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_pricing_loader import (
+    ExchangePricingLoader,
+    TradingPairPricing,
+)
+
+START_DT = pd.Timestamp('2018-01-01', tz='UTC')
+
+
+class FakeReader(object):
+    def __init__(self):
+        self.first_trading_day = pd.Timestamp('2018-01-02', tz='UTC')
+        self.last_available_dt = pd.Timestamp('2018-01-31 23:59', tz='UTC')
+        self.reads = []
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        self.reads.append((start_dt, end_dt, sids))
+
+        # The close is the number of days since START_DT plus 1000 times
+        # the sid, the volume is ten times the close
+        days = np.arange(
+            (start_dt - START_DT).days, (end_dt - START_DT).days + 1
+        )
+        close = days[:, None] + 1000.0 * np.array(sids)[None, :]
+        return [close * 10 if field == 'volume' else close
+                for field in fields]
+
+
+class FakeBundle(object):
+    def __init__(self):
+        self.reader = FakeReader()
+
+    def get_reader(self, data_frequency):
+        return self.reader
+
+
+class TestExchangePricingLoader(object):
+    def setUp(self):
+        self.loader = ExchangePricingLoader('daily', block_size=4)
+        self.loader._bundles = dict(
+            binance=FakeBundle(),
+            bitfinex=FakeBundle(),
+        )
+        self.assets = [
+            TradingPair(symbol='eth_btc', exchange='binance', sid=1),
+            TradingPair(symbol='eth_btc', exchange='bitfinex', sid=2),
+            TradingPair(symbol='neo_btc', exchange='binance', sid=3),
+        ]
+
+    def _load(self, start, end):
+        dates = pd.date_range(start, end, freq='D', tz='UTC')
+        mask = np.ones((len(dates), len(self.assets)), dtype=bool)
+        columns = [TradingPairPricing.close, TradingPairPricing.volume]
+        out = self.loader.load_adjusted_array(
+            columns, dates, self.assets, mask
+        )
+
+        # The values known on each date are the ones of the previous day
+        days = np.array([(dt - START_DT).days - 1 for dt in dates])
+        sids = np.array([asset.sid for asset in self.assets])
+        expected = days[:, None] + 1000.0 * sids[None, :]
+
+        np.testing.assert_array_equal(
+            out[TradingPairPricing.close].data, expected
+        )
+        np.testing.assert_array_equal(
+            out[TradingPairPricing.volume].data, expected * 10
+        )
+
+    def _reads(self, exchange_name):
+        return [
+            (start.day, end.day, sids) for start, end, sids in
+            self.loader._bundles[exchange_name].reader.reads
+        ]
+
+    def test_overlapping_chunks(self):
+        self._load('2018-01-05', '2018-01-10')
+        self._load('2018-01-08', '2018-01-14')
+
+        # Each exchange reads its own sids in blocks of 4 days aligned on
+        # the epoch, the overlapping blocks being read once
+        assert_equals(
+            self._reads('binance'),
+            [(2, 4, [1, 3]), (5, 8, [1, 3]), (9, 12, [1, 3]),
+             (13, 16, [1, 3])],
+        )
+        assert_equals(
+            self._reads('bitfinex'),
+            [(2, 4, [2]), (5, 8, [2]), (9, 12, [2]), (13, 16, [2])],
+        )
@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
+
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.exchange_errors import InvalidRateLimitBackend
+from catalyst.exchange.exchange_rate_limiter import ExchangeRateLimiter, \
+    TokenBucket
+
+
+class TestExchangeRateLimiter(object):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.environ = dict(CATALYST_ROOT=self.root_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert_equals(bucket.reserve(), 0)
+        assert_equals(bucket.reserve(), 0)
+
+        # The bucket is empty, each request waits for one token
+        wait = bucket.reserve()
+        assert 0.05 < wait <= 0.1
+        wait = bucket.reserve()
+        assert 0.15 < wait <= 0.2
+
+    def test_acquire_weights(self):
+        limiter = ExchangeRateLimiter(
+            'binance', requests_per_minute=600, burst=5,
+            environ=self.environ
+        )
+
+        start = time.time()
+        for _ in range(3):
+            limiter.acquire(weight=2)
+        elapsed = time.time() - start
+
+        # The third request waits for one token at 10 tokens per second
+        assert 0.05 < elapsed < 0.5, elapsed
+
+        metrics = limiter.metrics['public']
+        assert_equals(metrics['requests'], 3)
+        assert_equals(metrics['weight'], 6)
+        assert_equals(metrics['waits'], 1)
+        assert metrics['wait_time'] > 0.05
+
+    def test_endpoint_limits(self):
+        limiter = ExchangeRateLimiter(
+            'binance', requests_per_minute=6000,
+            endpoint_limits=dict(private=600), burst=1,
+            environ=self.environ
+        )
+
+        for _ in range(3):
+            limiter.acquire('private')
+            limiter.acquire('public')
+
+        assert_equals(limiter.metrics['private']['waits'], 2)
+        assert limiter.metrics['private']['wait_time'] > 0.15
+
+    def test_concurrent_acquire(self):
+        limiter = ExchangeRateLimiter(
+            'binance', requests_per_minute=1200, burst=1,
+            environ=self.environ
+        )
+
+        pool = ThreadPool(processes=4)
+        start = time.time()
+        try:
+            pool.map(lambda _: limiter.acquire(), range(8))
+        finally:
+            pool.terminate()
+            pool.join()
+
+        # 7 requests after the burst at 20 requests per second
+        assert time.time() - start > 0.3
+        assert_equals(limiter.metrics['public']['requests'], 8)
+
+    def test_file_backend(self):
+        limiters = [
+            ExchangeRateLimiter(
+                'binance', requests_per_minute=600, burst=2,
+                backend='file', environ=self.environ
+            ) for _ in range(2)
+        ]
+
+        # Both limiters share the budget stored in the exchange folder
+        assert_equals(limiters[0].acquire(), 0)
+        assert_equals(limiters[1].acquire(), 0)
+        assert limiters[0].acquire() > 0.05
+
+    def test_invalid_backend(self):
+        with assert_raises(InvalidRateLimitBackend):
+            ExchangeRateLimiter('binance', 60, backend='redis')
@@ -0,0 +1,82 @@
+import pandas as pd
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.simple_clock import BarScheduler
+
+
+class FakeScheduler(BarScheduler):
+    def __init__(self, current_time, **kwargs):
+        super(FakeScheduler, self).__init__(**kwargs)
+        self.current_time = pd.Timestamp(current_time, tz='UTC')
+        self.sleep = self.advance
+
+    def now(self):
+        return self.current_time + self.time_skew
+
+    def advance(self, seconds):
+        self.current_time += pd.Timedelta(seconds=seconds)
+
+
+class TestBarScheduler(object):
+    def test_boundaries(self):
+        scheduler = FakeScheduler(
+            '2018-01-01 00:00:42', time_skew=pd.Timedelta('2s')
+        )
+        bars = iter(scheduler)
+
+        assert_equals(next(bars), pd.Timestamp('2018-01-01 00:00', tz='UTC'))
+
+        # Waking up on the boundary of the exchange clock
+        assert_equals(next(bars), pd.Timestamp('2018-01-01 00:01', tz='UTC'))
+        assert_equals(
+            scheduler.current_time,
+            pd.Timestamp('2018-01-01 00:00:58', tz='UTC')
+        )
+        assert_equals(scheduler.metrics[-1]['jitter'], 0)
+
+    def _run_overrun(self, missed_bars):
+        scheduler = FakeScheduler(
+            '2018-01-01 00:00:00', missed_bars=missed_bars
+        )
+        bars = iter(scheduler)
+        next(bars)
+
+        # handle_data runs for two minutes and a half
+        scheduler.advance(150)
+        emitted = [next(bars)]
+        while scheduler.current_time.floor('1min') > emitted[-1]:
+            emitted.append(next(bars))
+
+        assert_equals(scheduler.missed_count, 1)
+        assert_equals(scheduler.overrun_count, 1)
+        return emitted
+
+    def test_missed_bars(self):
+        assert_equals(
+            self._run_overrun('skip'),
+            [pd.Timestamp('2018-01-01 00:02', tz='UTC')],
+        )
+        assert_equals(
+            self._run_overrun('catch_up'),
+            [pd.Timestamp('2018-01-01 00:01', tz='UTC'),
+             pd.Timestamp('2018-01-01 00:02', tz='UTC')],
+        )
+        assert_raises(ValueError, BarScheduler, missed_bars='wait')
+
+    def test_prefetch(self):
+        prefetched = []
+
+        def prefetch(dt):
+            prefetched.append((scheduler.current_time, dt))
+
+        scheduler = FakeScheduler(
+            '2018-01-01 00:00:10', prefetch=prefetch, prefetch_seconds=5,
+        )
+        bars = iter(scheduler)
+        next(bars)
+        next(bars)
+
+        assert_equals(prefetched, [(
+            pd.Timestamp('2018-01-01 00:00:55', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:01', tz='UTC'),
+        )])
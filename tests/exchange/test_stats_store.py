@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from nose.tools import assert_equals
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_stats_store import AlgoStatsStore, \
+    get_algo_stats
+from catalyst.exchange.utils.exchange_utils import save_algo_df, \
+    get_algo_df
+
+
+class TestAlgoStatsStore(object):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.environ = dict(CATALYST_ROOT=self.root_dir)
+        self.start_dt = pd.Timestamp('2018-01-01 00:00', tz='UTC')
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir)
+
+    def test_append_and_compact(self):
+        store = AlgoStatsStore(
+            'algo', 'pnl_stats', self.environ, compact_rows=10
+        )
+        for minute in range(25):
+            store.append(
+                self.start_dt + pd.Timedelta(minutes=minute),
+                dict(performance=float(minute)),
+            )
+
+        # Compacted after 10 and 20 rows, the last 5 rows are logged
+        assert_equals(store._csv_rows, 20)
+        assert_equals(store._log_rows, 5)
+        assert os.path.isfile(store.log_path)
+
+        df = get_algo_stats('algo', 'pnl_stats', self.environ)
+        assert_equals(len(df), 25)
+        assert_equals(df.index[-1], self.start_dt + pd.Timedelta(minutes=24))
+        assert_equals(df['performance'].iloc[-1], 24.0)
+
+        # The compacted rows are readable by the legacy reader
+        legacy_df = get_algo_df('algo', 'pnl_stats', self.environ)
+        assert_equals(len(legacy_df), 20)
+
+    def test_legacy_csv(self):
+        index = pd.date_range(self.start_dt, periods=3, freq='T')
+        save_algo_df(
+            'algo', 'exposure_stats',
+            pd.DataFrame(
+                data=dict(long_exposure=[1.0, 2.0, 3.0],
+                          base_currency=[10.0, 9.0, 8.0]),
+                index=index,
+            ),
+            self.environ,
+        )
+
+        store = AlgoStatsStore('algo', 'exposure_stats', self.environ)
+        store.append(
+            index[-1] + pd.Timedelta(minutes=1),
+            dict(long_exposure=4.0, base_currency=7.0),
+        )
+        assert_equals(store._frame, None)
+
+        df = store.frame
+        assert_equals(len(df), 4)
+        assert_equals(list(df['long_exposure']), [1.0, 2.0, 3.0, 4.0])
+
+    def test_changing_columns(self):
+        store = AlgoStatsStore('algo', 'custom_signals_stats', self.environ)
+        store.append(self.start_dt, dict(rsi=30.0))
+        assert_equals(list(store.frame.columns), ['rsi'])
+
+        store.append(
+            self.start_dt + pd.Timedelta(minutes=1), dict(rsi=40.0, sma=2.0)
+        )
+        df = store.frame
+        assert_equals(sorted(df.columns), ['rsi', 'sma'])
+        assert pd.isnull(df['sma'].iloc[0])
+        assert_equals(df['sma'].iloc[1], 2.0)
+
+    def test_record_series(self):
+        asset = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+
+        store = AlgoStatsStore('algo', 'custom_signals_stats', self.environ)
+        store.append(self.start_dt, dict(
+            prices=pd.Series([1.0, 2.0], index=[asset, 'neo_btc']),
+            weights={asset: np.float64(0.5)},
+            history=np.array([1.0, 2.0]),
+        ))
+
+        df = get_algo_stats('algo', 'custom_signals_stats', self.environ)
+        assert_equals(len(df), 1)
+        assert_equals(df['prices'].iloc[0], {str(asset): 1.0, 'neo_btc': 2.0})
+        assert_equals(df['weights'].iloc[0], {str(asset): 0.5})
+        assert_equals(df['history'].iloc[0], [1.0, 2.0])
@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+
+import pandas as pd
+from nose.tools import assert_equals
+from pandas.util.testing import assert_frame_equal
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.utils.stats_utils import StatsFormatter, \
+    get_csv_stats, prepare_stats
+
+
+class TestStatsFormatter(object):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, 'stats.csv')
+        self.asset = TradingPair(symbol='eth_btc', exchange='binance', sid=1)
+        self.start_dt = pd.Timestamp('2018-01-01', tz='UTC')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _stats(self, minute, position=False):
+        positions = [dict(
+            sid=self.asset, amount=1, cost_basis=0.1, last_sale_price=0.2,
+        )] if position else []
+
+        return dict(
+            period_close=self.start_dt + pd.Timedelta(minutes=minute),
+            starting_cash=1.0,
+            ending_cash=1.0,
+            portfolio_value=1.0 + minute,
+            pnl=0.0,
+            long_exposure=0.0,
+            short_exposure=0.0,
+            orders=[],
+            transactions=[],
+            positions=positions,
+            signal=minute,
+        )
+
+    def _assert_csv(self, stats):
+        expected = get_csv_stats(stats, recorded_cols=['signal'])
+        assert_frame_equal(
+            pd.read_csv(self.filename), pd.read_csv(BytesIO(expected))
+        )
+
+    def test_append_csv(self):
+        stats = []
+        formatter = StatsFormatter(recorded_cols=['signal'], num_rows=2)
+        for minute in range(3):
+            stats.append(self._stats(minute))
+            formatter.update(stats)
+            formatter.write_csv(self.filename)
+
+        self._assert_csv(stats)
+
+        df, columns = formatter.to_frame()
+        assert_equals(len(df), 2)
+        assert_equals(list(df['signal']), [1, 2])
+
+        # The first position changes the layout, the file is rewritten
+        stats.append(self._stats(3, position=True))
+        formatter.update(stats)
+        formatter.write_csv(self.filename)
+
+        stats.append(self._stats(4, position=True))
+        formatter.update(stats)
+        formatter.write_csv(self.filename)
+
+        self._assert_csv(stats)
+
+    def test_prepare_stats(self):
+        stats = [self._stats(0), self._stats(1, position=True)]
+        df, columns = prepare_stats(stats, recorded_cols=['signal'])
+
+        assert_equals(
+            columns, ['symbol', 'amount', 'cost_basis', 'last_sale_price']
+        )
+        assert_equals(df['symbol'].iloc[-1], 'eth_btc')
+        assert_equals(df['amount'].iloc[-1], 1)
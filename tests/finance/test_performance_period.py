@@ -0,0 +1,100 @@
+import time
+from unittest import TestCase
+
+import pandas as pd
+
+from catalyst.assets import Equity
+from catalyst.finance.order import Order
+from catalyst.finance.performance.period import PerformancePeriod
+from catalyst.finance.transaction import Transaction
+
+
+class PerformancePeriodIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.asset = Equity(1, exchange='test')
+        self.start_dt = pd.Timestamp('2018-01-01', tz='UTC')
+        self.period = PerformancePeriod(
+            starting_cash=1000.0,
+            data_frequency='minute',
+            keep_transactions=True,
+            keep_orders=True,
+        )
+
+    def _process(self, minutes, events_per_minute):
+        for minute in range(minutes):
+            dt = self.start_dt + pd.Timedelta(minutes=minute)
+            for _ in range(events_per_minute):
+                order = Order(dt, self.asset, 1)
+                self.period.record_order(order)
+                self.period.handle_execution(
+                    Transaction(self.asset, 1, dt, 10.0, order.id)
+                )
+
+    def _scan(self, start_dt, end_dt):
+        transactions = [
+            txn
+            for dt in self.period.processed_transactions
+            if start_dt <= dt < end_dt
+            for txn in self.period.processed_transactions[dt]
+        ]
+        orders = [
+            order
+            for dt in self.period.orders_by_modified
+            if start_dt <= dt < end_dt
+            for order in self.period.orders_by_modified[dt].values()
+        ]
+        return transactions, orders
+
+    def test_range_queries(self):
+        self._process(minutes=10, events_per_minute=2)
+
+        # An order modified out of order
+        late_dt = self.start_dt + pd.Timedelta(minutes=3, seconds=30)
+        self.period.record_order(Order(late_dt, self.asset, 1))
+
+        for start, end in [(0, 10), (3, 4), (3, 5), (9, 20), (20, 30)]:
+            start_dt = self.start_dt + pd.Timedelta(minutes=start)
+            end_dt = self.start_dt + pd.Timedelta(minutes=end)
+
+            transactions, orders = self._scan(start_dt, end_dt)
+            self.assertEqual(
+                self.period.transactions_between(start_dt, end_dt),
+                transactions,
+            )
+            self.assertEqual(
+                sorted(o.id for o in
+                       self.period.orders_between(start_dt, end_dt)),
+                sorted(o.id for o in orders),
+            )
+
+        self.period.rollover()
+        self.assertEqual(
+            self.period.transactions_between(
+                self.start_dt, self.start_dt + pd.Timedelta(days=1)
+            ),
+            [],
+        )
+
+    def test_high_frequency_benchmark(self):
+        minutes = 1440
+        self._process(minutes=minutes, events_per_minute=20)
+
+        timer = time.time()
+        for minute in range(minutes):
+            start_dt = self.start_dt + pd.Timedelta(minutes=minute)
+            end_dt = start_dt + pd.Timedelta(minutes=1)
+            self.assertEqual(
+                len(self.period.transactions_between(start_dt, end_dt)), 20
+            )
+            self.period.orders_between(start_dt, end_dt)
+        indexed = time.time() - timer
+
+        timer = time.time()
+        for minute in range(0, minutes, 60):
+            start_dt = self.start_dt + pd.Timedelta(minutes=minute)
+            self._scan(start_dt, start_dt + pd.Timedelta(minutes=1))
+        scanned = (time.time() - timer) * 60
+
+        print('per bar lookups over {} events: {:.4f}s indexed, '
+              '{:.4f}s scanned'.format(minutes * 20, indexed, scanned))
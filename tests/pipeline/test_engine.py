@@ -4,7 +4,9 @@ Tests for SimplePipelineEngine
 from __future__ import division
 from collections import OrderedDict
 from itertools import product
+from multiprocessing import cpu_count
 from operator import add, sub
+import time
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -17,10 +19,12 @@ from numpy import (
     full_like,
     log,
     nan,
+    ones,
     tile,
     where,
     zeros,
 )
+from numpy.random import RandomState
 from numpy.testing import assert_almost_equal
 from pandas import (
     Categorical,
@@ -63,6 +67,7 @@ from catalyst.pipeline.loaders.synthetic import (
     make_bar_data,
     expected_bar_values_2d,
 )
+from catalyst.pipeline.result_cache import PipelineResultCache
 from catalyst.pipeline.sentinels import NotSpecified
 from catalyst.pipeline.term import InputDates
 from catalyst.testing import (
@@ -79,6 +84,7 @@ from catalyst.testing import (
 from catalyst.testing.fixtures import (
     WithAdjustmentReader,
     WithEquityPricingPipelineEngine,
+    WithInstanceTmpDir,
     WithSeededRandomPipelineEngine,
     WithTradingEnvironment,
     ZiplineTestCase,
@@ -163,6 +169,42 @@ class RecordingPrecomputedLoader(PrecomputedLoader):
         )
 
 
+RESULT_CACHE_SCALE = [1.0]
+
+
+def scaled_difference(open, close):
+    return (open - close).sum(axis=0) * RESULT_CACHE_SCALE[0]
+
+
+class ScaledSumDifference(CustomFactor):
+    window_length = 3
+    inputs = [USEquityPricing.open, USEquityPricing.close]
+
+    def compute(self, today, assets, out, open, close):
+        out[:] = scaled_difference(open, close)
+
+
+def make_closure_factor(scale, offset=0.0):
+    def shifted(values, offset=offset):
+        return values + offset
+
+    class ClosureFactor(CustomFactor):
+        window_length = 3
+        inputs = [USEquityPricing.close]
+
+        def compute(self, today, assets, out, close):
+            out[:] = shifted(close).sum(axis=0) * scale
+
+    return ClosureFactor()
+
+
+class VersionedLoader(RecordingPrecomputedLoader):
+    version = 'v1'
+
+    def data_version(self, assets):
+        return self.version
+
+
 class RollingSumSum(CustomFactor):
     def compute(self, today, assets, out, *inputs):
         assert len(self.inputs) == len(inputs)
@@ -378,6 +420,30 @@ class ConstantInputTestCase(WithConstantInputs, ZiplineTestCase):
             full(shape, -2 * high_factor.window_length, dtype=float),
         )
 
+    def test_max_workers(self):
+        loader = self.loader
+        dates = self.dates[10:15]
+
+        pipeline = Pipeline(
+            columns={
+                'short': RollingSumDifference(window_length=3),
+                'long': RollingSumDifference(window_length=5),
+                'sum': RollingSumSum(
+                    inputs=[USEquityPricing.open, USEquityPricing.high],
+                    window_length=4,
+                ),
+            }
+        )
+
+        results = [
+            SimplePipelineEngine(
+                lambda column: loader, self.dates, self.asset_finder,
+                max_workers=max_workers,
+            ).run_pipeline(pipeline, dates[0], dates[-1])
+            for max_workers in (1, 4)
+        ]
+        assert_frame_equal(results[0], results[1])
+
     def test_numeric_factor(self):
         constants = self.constants
         loader = self.loader
@@ -1296,6 +1362,104 @@ class ParameterizedFactorTestCase(WithTradingEnvironment, ZiplineTestCase):
         assert_frame_equal(results['dv5_nan'].unstack(), expected_5_nan)
 
 
+class ThreadPoolBenchmarkTestCase(WithTradingEnvironment, ZiplineTestCase):
+    """
+    Times the thread pool of the engine against the serial computation.
+
+    The terms only run in parallel while their computation releases the GIL,
+    which the numpy-vectorized factors below mostly do. Factors computed in
+    pure Python hold the GIL and won't scale with ``max_workers``.
+    """
+    sids = ASSET_FINDER_EQUITY_SIDS = Int64Index(range(1, 501))
+    START_DATE = Timestamp('2015-01-02', tz='UTC')
+    END_DATE = Timestamp('2015-12-31', tz='UTC')
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ThreadPoolBenchmarkTestCase, cls).init_class_fixtures()
+        cls.dates = dates = cls.trading_calendar.sessions_in_range(
+            cls.START_DATE,
+            cls.END_DATE,
+        )
+        assets = cls.asset_finder.retrieve_all(cls.sids)
+
+        rand = RandomState(0)
+        shape = (len(dates), len(assets))
+        cls.close = DataFrame(
+            100 * rand.lognormal(0, 0.02, shape).cumprod(axis=0),
+            index=dates,
+            columns=assets,
+        )
+        cls.volume = DataFrame(
+            rand.uniform(1000, 10000, shape),
+            index=dates,
+            columns=assets,
+        )
+
+    def test_max_workers_benchmark(self):
+        loaders = {
+            USEquityPricing.close: DataFrameLoader(
+                USEquityPricing.close,
+                self.close,
+            ),
+            USEquityPricing.volume: DataFrameLoader(
+                USEquityPricing.volume,
+                self.volume,
+            ),
+        }
+        columns = {}
+        for window_length in (5, 10, 20, 40, 60):
+            columns.update({
+                'sma_%d' % window_length: SimpleMovingAverage(
+                    inputs=[USEquityPricing.close],
+                    window_length=window_length,
+                ),
+                'ewma_%d' % window_length: EWMA(
+                    inputs=[USEquityPricing.close],
+                    window_length=window_length,
+                    decay_rate=0.9,
+                ),
+                'ewmstd_%d' % window_length: EWMSTD(
+                    inputs=[USEquityPricing.close],
+                    window_length=window_length,
+                    decay_rate=0.9,
+                ),
+                'adv_%d' % window_length: AverageDollarVolume(
+                    window_length=window_length,
+                ),
+                'returns_%d' % window_length: Returns(
+                    window_length=window_length,
+                ),
+                'drawdown_%d' % window_length: MaxDrawdown(
+                    inputs=[USEquityPricing.close],
+                    window_length=window_length,
+                ),
+            })
+        pipeline = Pipeline(columns=columns)
+        dates = self.dates[60:]
+
+        results = {}
+        for max_workers in (1, max(cpu_count(), 2)):
+            engine = SimplePipelineEngine(
+                loaders.__getitem__,
+                self.dates,
+                self.asset_finder,
+                max_workers=max_workers,
+            )
+
+            timer = time.time()
+            results[max_workers] = engine.run_pipeline(
+                pipeline, dates[0], dates[-1],
+            )
+            print('{} factors over {} assets with {} workers: {:.4f}s'.format(
+                len(columns), len(self.sids), max_workers, time.time() - timer
+            ))
+
+        serial = results.pop(1)
+        for result in itervalues(results):
+            assert_frame_equal(result, serial)
+
+
 class StringColumnTestCase(WithSeededRandomPipelineEngine,
                            ZiplineTestCase):
 
@@ -1378,6 +1542,96 @@ class WindowSafetyPropagationTestCase(WithSeededRandomPipelineEngine,
             assert_equal(expected_result, results[colname])
 
 
+class ResultCacheTestCase(WithConstantInputs,
+                          WithInstanceTmpDir,
+                          ZiplineTestCase):
+
+    def test_result_cache(self):
+        loader = VersionedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+            result_cache=PipelineResultCache(self.tmpdir.path),
+        )
+        dates = self.dates[10:15]
+        short_factor = RollingSumDifference(window_length=3)
+        long_factor = RollingSumDifference(window_length=5)
+
+        pipeline = Pipeline(
+            columns={'short': short_factor, 'long': long_factor},
+        )
+        expected = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        self.assertEqual(len(loader.load_calls), 1)
+
+        # The cached columns are neither loaded nor computed again
+        result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        self.assertEqual(len(loader.load_calls), 1)
+        assert_frame_equal(result, expected)
+
+        result = engine.run_pipeline(
+            Pipeline(columns={'short': short_factor}), dates[0], dates[-1],
+        )
+        self.assertEqual(len(loader.load_calls), 1)
+        assert_frame_equal(result, expected[['short']])
+
+        # Another date range or data version is computed
+        engine.run_pipeline(pipeline, dates[1], dates[-1])
+        self.assertEqual(len(loader.load_calls), 2)
+
+        loader.version = 'v2'
+        engine.run_pipeline(pipeline, dates[0], dates[-1])
+        self.assertEqual(len(loader.load_calls), 3)
+
+    def test_result_cache_key(self):
+        dates = self.dates[10:15]
+        assets = Int64Index(self.asset_ids)
+        mask = ones((len(dates), len(assets)), dtype=bool)
+
+        def key(term):
+            # Each cache keeps the digests of the terms it has seen
+            cache = PipelineResultCache(self.tmpdir.path)
+            return cache.key(term, dates, assets, mask, ['v1'])
+
+        factor = ScaledSumDifference()
+        expected = key(factor)
+        self.assertIsNotNone(expected)
+        self.assertEqual(key(factor), expected)
+
+        # The helpers called by compute are hashed with their code and
+        # the globals they reference
+        RESULT_CACHE_SCALE[0] = 2.0
+        try:
+            self.assertNotEqual(key(factor), expected)
+        finally:
+            RESULT_CACHE_SCALE[0] = 1.0
+
+        code = scaled_difference.__code__
+        scaled_difference.__code__ = \
+            (lambda open, close: (open + close).sum(axis=0)).__code__
+        try:
+            self.assertNotEqual(key(factor), expected)
+        finally:
+            scaled_difference.__code__ = code
+
+        self.assertEqual(key(factor), expected)
+
+        # The closures and default arguments are hashed too
+        closure_key = key(make_closure_factor(1.0))
+        self.assertIsNotNone(closure_key)
+        self.assertEqual(key(make_closure_factor(1.0)), closure_key)
+        self.assertNotEqual(key(make_closure_factor(2.0)), closure_key)
+        self.assertNotEqual(
+            key(make_closure_factor(1.0, offset=1.0)), closure_key,
+        )
+
+        # The terms referencing values without a stable representation
+        # are not cached
+        self.assertIsNone(key(make_closure_factor(object())))
+
+
 class PopulateInitialWorkspaceTestCase(WithConstantInputs, ZiplineTestCase):
 
     @parameter_space(window_length=[3, 5], pipeline_length=[5, 10])
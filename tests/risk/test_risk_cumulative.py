@@ -144,3 +144,73 @@ class TestRisk(WithTradingEnvironment, ZiplineTestCase):
     def test_representation(self):
         assert all([metric in self.cumulative_metrics.__repr__() for metric in
                    self.cumulative_metrics.METRIC_NAMES])
+
+    def test_streaming_matches_batch(self):
+        metrics = dict(
+            (mode, risk.RiskMetricsCumulative(
+                self.sim_params,
+                treasury_curves=self.env.treasury_curves,
+                trading_calendar=self.trading_calendar,
+                create_first_day_stats=True,
+                mode=mode,
+            ))
+            for mode in ('streaming', 'batch')
+        )
+
+        random = np.random.RandomState(0)
+        for dt in self.algo_returns.index:
+            # Minute emission updates the latest session several times
+            for _ in range(3):
+                algo_returns = random.normal(0.001, 0.02)
+                benchmark_returns = random.normal(0.0005, 0.01)
+                for cumulative_metrics in metrics.values():
+                    cumulative_metrics.update(
+                        dt, algo_returns, benchmark_returns, 1.0
+                    )
+
+        streaming, batch = metrics['streaming'], metrics['batch']
+        for name in ('algorithm_cumulative_returns', 'algorithm_volatility',
+                     'benchmark_volatility', 'alpha', 'beta', 'sharpe',
+                     'downside_risk', 'sortino', 'information',
+                     'max_drawdowns'):
+            np.testing.assert_allclose(
+                getattr(streaming, name),
+                getattr(batch, name),
+                rtol=1e-8,
+                err_msg=name,
+            )
+
+    def test_streaming_matches_batch_total_loss(self):
+        # A total loss on the first bar leaves a zero peak, a total loss
+        # later on a drawdown of -1
+        for first_day_stats, loss_loc in ((False, 0), (True, 5)):
+            metrics = dict(
+                (mode, risk.RiskMetricsCumulative(
+                    self.sim_params,
+                    treasury_curves=self.env.treasury_curves,
+                    trading_calendar=self.trading_calendar,
+                    create_first_day_stats=first_day_stats,
+                    mode=mode,
+                ))
+                for mode in ('streaming', 'batch', 'verify')
+            )
+
+            random = np.random.RandomState(0)
+            for loc, dt in enumerate(self.algo_returns.index[:10]):
+                algo_returns = -1.0 if loc == loss_loc \
+                    else random.normal(0.001, 0.02)
+                for cumulative_metrics in metrics.values():
+                    cumulative_metrics.update(
+                        dt, algo_returns, BENCHMARK_BASE, 1.0
+                    )
+
+            np.testing.assert_allclose(
+                metrics['streaming'].max_drawdowns,
+                metrics['batch'].max_drawdowns,
+                rtol=1e-8,
+            )
+            np.testing.assert_allclose(
+                metrics['verify'].max_drawdowns,
+                metrics['batch'].max_drawdowns,
+                rtol=1e-8,
+            )